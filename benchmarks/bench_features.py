@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark prepare_prophet_frame against the original pandas implementation.
+
+The reference implementation below is the pre-vectorization version
+(copy/shift/drop holiday features plus ``pd.get_dummies`` and ``pd.concat``).
+The script checks that both produce identical frames (using a weekends-only
+holiday calendar, which is what the reference implemented) and reports the
+best-of-N wall time of each over a range of series lengths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    from data.daily_loader import prepare_prophet_frame
+    from data.holidays import HolidayCalendar
+except ImportError:
+    REPO_ROOT = Path(__file__).resolve().parents[1]
+    SRC_PATH = REPO_ROOT / "src"
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
+
+    from data.daily_loader import prepare_prophet_frame
+    from data.holidays import HolidayCalendar
+
+
+def reference_prepare_prophet_frame(df: pd.DataFrame, regressor_type: str = "both") -> pd.DataFrame:
+    """Original pandas implementation, kept for equivalence and timing."""
+
+    prophet_df = pd.DataFrame()
+    prophet_df["ds"] = df["date"]
+    prophet_df["y"] = df["target"]
+
+    if regressor_type in ("holiday", "both"):
+        temp_df = df[["date"]].copy()
+        temp_df["day_of_week"] = temp_df["date"].dt.dayofweek
+        temp_df["is_holiday"] = (temp_df["day_of_week"] >= 5).astype(int)
+        temp_df["pre_holiday"] = temp_df["is_holiday"].shift(-1, fill_value=0).astype(int)
+        temp_df["post_holiday"] = temp_df["is_holiday"].shift(1, fill_value=0).astype(int)
+        temp_df = temp_df.drop(columns=["day_of_week"])
+        prophet_df["is_holiday"] = temp_df["is_holiday"]
+        prophet_df["pre_holiday"] = temp_df["pre_holiday"]
+        prophet_df["post_holiday"] = temp_df["post_holiday"]
+
+    if regressor_type in ("dow", "both"):
+        dow = pd.get_dummies(df["date"].dt.dayofweek, prefix="dow", drop_first=False)
+        if "dow_6" in dow.columns:
+            dow = dow.drop(columns=["dow_6"])
+        dow = dow.reindex(sorted(dow.columns), axis=1)
+        prophet_df = pd.concat([prophet_df, dow], axis=1)
+
+    return prophet_df
+
+
+def synthetic_daily(n_days: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2000-01-01", periods=n_days, freq="D")
+    return pd.DataFrame({"date": dates, "target": rng.poisson(300, n_days)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[156, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    weekends = HolidayCalendar.weekends_only()
+
+    print(f"{'rows':>8} {'reference_ms':>14} {'vectorized_ms':>14} {'speedup':>8}")
+    for n_days in args.sizes:
+        df = synthetic_daily(n_days)
+        for regressor_type in ("holiday", "dow", "both"):
+            pd.testing.assert_frame_equal(
+                prepare_prophet_frame(df, regressor_type=regressor_type, calendar=weekends),
+                reference_prepare_prophet_frame(df, regressor_type=regressor_type),
+            )
+
+        number = max(1, 20_000 // n_days)
+        # Bind this iteration's frame as a default argument (B023)
+        reference = min(
+            timeit.repeat(lambda df=df: reference_prepare_prophet_frame(df), number=number, repeat=args.repeat)
+        ) / number
+        vectorized = min(
+            timeit.repeat(
+                lambda df=df: prepare_prophet_frame(df, regressor_type="both", calendar=weekends),
+                number=number,
+                repeat=args.repeat,
+            )
+        ) / number
+        print(f"{n_days:>8} {reference * 1e3:>14.3f} {vectorized * 1e3:>14.3f} {reference / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Reproducible benchmark suite for the Prophet pipeline hot paths.
+
+Each (case, dataset) pair runs in a fresh spawned process. That way peak RSS
+reflects only that case, and module import and data set-up are not timed.
+Datasets are the bundled SQLite database and synthetic daily series of
+1k/10k/100k days (seeded Poisson counts with weekly and yearly shape).
+Every case reports best and median wall time over ``--repeat`` runs, peak
+RSS, and (for cases that fit models) fits per second. Results are written as
+JSON tagged with the git commit so runs can be diffed with ``--compare``.
+
+Examples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --datasets synthetic_1000 --cases fit predict
+    python benchmarks/run_benchmarks.py --compare artifacts/benchmarks/bench_<old>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    from champion_prophet.config import load_settings
+    from data.daily_loader import load_daily_data, prepare_prophet_frame
+    from evaluation.cross_validation import generate_expanding_window_splits, grid_search_prophet
+    from evaluation.metrics import calculate_baseline_metrics, calculate_metrics
+    from models.prophet_daily import ProphetDailyModel
+except ImportError:
+    REPO_ROOT = Path(__file__).resolve().parents[1]
+    SRC_PATH = REPO_ROOT / "src"
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
+
+    from champion_prophet.config import load_settings
+    from data.daily_loader import load_daily_data, prepare_prophet_frame
+    from evaluation.cross_validation import generate_expanding_window_splits, grid_search_prophet
+    from evaluation.metrics import calculate_baseline_metrics, calculate_metrics
+    from models.prophet_daily import ProphetDailyModel
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+HORIZON = 14
+DEFAULT_DATASETS = ["db", "synthetic_1000", "synthetic_10000", "synthetic_100000"]
+GRID = {
+    "changepoint_prior_scale": [0.01, 0.1],
+    "seasonality_prior_scale": [10.0],
+    "seasonality_mode": ["additive", "multiplicative"],
+}
+
+
+def synthetic_daily(n_days: int, seed: int = 0) -> pd.DataFrame:
+    """Seeded daily counts with a trend, weekday/weekend shape and yearly cycle."""
+
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2000-01-01", periods=n_days, freq="D")
+    t = np.arange(n_days)
+    weekly = np.where(dates.dayofweek >= 5, 0.4, 1.0)
+    yearly = 1 + 0.15 * np.sin(2 * np.pi * t / 365.25)
+    rate = (300 + 0.01 * t) * weekly * yearly
+    return pd.DataFrame({"date": dates, "target": rng.poisson(rate).astype(float)})
+
+
+def load_dataset(name: str) -> pd.DataFrame:
+    """Raw (date, target) frame for a dataset name."""
+
+    if name == "db":
+        return load_daily_data(load_settings().database_path)
+    if name.startswith("synthetic_"):
+        return synthetic_daily(int(name.removeprefix("synthetic_")))
+    raise ValueError(f"Unknown dataset: {name}")
+
+
+def _fitted_model(prophet_df: pd.DataFrame) -> tuple[ProphetDailyModel, pd.DataFrame]:
+    regressors = [col for col in prophet_df.columns if col not in ("ds", "y")]
+    train_df, test_df = prophet_df.iloc[:-HORIZON], prophet_df.iloc[-HORIZON:]
+    model = ProphetDailyModel()
+    model.add_regressors(regressors)
+    model.fit(train_df)
+    return model, test_df
+
+
+# Each case: set-up(raw_df) -> (callable to time, fits per call)
+Case = Callable[[pd.DataFrame], tuple[Callable[[], Any], int]]
+
+
+def case_prepare_prophet_frame(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    return (lambda: prepare_prophet_frame(raw, regressor_type="both")), 0
+
+
+def case_fit(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    prophet_df = prepare_prophet_frame(raw, regressor_type="both")
+    return (lambda: _fitted_model(prophet_df)), 1
+
+
+def case_predict(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    model, _ = _fitted_model(prepare_prophet_frame(raw, regressor_type="both"))
+    return (lambda: model.predict(periods=HORIZON, seed=0)), 0
+
+
+def case_forecast_holdout(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    model, test_df = _fitted_model(prepare_prophet_frame(raw, regressor_type="both"))
+    return (lambda: model.forecast_holdout(test_df, seed=0)), 0
+
+
+def case_calculate_metrics(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    y_true = raw["target"].to_numpy(dtype=float)
+    y_pred = y_true + np.random.default_rng(1).normal(0, 10, len(y_true))
+    dates = raw["date"]
+    return (lambda: calculate_metrics(y_true, y_pred, y_pred - 20, y_pred + 20, dates=dates)), 0
+
+
+def case_calculate_baseline_metrics(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    y_true = raw["target"].to_numpy(dtype=float)
+    start = max(len(y_true) - 4 * HORIZON, 7)
+    return (lambda: calculate_baseline_metrics(y_true, raw["date"], evaluation_start_index=start)), 0
+
+
+def case_grid_search(raw: pd.DataFrame) -> tuple[Callable[[], Any], int]:
+    prophet_df = prepare_prophet_frame(raw, regressor_type="both")
+    regressors = [col for col in prophet_df.columns if col not in ("ds", "y")]
+    cv_df = prophet_df.iloc[:-HORIZON]
+    splits = generate_expanding_window_splits(
+        cv_df, horizon=HORIZON, initial_train_size=len(cv_df) - 4 * HORIZON, max_folds=4
+    )
+    n_configs = int(np.prod([len(values) for values in GRID.values()]))
+    return (lambda: grid_search_prophet(cv_df, splits, GRID, regressors)), n_configs * len(splits)
+
+
+CASES: dict[str, Case] = {
+    "prepare_prophet_frame": case_prepare_prophet_frame,
+    "fit": case_fit,
+    "predict": case_predict,
+    "forecast_holdout": case_forecast_holdout,
+    "calculate_metrics": case_calculate_metrics,
+    "calculate_baseline_metrics": case_calculate_baseline_metrics,
+    "grid_search": case_grid_search,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(case: str, dataset: str, repeat: int) -> dict[str, Any]:
+    """Set up and time one case (runs inside a fresh worker process)."""
+
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    raw = load_dataset(dataset)
+    fn, fits = CASES[case](raw)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "case": case,
+        "dataset": dataset,
+        "rows": len(raw),
+        "repeat": repeat,
+        "best_seconds": best,
+        "median_seconds": statistics.median(timings),
+        "peak_rss_mb": _peak_rss_mb(),
+        "fits": fits,
+        "fits_per_second": fits / best if fits and best > 0 else None,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment() -> dict[str, Any]:
+    import prophet
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "prophet": prophet.__version__,
+    }
+
+
+def compare(current: dict[str, Any], baseline_path: Path) -> None:
+    """Print best-time ratios against an earlier results file."""
+
+    baseline = json.loads(baseline_path.read_text())
+    previous = {(row["case"], row["dataset"]): row for row in baseline["results"]}
+    print(f"\nvs {baseline_path.name} (commit {baseline.get('commit')}):")
+    print(f"{'case':<28} {'dataset':<18} {'before_s':>10} {'after_s':>10} {'ratio':>7}")
+    for row in current["results"]:
+        old = previous.get((row["case"], row["dataset"]))
+        if old is None:
+            continue
+        ratio = row["best_seconds"] / old["best_seconds"] if old["best_seconds"] else float("nan")
+        print(
+            f"{row['case']:<28} {row['dataset']:<18} {old['best_seconds']:>10.4f} "
+            f"{row['best_seconds']:>10.4f} {ratio:>6.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--datasets", nargs="+", default=DEFAULT_DATASETS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--grid-max-rows",
+        type=int,
+        default=10_000,
+        help="Skip grid_search on datasets longer than this",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON (default: artifacts/benchmarks/)")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    results: list[dict[str, Any]] = []
+    print(f"{'case':<28} {'dataset':<18} {'best_s':>10} {'median_s':>10} {'rss_mb':>8} {'fits/s':>8}")
+
+    context = get_context("spawn")
+    for dataset in args.datasets:
+        for case in args.cases:
+            n_days = int(dataset.removeprefix("synthetic_")) if dataset.startswith("synthetic_") else 0
+            if case == "grid_search" and n_days > args.grid_max_rows:
+                continue
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                row = pool.submit(run_case, case, dataset, args.repeat).result()
+            results.append(row)
+            fps = f"{row['fits_per_second']:.2f}" if row["fits_per_second"] else "-"
+            print(
+                f"{case:<28} {dataset:<18} {row['best_seconds']:>10.4f} "
+                f"{row['median_seconds']:>10.4f} {row['peak_rss_mb']:>8.1f} {fps:>8}"
+            )
+
+    payload = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "environment": _environment(),
+        "results": results,
+    }
+    output = args.output or (
+        REPO_ROOT / "artifacts" / "benchmarks" / f"bench_{commit or 'nogit'}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(payload, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -30,8 +30,12 @@ try:
         load_settings,
         set_global_seed,
     )
+    from champion_prophet.timing import reset_timings, timing_breakdown
     from data.daily_loader import load_daily_data, prepare_prophet_frame, split_train_test
+    from evaluation.baselines import DEFAULT_BASELINES
+    from evaluation.calibration import apply_calibration
     from evaluation.metrics import calculate_baseline_metrics, calculate_metrics, compare_to_baselines
+    from evaluation.online_calibration import OnlineCalibrator
     from evaluation.plots import (
         plot_components,
         plot_dow_performance,
@@ -39,6 +43,7 @@ try:
         plot_residuals,
     )
     from models.prophet_daily import ProphetDailyModel
+    from models.uncertainty import DEFAULT_QUANTILES, quantile_column
 except ImportError:
     REPO_ROOT = Path(__file__).resolve().parents[1]
     SRC_PATH = REPO_ROOT / "src"
@@ -52,8 +57,12 @@ except ImportError:
         load_settings,
         set_global_seed,
     )
+    from champion_prophet.timing import reset_timings, timing_breakdown
     from data.daily_loader import load_daily_data, prepare_prophet_frame, split_train_test
+    from evaluation.baselines import DEFAULT_BASELINES
+    from evaluation.calibration import apply_calibration
     from evaluation.metrics import calculate_baseline_metrics, calculate_metrics, compare_to_baselines
+    from evaluation.online_calibration import OnlineCalibrator
     from evaluation.plots import (
         plot_components,
         plot_dow_performance,
@@ -61,6 +70,7 @@ except ImportError:
         plot_residuals,
     )
     from models.prophet_daily import ProphetDailyModel
+    from models.uncertainty import DEFAULT_QUANTILES, quantile_column
 
 
 logger = logging.getLogger(__name__)
@@ -159,12 +169,23 @@ def parse_args() -> argparse.Namespace:
         help="Custom run ID (default: timestamp)",
     )
 
+    parser.add_argument(
+        "--online-calibrator",
+        type=Path,
+        default=None,
+        help=(
+            "Online calibrator state (e.g. artifacts/calibration/online_calibrator.json from Phase 2). "
+            "Calibrates the test forecast, then folds in the test actuals and saves the state back"
+        ),
+    )
+
     return parser.parse_args()
 
 
 def main() -> None:
     """Main execution function."""
     configure_logging()
+    reset_timings()
     logger.info("=" * 80)
     logger.info("Prophet Daily Baseline - Phase 1")
     logger.info("=" * 80)
@@ -183,7 +204,11 @@ def main() -> None:
 
     # --- Step 1: Load Data ---
     logger.info("\n[Step 1] Loading daily data...")
-    daily_df = load_daily_data(settings.database_path, target_column=args.target_column)
+    daily_df = load_daily_data(
+        settings.database_path,
+        target_column=args.target_column,
+        snapshot_dir=settings.cache_dir / "snapshots",
+    )
 
     logger.info("Data shape: %s", daily_df.shape)
     logger.info("Date range: %s to %s", daily_df["date"].min(), daily_df["date"].max())
@@ -235,11 +260,12 @@ def main() -> None:
     # --- Step 5: Generate Forecasts ---
     logger.info("\n[Step 5] Generating forecasts for test period...")
 
-    # Forecast on test set
-    test_forecast = model.forecast_holdout(test_df)
+    # Forecast on test set (interval plus the P10/P50/P90/P95 grid from one sample batch)
+    test_forecast = model.forecast_holdout(test_df, quantiles=DEFAULT_QUANTILES)
 
-    # Extract predictions and intervals
-    test_pred = test_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]]
+    # Extract predictions, intervals and quantiles
+    forecast_columns = ["ds", "yhat", "yhat_lower", "yhat_upper", *map(quantile_column, DEFAULT_QUANTILES)]
+    test_pred = test_forecast[forecast_columns]
     test_pred = test_pred.merge(test_df[["ds", "y"]], on="ds", how="left")
 
     logger.info("Generated %d test forecasts", len(test_pred))
@@ -254,6 +280,8 @@ def main() -> None:
         y_lower=test_pred["yhat_lower"],
         y_upper=test_pred["yhat_upper"],
         dates=test_pred["ds"],
+        interval_width=model.config["interval_width"],
+        y_quantiles={level: test_pred[quantile_column(level)] for level in DEFAULT_QUANTILES},
     )
 
     # Baseline metrics (use full dataset for baselines)
@@ -261,11 +289,36 @@ def main() -> None:
         y_true=prophet_df["y"],
         dates=prophet_df["ds"],
         evaluation_start_index=test_start_idx,
+        baselines=DEFAULT_BASELINES,
     )
 
     # Comparison
     comparison = compare_to_baselines(metrics, baseline_metrics)
 
+    # Online calibration: calibrate with the stored state, then learn from the new actuals
+    calibrated_metrics = None
+    if args.online_calibrator is not None:
+        if args.online_calibrator.exists():
+            calibrator = OnlineCalibrator.load(args.online_calibrator)
+            calibrated = apply_calibration(test_pred[forecast_columns], calibrator.to_parameters())
+            calibrated_metrics = calculate_metrics(
+                y_true=test_pred["y"],
+                y_pred=calibrated["yhat"],
+                y_lower=calibrated["yhat_lower"],
+                y_upper=calibrated["yhat_upper"],
+                dates=test_pred["ds"],
+                interval_width=calibrator.target_coverage,
+                y_quantiles={level: calibrated[quantile_column(level)] for level in DEFAULT_QUANTILES},
+            )
+            for col in forecast_columns[1:]:
+                test_pred[f"{col}_calibrated"] = calibrated[col].to_numpy()
+        else:
+            logger.warning("No calibrator state at %s; starting a new one", args.online_calibrator)
+            calibrator = OnlineCalibrator(target_coverage=settings.coverage_target)
+        absorbed = calibrator.update_frame(test_pred)
+        logger.info("Online calibrator absorbed %d new actuals (through %s)", absorbed, calibrator.last_ds)
+        calibrator.save(args.online_calibrator)
+
     # --- Step 7: Generate Plots ---
     if args.save_plots:
         logger.info("\n[Step 7] Generating diagnostic plots...")
@@ -297,7 +350,7 @@ def main() -> None:
             for col in regressor_cols:
                 if col in train_df.columns:
                     full_future[col] = train_df[col].values
-        full_forecast = model.model.predict(full_future)
+        full_forecast = model.predict(future_df=full_future)
         components = model.get_components(full_forecast)
 
         plot_components(
@@ -339,6 +392,8 @@ def main() -> None:
                 "metrics": metrics,
                 "baselines": baseline_metrics,
                 "comparison": comparison,
+                "calibrated_metrics": calibrated_metrics,
+                "timings": timing_breakdown(),
             },
             f,
             indent=2,
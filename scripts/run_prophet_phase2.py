@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
@@ -18,9 +19,13 @@ try:
         load_settings,
         set_global_seed,
     )
+    from champion_prophet.timing import reset_timings, timing_breakdown
     from data.daily_loader import load_daily_data, prepare_prophet_frame, split_train_test
+    from evaluation.baselines import DEFAULT_BASELINES
     from evaluation.calibration import apply_calibration, calibrate_forecasts
+    from evaluation.checkpoint import FoldCheckpoint
     from evaluation.cross_validation import (
+        OBJECTIVES,
         aggregate_fold_metrics,
         generate_expanding_window_splits,
         grid_search_prophet,
@@ -30,13 +35,23 @@ try:
         calculate_metrics,
         compare_to_baselines,
     )
+    from evaluation.online_calibration import OnlineCalibrator
     from evaluation.plots import (
         plot_components,
         plot_dow_performance,
         plot_forecast_vs_actual,
         plot_residuals,
     )
+    from evaluation.search import (
+        Categorical,
+        LogUniform,
+        successive_halving_prophet,
+        summarize_search,
+        tpe_search_prophet,
+    )
+    from models.fit_cache import FitCache
     from models.prophet_daily import ProphetDailyModel
+    from models.uncertainty import DEFAULT_QUANTILES, quantile_column
 except ImportError:
     import sys
 
@@ -51,9 +66,13 @@ except ImportError:
         load_settings,
         set_global_seed,
     )
+    from champion_prophet.timing import reset_timings, timing_breakdown
     from data.daily_loader import load_daily_data, prepare_prophet_frame, split_train_test
+    from evaluation.baselines import DEFAULT_BASELINES
     from evaluation.calibration import apply_calibration, calibrate_forecasts
+    from evaluation.checkpoint import FoldCheckpoint
     from evaluation.cross_validation import (
+        OBJECTIVES,
         aggregate_fold_metrics,
         generate_expanding_window_splits,
         grid_search_prophet,
@@ -63,13 +82,23 @@ except ImportError:
         calculate_metrics,
         compare_to_baselines,
     )
+    from evaluation.online_calibration import OnlineCalibrator
     from evaluation.plots import (
         plot_components,
         plot_dow_performance,
         plot_forecast_vs_actual,
         plot_residuals,
     )
+    from evaluation.search import (
+        Categorical,
+        LogUniform,
+        successive_halving_prophet,
+        summarize_search,
+        tpe_search_prophet,
+    )
+    from models.fit_cache import FitCache
     from models.prophet_daily import ProphetDailyModel
+    from models.uncertainty import DEFAULT_QUANTILES, quantile_column
 
 logger = logging.getLogger(__name__)
 
@@ -84,24 +113,100 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--test-days", type=int, default=14, help="Hold-out horizon for evaluation")
     parser.add_argument("--initial-train-size", type=int, default=56, help="Minimum train window for CV folds")
     parser.add_argument("--max-folds", type=int, default=4, help="Maximum number of CV folds to evaluate")
+    parser.add_argument(
+        "--executor",
+        choices=["serial", "thread", "process"],
+        default="serial",
+        help="How to schedule the (config, fold) fits during grid search",
+    )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help="Worker count for thread/process executors (-1 uses all CPUs)",
+    )
+    parser.add_argument(
+        "--search",
+        choices=["grid", "halving", "tpe"],
+        default="grid",
+        help=(
+            "Full grid, successive halving that drops dominated configs on the early folds, "
+            "or TPE over log-uniform prior scales"
+        ),
+    )
+    parser.add_argument(
+        "--n-trials",
+        type=int,
+        default=12,
+        help="Configs evaluated by --search tpe (each costs one fit per fold)",
+    )
+    parser.add_argument(
+        "--halving-eta",
+        type=int,
+        default=2,
+        help="Successive-halving reduction factor (keeps ~1/eta of configs per rung)",
+    )
+    parser.add_argument(
+        "--objective",
+        choices=OBJECTIVES,
+        default="mae",
+        help=(
+            "CV metric the search minimises: point error (mae, rmse) or a probabilistic score "
+            "(pinball over the quantile grid, sample CRPS, Winkler interval score)"
+        ),
+    )
+    parser.add_argument(
+        "--calibration",
+        choices=["scale", "absolute", "cqr"],
+        default="scale",
+        help=(
+            "Interval calibration: global width scale, split conformal on absolute CV residuals, "
+            "or conformalized quantile regression on Prophet's CV intervals"
+        ),
+    )
+    parser.add_argument(
+        "--calibration-per-dow",
+        action="store_true",
+        help="With a conformal --calibration, build one residual quantile per day of week",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Seed each CV fold's optimizer from the previous fold's fitted parameters",
+    )
+    parser.add_argument(
+        "--no-fit-cache",
+        action="store_true",
+        help="Refit every model instead of reusing identical fits cached under artifacts/cache/fits",
+    )
     parser.add_argument(
         "--run-id",
         type=str,
         default=None,
         help="Optional run identifier (defaults to timestamp)",
     )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume an interrupted run, skipping CV cells already in artifacts/checkpoints/RUN_ID.jsonl",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     configure_logging()
+    reset_timings()
     args = parse_args()
 
     settings = load_settings()
     ensure_directories(settings)
     set_global_seed(settings.random_seed)
 
-    run_id = args.run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    if args.resume and args.run_id and args.resume != args.run_id:
+        raise SystemExit("--resume and --run-id name different runs")
+    run_id = args.resume or args.run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
     logger.info("=" * 80)
     logger.info("Prophet Phase 2 Run | run_id=%s", run_id)
     logger.info("=" * 80)
@@ -109,7 +214,11 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Load & prepare data
     # ------------------------------------------------------------------
-    raw_df = load_daily_data(settings.database_path, target_column=args.target_column)
+    raw_df = load_daily_data(
+        settings.database_path,
+        target_column=args.target_column,
+        snapshot_dir=settings.cache_dir / "snapshots",
+    )
     prophet_df = prepare_prophet_frame(raw_df, include_regressors=True, regressor_type="both")
     regressor_cols = [col for col in prophet_df.columns if col not in ("ds", "y")]
 
@@ -125,6 +234,13 @@ def main() -> None:
         max_folds=args.max_folds,
     )
 
+    fit_cache = None if args.no_fit_cache else FitCache(settings.cache_dir / "fits")
+    checkpoint = FoldCheckpoint.for_run(settings.checkpoints_dir, run_id)
+    if args.resume:
+        if not checkpoint.path.exists():
+            raise SystemExit(f"No checkpoint found for run {run_id} at {checkpoint.path}")
+        logger.info("Resuming run %s from %s", run_id, checkpoint.path)
+
     param_grid = {
         "changepoint_prior_scale": [0.01, 0.05, 0.1],
         "seasonality_prior_scale": [5.0, 10.0, 15.0],
@@ -132,11 +248,39 @@ def main() -> None:
         "interval_width": [0.80],
     }
 
-    best_config, best_fold_results, history = grid_search_prophet(
-        cv_df,
-        splits,
-        param_grid,
+    search_space = {
+        "changepoint_prior_scale": LogUniform(0.001, 0.5),
+        "seasonality_prior_scale": LogUniform(0.1, 20.0),
+        "seasonality_mode": Categorical(("additive", "multiplicative")),
+        "interval_width": 0.80,
+    }
+
+    search_kwargs = dict(
         regressor_columns=regressor_cols,
+        executor=args.executor,
+        n_jobs=args.n_jobs,
+        random_seed=settings.random_seed,
+        warm_start=args.warm_start,
+        fit_cache=fit_cache,
+        checkpoint=checkpoint,
+        objective=args.objective,
+    )
+    if args.search == "halving":
+        best_config, best_fold_results, history = successive_halving_prophet(
+            cv_df, splits, param_grid, eta=args.halving_eta, **search_kwargs
+        )
+    elif args.search == "tpe":
+        best_config, best_fold_results, history = tpe_search_prophet(
+            cv_df, splits, search_space, n_trials=args.n_trials, **search_kwargs
+        )
+    else:
+        best_config, best_fold_results, history = grid_search_prophet(cv_df, splits, param_grid, **search_kwargs)
+    search_summary = summarize_search(history, len(splits), strategy=args.search)
+    logger.info(
+        "Search used %d of %d full-grid fits (%d saved)",
+        search_summary.fits_run,
+        search_summary.fits_full_grid,
+        search_summary.fits_saved,
     )
 
     aggregated_cv_metrics = aggregate_fold_metrics(best_fold_results)
@@ -147,7 +291,12 @@ def main() -> None:
         ignore_index=True,
     )
 
-    calibration = calibrate_forecasts(cv_predictions, settings.coverage_target)
+    calibration = calibrate_forecasts(
+        cv_predictions,
+        settings.coverage_target,
+        method=args.calibration,
+        per_dow=args.calibration_per_dow,
+    )
     logger.info(
         "Calibration: interval_scale=%.3f (observed coverage %.3f → target %.3f)",
         calibration.interval_scale,
@@ -155,6 +304,12 @@ def main() -> None:
         calibration.target_coverage,
     )
     logger.info("Calibration DOW bias adjustments: %s", calibration.dow_bias)
+    if calibration.conformal is not None:
+        logger.info("Conformal (%s) margins: %s", calibration.method, calibration.conformal.quantiles)
+
+    # Seed the streaming calibrator used by the daily job from the same CV predictions
+    online_calibrator = OnlineCalibrator.from_history(cv_predictions, target_coverage=settings.coverage_target)
+    online_calibrator_path = online_calibrator.save(settings.calibration_dir / "online_calibrator.json")
 
     # ------------------------------------------------------------------
     # Hold-out evaluation with best config
@@ -164,12 +319,11 @@ def main() -> None:
     final_model = ProphetDailyModel(**best_config)
     if regressor_cols:
         final_model.add_regressors(regressor_cols)
-    final_model.fit(train_df)
+    final_model.fit(train_df, cache=fit_cache)
 
-    test_forecast = final_model.forecast_holdout(test_df)
-    holdout_raw = test_forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].merge(
-        test_df[["ds", "y"]], on="ds", how="left"
-    )
+    forecast_columns = ["ds", "yhat", "yhat_lower", "yhat_upper", *map(quantile_column, DEFAULT_QUANTILES)]
+    test_forecast = final_model.forecast_holdout(test_df, quantiles=DEFAULT_QUANTILES)
+    holdout_raw = test_forecast[forecast_columns].merge(test_df[["ds", "y"]], on="ds", how="left")
 
     raw_metrics = calculate_metrics(
         y_true=holdout_raw["y"],
@@ -177,9 +331,11 @@ def main() -> None:
         y_lower=holdout_raw["yhat_lower"],
         y_upper=holdout_raw["yhat_upper"],
         dates=holdout_raw["ds"],
+        interval_width=best_config["interval_width"],
+        y_quantiles={level: holdout_raw[quantile_column(level)] for level in DEFAULT_QUANTILES},
     )
 
-    calibrated_df = holdout_raw[["ds", "yhat", "yhat_lower", "yhat_upper"]].copy()
+    calibrated_df = holdout_raw[forecast_columns].copy()
     calibrated_df = apply_calibration(calibrated_df, calibration)
     calibrated_df["y"] = holdout_raw["y"].values
 
@@ -189,6 +345,8 @@ def main() -> None:
         y_lower=calibrated_df["yhat_lower"],
         y_upper=calibrated_df["yhat_upper"],
         dates=calibrated_df["ds"],
+        interval_width=calibration.target_coverage,
+        y_quantiles={level: calibrated_df[quantile_column(level)] for level in DEFAULT_QUANTILES},
     )
 
     # Baselines & champion comparison
@@ -196,6 +354,7 @@ def main() -> None:
         y_true=prophet_df["y"],
         dates=prophet_df["ds"],
         evaluation_start_index=len(train_df),
+        baselines=DEFAULT_BASELINES,
     )
     raw_comparison = compare_to_baselines(raw_metrics, baseline_metrics)
     calibrated_comparison = compare_to_baselines(calibrated_metrics, baseline_metrics)
@@ -209,35 +368,37 @@ def main() -> None:
         "best_config": best_config,
         "cv_metrics": aggregated_cv_metrics,
         "cv_history": history,
+        "checkpoint": str(checkpoint.path),
+        "search": {**search_summary.as_dict(), "objective": args.objective},
         "calibration": {
             "dow_bias": calibration.dow_bias,
             "interval_scale": calibration.interval_scale,
             "observed_coverage": calibration.observed_coverage,
             "target_coverage": calibration.target_coverage,
+            "method": calibration.method,
+            "conformal": asdict(calibration.conformal) if calibration.conformal else None,
+            "quantile_offsets": calibration.quantile_offsets,
+            "online_calibrator": str(online_calibrator_path),
         },
         "holdout_raw": {"metrics": raw_metrics, "comparison": raw_comparison},
         "holdout_calibrated": {"metrics": calibrated_metrics, "comparison": calibrated_comparison},
     }
 
+    metrics_payload["timings"] = timing_breakdown()
     metrics_path = settings.metrics_dir / f"prophet_phase2_metrics_{run_id}.json"
     with open(metrics_path, "w") as fh:
         json.dump(metrics_payload, fh, indent=2, default=str)
     logger.info("Metrics saved to %s", metrics_path)
 
     forecast_export = holdout_raw.copy()
-    forecast_export.rename(
-        columns={
-            "yhat": "yhat_raw",
-            "yhat_lower": "yhat_lower_raw",
-            "yhat_upper": "yhat_upper_raw",
-        },
-        inplace=True,
-    )
-    forecast_export["yhat_calibrated"] = calibrated_df["yhat"]
-    forecast_export["yhat_lower_calibrated"] = calibrated_df["yhat_lower"]
-    forecast_export["yhat_upper_calibrated"] = calibrated_df["yhat_upper"]
+    value_columns = forecast_columns[1:]
+    forecast_export.rename(columns={col: f"{col}_raw" for col in value_columns}, inplace=True)
+    for col in value_columns:
+        forecast_export[f"{col}_calibrated"] = calibrated_df[col]
     forecast_export["bias_adjustment"] = calibrated_df.get("bias_adjustment", 0.0)
     forecast_export["interval_scale"] = calibration.interval_scale
+    if "conformal_margin" in calibrated_df:
+        forecast_export["conformal_margin"] = calibrated_df["conformal_margin"]
 
     forecast_path = settings.artifacts_dir / f"prophet_phase2_forecast_{run_id}.csv"
     forecast_export.to_csv(forecast_path, index=False)
@@ -272,7 +433,7 @@ def main() -> None:
     for col in regressor_cols:
         if col in train_df.columns:
             full_future[col] = train_df[col].values
-    components = final_model.get_components(final_model.model.predict(full_future))
+    components = final_model.get_components(final_model.predict(future_df=full_future))
     plot_components(
         components_df=components,
         title=f"Prophet Components – {run_id}",
@@ -286,6 +447,12 @@ def main() -> None:
             save_path=settings.plots_dir / f"phase2_dow_{run_id}.png",
         )
 
+    # Refresh the timing breakdown so it also covers plotting
+    metrics_payload["timings"] = timing_breakdown()
+    with open(metrics_path, "w") as fh:
+        json.dump(metrics_payload, fh, indent=2, default=str)
+    logger.info("Timing breakdown updated in %s", metrics_path)
+
     logger.info("=" * 80)
     logger.info("Hold-out raw metrics: %s", raw_metrics)
     logger.info("Hold-out calibrated metrics: %s", calibrated_metrics)
@@ -18,6 +18,7 @@ import numpy as np
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DB_PATH = PROJECT_ROOT / "database" / "email_database.db"
+DEFAULT_HOLIDAYS_PATH = PROJECT_ROOT / "database" / "holidays.csv"
 DEFAULT_ARTIFACTS_DIR = PROJECT_ROOT / "artifacts"
 DEFAULT_LOG_DIR = PROJECT_ROOT / "logs"
 
@@ -51,17 +52,31 @@ class Settings:
     artifacts_dir: Path = field(default_factory=lambda: _env_path(ENV_ARTIFACTS_DIR, DEFAULT_ARTIFACTS_DIR))
     plots_dir: Path = field(init=False)
     metrics_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
+    checkpoints_dir: Path = field(init=False)
+    calibration_dir: Path = field(init=False)
     logs_dir: Path = field(default_factory=lambda: DEFAULT_LOG_DIR)
     forecast_horizon_days: int = 14
     coverage_target: float = 0.80
     random_seed: int = field(default_factory=lambda: _env_int(ENV_RANDOM_SEED, 42))
 
     def derived_paths(self) -> Iterable[Path]:
-        return (self.artifacts_dir, self.plots_dir, self.metrics_dir, self.logs_dir)
+        return (
+            self.artifacts_dir,
+            self.plots_dir,
+            self.metrics_dir,
+            self.cache_dir,
+            self.checkpoints_dir,
+            self.calibration_dir,
+            self.logs_dir,
+        )
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "plots_dir", self.artifacts_dir / "plots")
         object.__setattr__(self, "metrics_dir", self.artifacts_dir / "metrics")
+        object.__setattr__(self, "cache_dir", self.artifacts_dir / "cache")
+        object.__setattr__(self, "checkpoints_dir", self.artifacts_dir / "checkpoints")
+        object.__setattr__(self, "calibration_dir", self.artifacts_dir / "calibration")
 
 
 def load_settings() -> Settings:
@@ -0,0 +1,131 @@
+"""Lightweight span timing for pipeline hot paths.
+
+``span`` (a context manager) and ``timed`` (a decorator) accumulate
+wall-clock time per span name in a process-wide recorder. Scripts reset the
+recorder at start-up and write ``timing_breakdown()`` into their metrics
+JSON. Spans nest freely (``cv.run_prophet_fold`` contains ``model.fit``),
+so totals overlap and are not meant to sum to the run time. Process-pool
+workers keep their own recorder; callers ship a worker's ``snapshot()``
+back and fold it in with ``merge_timings``.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class SpanStats:
+    """Accumulated timings of one span name."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class TimingRecorder:
+    """Thread-safe accumulator of span durations."""
+
+    def __init__(self) -> None:
+        self._spans: dict[str, SpanStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._spans.setdefault(name, SpanStats()).add(seconds)
+
+    def merge(self, snapshot: Mapping[str, Mapping[str, float]]) -> None:
+        """Add the spans of another recorder's ``snapshot()``."""
+
+        with self._lock:
+            for name, stats in snapshot.items():
+                current = self._spans.setdefault(name, SpanStats())
+                current.count += int(stats["count"])
+                current.total_seconds += float(stats["total_seconds"])
+                current.max_seconds = max(current.max_seconds, float(stats["max_seconds"]))
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Span stats by name, slowest total first."""
+
+        with self._lock:
+            items = sorted(self._spans.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            return {
+                name: {
+                    "count": stats.count,
+                    "total_seconds": stats.total_seconds,
+                    "mean_seconds": stats.total_seconds / stats.count if stats.count else 0.0,
+                    "max_seconds": stats.max_seconds,
+                }
+                for name, stats in items
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+_RECORDER = TimingRecorder()
+
+
+def get_recorder() -> TimingRecorder:
+    """The process-wide recorder used by ``span`` and ``timed``."""
+
+    return _RECORDER
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block under ``name``."""
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _RECORDER.record(name, time.perf_counter() - started)
+
+
+def timed(name: str | None = None) -> Callable[[F], F]:
+    """Decorator timing every call of the function (default name: module.qualname)."""
+
+    def decorator(fn: F) -> F:
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timing_breakdown() -> dict[str, dict[str, float]]:
+    """Snapshot of every span recorded in this process."""
+
+    return _RECORDER.snapshot()
+
+
+def merge_timings(snapshot: Mapping[str, Mapping[str, float]] | None) -> None:
+    """Fold a worker's ``timing_breakdown()`` into this process's recorder."""
+
+    if snapshot:
+        _RECORDER.merge(snapshot)
+
+
+def reset_timings() -> None:
+    """Clear the process-wide recorder (e.g. at the start of a run)."""
+
+    _RECORDER.reset()
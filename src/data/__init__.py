@@ -1,5 +1,16 @@
 """Data loading utilities for Prophet models."""
 
-from .daily_loader import load_daily_data, prepare_prophet_frame
+from .daily_loader import clear_incremental_loaders, load_daily_data, prepare_prophet_frame
+from .future import FutureFrameBuilder
+from .holidays import HolidayCalendar, load_holiday_calendar
+from .incremental import IncrementalDailyLoader
 
-__all__ = ["load_daily_data", "prepare_prophet_frame"]
+__all__ = [
+    "FutureFrameBuilder",
+    "HolidayCalendar",
+    "IncrementalDailyLoader",
+    "clear_incremental_loaders",
+    "load_daily_data",
+    "load_holiday_calendar",
+    "prepare_prophet_frame",
+]
@@ -9,20 +9,42 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
+from champion_prophet.timing import span, timed
+
+from .features import build_regressor_columns
+from .holidays import HolidayCalendar, load_holiday_calendar
+from .incremental import IncrementalDailyLoader
+from .snapshot import load_days_snapshot
+
 logger = logging.getLogger(__name__)
 
+# One incremental loader per (database, target, snapshot dir), least recently used evicted first
+MAX_INCREMENTAL_LOADERS = 8
+_INCREMENTAL_LOADERS: OrderedDict[tuple[str, str, str | None], IncrementalDailyLoader] = OrderedDict()
+
+
+def clear_incremental_loaders() -> None:
+    """Drop every in-process incremental loader (the next load starts from the snapshot or SQLite)."""
 
+    _INCREMENTAL_LOADERS.clear()
+
+
+@timed("data.load_daily_data")
 def load_daily_data(
     db_path: Path | str,
     start_date: str | None = None,
     end_date: str | None = None,
     target_column: str = "total_emails",
+    snapshot_dir: Path | str | None = None,
+    incremental: bool = False,
 ) -> pd.DataFrame:
     """Load daily email data from SQLite database.
 
@@ -31,6 +53,14 @@ def load_daily_data(
         start_date: Optional start date filter (YYYY-MM-DD format)
         end_date: Optional end date filter (YYYY-MM-DD format)
         target_column: Column name to use as forecast target (default: total_emails)
+        snapshot_dir: Optional directory for columnar snapshots of the days
+            table; when given, SQLite is only read if metadata.last_updated
+            changed since the snapshot was written
+        incremental: Keep the loaded rows in-process (and in the snapshot,
+            when given) and fetch only rows near or after the last loaded
+            date once metadata.last_updated moves. Up to
+            ``MAX_INCREMENTAL_LOADERS`` loaders are kept; see
+            ``clear_incremental_loaders``
 
     Returns:
         DataFrame with columns: date, target, has_email_data, has_sla_data
@@ -40,32 +70,22 @@ def load_daily_data(
     """
     logger.info("Loading daily data from %s", db_path)
 
-    with sqlite3.connect(db_path) as conn:
-        # Build query with optional date filters
-        query = f"""
-            SELECT
-                date,
-                {target_column} as target,
-                has_email_data,
-                has_sla_data
-            FROM days
-            WHERE has_email_data = 1
-        """
-
-        params: list[str] = []
-        if start_date:
-            query += " AND date >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND date <= ?"
-            params.append(end_date)
-
-        query += " ORDER BY date"
-
-        df = pd.read_sql_query(query, conn, params=params)
-
-    # Convert date to datetime
-    df["date"] = pd.to_datetime(df["date"])
+    if incremental:
+        key = (str(Path(db_path).resolve()), target_column, str(snapshot_dir) if snapshot_dir else None)
+        loader = _INCREMENTAL_LOADERS.get(key)
+        if loader is None:
+            loader = IncrementalDailyLoader(db_path, target_column=target_column, snapshot_dir=snapshot_dir)
+            _INCREMENTAL_LOADERS[key] = loader
+            while len(_INCREMENTAL_LOADERS) > MAX_INCREMENTAL_LOADERS:
+                _INCREMENTAL_LOADERS.popitem(last=False)
+        _INCREMENTAL_LOADERS.move_to_end(key)
+        # Hand out a copy: the loader extends its own frame on the next refresh
+        df = _filter_date_range(loader.refresh(), start_date, end_date).copy()
+    elif snapshot_dir is not None:
+        # The snapshot frame is a read-only memory map; callers get a writable copy
+        df = _filter_date_range(load_days_snapshot(db_path, snapshot_dir, target_column), start_date, end_date).copy()
+    else:
+        df = _query_daily_data(db_path, start_date, end_date, target_column)
 
     logger.info(
         "Loaded %d days from %s to %s (raw)",
@@ -94,42 +114,62 @@ def load_daily_data(
     return df
 
 
-def _generate_holiday_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Add holiday-related features to the DataFrame.
+def _filter_date_range(df: pd.DataFrame, start_date: str | None, end_date: str | None) -> pd.DataFrame:
+    """Slice a date-sorted frame to [start_date, end_date] with binary search."""
 
-    For now, this uses a simple heuristic: weekends are holidays.
-    In production, this should be replaced with actual holiday calendar.
+    if not start_date and not end_date:
+        return df
 
-    Args:
-        df: DataFrame with a 'date' column
+    dates = df["date"].to_numpy(dtype="datetime64[ns]")
+    lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(start_date)), side="left") if start_date else 0
+    hi = np.searchsorted(dates, np.datetime64(pd.Timestamp(end_date)), side="right") if end_date else len(df)
+    return df.iloc[lo:hi].reset_index(drop=True)
 
-    Returns:
-        DataFrame with added columns: is_holiday, pre_holiday, post_holiday
-    """
-    df = df.copy()
 
-    # Simple heuristic: weekend = holiday (Saturday=5, Sunday=6)
-    df["day_of_week"] = df["date"].dt.dayofweek
-    df["is_holiday"] = (df["day_of_week"] >= 5).astype(int)
+def _query_daily_data(
+    db_path: Path | str,
+    start_date: str | None,
+    end_date: str | None,
+    target_column: str,
+) -> pd.DataFrame:
+    """Read the days table straight from SQLite with optional date filters."""
+
+    with span("data.sqlite_query"), sqlite3.connect(db_path) as conn:
+        # Build query with optional date filters
+        query = f"""
+            SELECT
+                date,
+                {target_column} as target,
+                has_email_data,
+                has_sla_data
+            FROM days
+            WHERE has_email_data = 1
+        """
 
-    # Pre-holiday: day before a holiday
-    df["pre_holiday"] = df["is_holiday"].shift(-1, fill_value=0).astype(int)
+        params: list[str] = []
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
 
-    # Post-holiday: day after a holiday
-    df["post_holiday"] = df["is_holiday"].shift(1, fill_value=0).astype(int)
+        query += " ORDER BY date"
 
-    # Clean up temporary column
-    df = df.drop(columns=["day_of_week"])
+        df = pd.read_sql_query(query, conn, params=params)
 
-    logger.debug("Added holiday features: %d holidays detected", df["is_holiday"].sum())
+    # Convert date to datetime
+    df["date"] = pd.to_datetime(df["date"])
 
     return df
 
 
+@timed("data.prepare_prophet_frame")
 def prepare_prophet_frame(
     df: pd.DataFrame,
     include_regressors: bool = True,
     regressor_type: Literal["holiday", "dow", "both"] = "holiday",
+    calendar: HolidayCalendar | None = None,
 ) -> pd.DataFrame:
     """Transform daily data into Prophet-compatible format.
 
@@ -145,33 +185,27 @@ def prepare_prophet_frame(
             - "holiday": is_holiday, pre_holiday, post_holiday
             - "dow": day-of-week one-hot encoding (dow_0 to dow_5)
             - "both": all regressors
+        calendar: Holiday calendar for the holiday flags (default: the
+            bundled calendar from load_holiday_calendar, weekends included)
 
     Returns:
         Prophet-ready DataFrame with ds, y, and optional regressors
     """
-    prophet_df = pd.DataFrame()
-    prophet_df["ds"] = df["date"]
-    prophet_df["y"] = df["target"]
+    columns: dict[str, object] = {"ds": df["date"].to_numpy(), "y": df["target"].to_numpy()}
 
     if include_regressors:
-        if regressor_type in ("holiday", "both"):
-            # Add holiday features
-            temp_df = _generate_holiday_features(df[["date"]].copy())
-            prophet_df["is_holiday"] = temp_df["is_holiday"]
-            prophet_df["pre_holiday"] = temp_df["pre_holiday"]
-            prophet_df["post_holiday"] = temp_df["post_holiday"]
-
-        if regressor_type in ("dow", "both"):
-            # Add day-of-week one-hot encoding (Monday=0, ..., Saturday=5)
-            dow = pd.get_dummies(df["date"].dt.dayofweek, prefix="dow", drop_first=False)
-
-            # Drop Sunday (dow_6) to avoid collinearity with intercept
-            if "dow_6" in dow.columns:
-                dow = dow.drop(columns=["dow_6"])
-
-            # Ensure deterministic column ordering (dow_0 ... dow_5)
-            dow = dow.reindex(sorted(dow.columns), axis=1)
-            prophet_df = pd.concat([prophet_df, dow], axis=1)
+        # Regressors are written straight into preallocated blocks (see data.features)
+        regressors = build_regressor_columns(
+            df["date"].to_numpy(dtype="datetime64[ns]"),
+            regressor_type,
+            calendar=calendar if calendar is not None else load_holiday_calendar(),
+            present_dows_only=True,
+        )
+        columns.update(regressors)
+        if "is_holiday" in regressors:
+            logger.debug("Added holiday features: %d holidays detected", regressors["is_holiday"].sum())
+
+    prophet_df = pd.DataFrame(columns, index=df.index)
 
     logger.info("Prepared Prophet frame: shape=%s, columns=%s", prophet_df.shape, list(prophet_df.columns))
 
@@ -0,0 +1,88 @@
+"""Vectorized calendar regressor construction.
+
+All regressor columns are written straight into preallocated NumPy blocks
+from the integer day number of each date, without the intermediate frames
+produced by ``pd.get_dummies``/``shift``/``concat``. Holiday flags live in
+one int64 block and day-of-week one-hots in one bool block, which keeps the
+column dtypes identical to the original pandas implementation.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .holidays import HolidayCalendar
+
+RegressorType = Literal["holiday", "dow", "both"]
+
+HOLIDAY_COLUMNS = ("is_holiday", "pre_holiday", "post_holiday")
+# Sunday (dow_6) is omitted to avoid collinearity with the intercept
+DOW_COLUMNS = tuple(f"dow_{day}" for day in range(6))
+
+_NS_PER_DAY = 86_400 * 10**9
+# 1970-01-01 was a Thursday (Monday=0)
+EPOCH_DAYOFWEEK = 3
+
+
+def day_numbers(dates: np.ndarray) -> np.ndarray:
+    """Whole days since the Unix epoch for datetime64 values."""
+
+    return np.asarray(dates, dtype="datetime64[ns]").astype(np.int64) // _NS_PER_DAY
+
+
+def day_of_week(dates: np.ndarray) -> np.ndarray:
+    """Day of week (Monday=0 ... Sunday=6) for datetime64 values."""
+
+    return (day_numbers(dates) + EPOCH_DAYOFWEEK) % 7
+
+
+def dow_block(dates: np.ndarray) -> np.ndarray:
+    """Fill an (n, 6) bool block with Monday..Saturday one-hot columns."""
+
+    dow = day_of_week(dates)
+    block = np.zeros((len(dates), len(DOW_COLUMNS)), dtype=bool)
+    rows = np.flatnonzero(dow < len(DOW_COLUMNS))
+    block[rows, dow[rows]] = True
+    return block
+
+
+def build_regressor_columns(
+    dates: np.ndarray,
+    regressor_type: RegressorType,
+    calendar: HolidayCalendar,
+    present_dows_only: bool = False,
+) -> dict[str, np.ndarray]:
+    """Build the regressor columns for ``regressor_type`` as named array views.
+
+    Args:
+        dates: datetime64 values (one per row, in row order)
+        regressor_type: "holiday", "dow", or "both"
+        calendar: Holiday calendar supplying is/pre/post holiday flags
+        present_dows_only: Only emit dow columns for weekdays that occur in
+            ``dates`` (the behaviour of ``pd.get_dummies``)
+
+    Returns:
+        Mapping of column name to a column view of the underlying block, in
+        output column order
+    """
+    if regressor_type not in ("holiday", "dow", "both"):
+        raise ValueError(f"Unknown regressor_type: {regressor_type}")
+
+    columns: dict[str, np.ndarray] = {}
+
+    if regressor_type in ("holiday", "both"):
+        holiday = calendar.holiday_block(dates)
+        for j, name in enumerate(HOLIDAY_COLUMNS):
+            columns[name] = holiday[:, j]
+
+    if regressor_type in ("dow", "both"):
+        dow = dow_block(dates)
+        present = dow.any(axis=0) if present_dows_only else np.ones(len(DOW_COLUMNS), dtype=bool)
+        for j, name in enumerate(DOW_COLUMNS):
+            if present[j]:
+                columns[name] = dow[:, j]
+
+    return columns
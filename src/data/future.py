@@ -0,0 +1,128 @@
+"""Calendar regressor frames for forecast horizons.
+
+``ProphetDailyModel.predict(periods=...)`` needs regressor values for dates
+that have no rows in the database yet. Every calendar regressor (holiday
+flags and day-of-week one-hots) is a pure function of the date, so the
+future frame is built with the same vectorized code as
+``prepare_prophet_frame``. Horizon frames are memoized per
+(start, periods, regressors) so repeated scoring calls reuse them.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from champion_prophet.config import DEFAULT_HOLIDAYS_PATH
+from .features import DOW_COLUMNS, HOLIDAY_COLUMNS, build_regressor_columns
+from .holidays import HolidayCalendar, load_holiday_calendar
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_REGRESSORS = (*HOLIDAY_COLUMNS, *DOW_COLUMNS)
+
+
+class FutureFrameBuilder:
+    """Build and memoize ``ds`` + calendar regressor frames.
+
+    Attributes:
+        calendar: Holiday calendar used for the holiday flags
+        max_entries: Maximum number of memoized horizon frames
+        hits: Number of horizon requests served from the memo
+        misses: Number of horizon frames built
+    """
+
+    def __init__(self, calendar: HolidayCalendar | None = None, max_entries: int = 64):
+        self.calendar = calendar if calendar is not None else load_holiday_calendar()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[tuple[pd.Timestamp, int, tuple[str, ...]], pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def regressor_frame(self, dates: pd.Series | np.ndarray, regressor_names: Sequence[str]) -> pd.DataFrame:
+        """Build ``ds`` plus the calendar regressors in ``regressor_names`` for any dates.
+
+        Names that are not calendar regressors are skipped; callers must
+        supply those columns themselves.
+
+        Args:
+            dates: Dates to build rows for, in row order
+            regressor_names: Regressors the model was fitted with
+
+        Returns:
+            DataFrame with ``ds`` and the requested calendar regressor columns
+        """
+        ds = np.asarray(pd.to_datetime(dates), dtype="datetime64[ns]")
+        wanted = [name for name in regressor_names if name in CALENDAR_REGRESSORS]
+        columns: dict[str, np.ndarray] = {"ds": ds}
+        if wanted:
+            built = build_regressor_columns(ds, "both", calendar=self.calendar)
+            columns.update((name, built[name]) for name in wanted)
+        return pd.DataFrame(columns)
+
+    def horizon_frame(
+        self,
+        start: pd.Timestamp | str,
+        periods: int,
+        regressor_names: Sequence[str],
+    ) -> pd.DataFrame:
+        """Frame for ``periods`` consecutive days from ``start``, memoized.
+
+        Args:
+            start: First forecast date
+            periods: Number of days in the horizon
+            regressor_names: Regressors the model was fitted with
+
+        Returns:
+            A fresh copy of the memoized frame (callers may mutate it)
+        """
+        if periods < 0:
+            raise ValueError("periods must be non-negative")
+
+        key = (pd.Timestamp(start).normalize(), int(periods), tuple(regressor_names))
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return frame.copy()
+
+        frame = self.regressor_frame(pd.date_range(key[0], periods=key[1], freq="D"), key[2])
+        with self._lock:
+            self.misses += 1
+            self._frames[key] = frame
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+        logger.debug("Built future frame: %d days from %s", periods, key[0].date())
+        return frame.copy()
+
+    def clear(self) -> None:
+        """Drop every memoized horizon frame."""
+
+        with self._lock:
+            self._frames.clear()
+
+
+def default_future_builder() -> FutureFrameBuilder:
+    """Process-wide builder over the bundled holiday calendar.
+
+    Keyed on the calendar file's path and mtime, like ``load_holiday_calendar``,
+    so an edited CSV gets a fresh builder. Future rows therefore carry the
+    same holiday flags that ``prepare_prophet_frame`` computes by default.
+    """
+    path = Path(DEFAULT_HOLIDAYS_PATH)
+    mtime = path.stat().st_mtime if path.exists() else None
+    return _builder_for(str(path.resolve()), mtime)
+
+
+@lru_cache(maxsize=1)
+def _builder_for(path: str, mtime: float | None) -> FutureFrameBuilder:
+    return FutureFrameBuilder(load_holiday_calendar(path))
@@ -0,0 +1,185 @@
+"""File-based holiday calendar with precomputed lookup tables.
+
+The calendar is read from a small CSV (``date,holiday``) and expanded once
+into a dense boolean table covering every day of its year range, so
+``is_holiday``, ``pre_holiday`` and ``post_holiday`` are array lookups by
+day number for any batch of dates. Weekends count as holidays by default,
+which keeps the original weekend heuristic as a subset of the calendar.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from champion_prophet.config import DEFAULT_HOLIDAYS_PATH
+from .features import EPOCH_DAYOFWEEK, HOLIDAY_COLUMNS, day_numbers
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class HolidayCalendar:
+    """Holiday dates with O(1) membership lookups.
+
+    Attributes:
+        holiday_days: Sorted unique holiday dates as days since the Unix epoch
+        holiday_names: Holiday name for each entry of ``holiday_days``
+        include_weekends: Treat Saturdays and Sundays as holidays
+        first_day: First day number covered by the lookup table
+        table: Dense holiday table for days ``first_day .. first_day + len(table) - 1``
+    """
+
+    holiday_days: np.ndarray
+    holiday_names: np.ndarray
+    include_weekends: bool
+    first_day: int
+    table: np.ndarray
+
+    @classmethod
+    def from_dates(
+        cls,
+        dates: pd.Series | np.ndarray,
+        names: pd.Series | np.ndarray | None = None,
+        include_weekends: bool = True,
+    ) -> HolidayCalendar:
+        """Build a calendar from holiday dates, covering whole years around them."""
+
+        days = day_numbers(np.asarray(pd.to_datetime(dates), dtype="datetime64[ns]"))
+        names_arr = np.asarray(names if names is not None else ["holiday"] * len(days), dtype=object)
+        order = np.argsort(days, kind="stable")
+        days, names_arr = days[order], names_arr[order]
+        days, unique_idx = np.unique(days, return_index=True)
+        names_arr = names_arr[unique_idx]
+
+        if days.size:
+            years = pd.DatetimeIndex(days.astype("datetime64[D]")).year
+            start = pd.Timestamp(year=int(years.min()), month=1, day=1)
+            end = pd.Timestamp(year=int(years.max()), month=12, day=31)
+        else:
+            start = end = pd.Timestamp("1970-01-01")
+
+        first_day = int(day_numbers(np.array([start.to_datetime64()]))[0])
+        last_day = int(day_numbers(np.array([end.to_datetime64()]))[0])
+
+        span = np.arange(first_day, last_day + 1)
+        table = np.zeros(span.size, dtype=bool)
+        table[days - first_day] = True
+        if include_weekends:
+            table |= (span + EPOCH_DAYOFWEEK) % 7 >= 5
+
+        return cls(
+            holiday_days=days,
+            holiday_names=names_arr,
+            include_weekends=include_weekends,
+            first_day=first_day,
+            table=table,
+        )
+
+    @classmethod
+    def from_csv(cls, path: Path | str, include_weekends: bool = True) -> HolidayCalendar:
+        """Load a calendar from a CSV with ``date`` and ``holiday`` columns."""
+
+        frame = pd.read_csv(path, parse_dates=["date"])
+        logger.info("Loaded %d holidays from %s", len(frame), path)
+        return cls.from_dates(frame["date"], frame.get("holiday"), include_weekends=include_weekends)
+
+    @classmethod
+    def weekends_only(cls) -> HolidayCalendar:
+        """Calendar with no listed holidays: only the weekend heuristic."""
+
+        return cls.from_dates(np.array([], dtype="datetime64[ns]"), include_weekends=True)
+
+    @property
+    def coverage(self) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """First and last date covered by the lookup table."""
+
+        first = pd.Timestamp(np.datetime64(self.first_day, "D"))
+        return first, first + pd.Timedelta(days=self.table.size - 1)
+
+    def _lookup_days(self, days: np.ndarray) -> np.ndarray:
+        idx = days - self.first_day
+        inside = (idx >= 0) & (idx < self.table.size)
+        result = np.zeros(days.shape, dtype=bool)
+        result[inside] = self.table[idx[inside]]
+
+        outside = ~inside
+        if outside.any():
+            if self.holiday_days.size:
+                logger.warning(
+                    "%d dates fall outside holiday calendar coverage %s; only weekends are flagged there",
+                    int(outside.sum()),
+                    [ts.strftime("%Y-%m-%d") for ts in self.coverage],
+                )
+            if self.include_weekends:
+                result[outside] = (days[outside] + EPOCH_DAYOFWEEK) % 7 >= 5
+        return result
+
+    def is_holiday(self, dates: np.ndarray) -> np.ndarray:
+        """Boolean holiday flag for each datetime64 value."""
+
+        return self._lookup_days(day_numbers(dates))
+
+    def pre_holiday(self, dates: np.ndarray) -> np.ndarray:
+        """Whether the following calendar day is a holiday."""
+
+        return self._lookup_days(day_numbers(dates) + 1)
+
+    def post_holiday(self, dates: np.ndarray) -> np.ndarray:
+        """Whether the previous calendar day is a holiday."""
+
+        return self._lookup_days(day_numbers(dates) - 1)
+
+    def holiday_block(self, dates: np.ndarray) -> np.ndarray:
+        """Fill an (n, 3) int64 block with is_holiday / pre_holiday / post_holiday."""
+
+        days = day_numbers(dates)
+        block = np.empty((days.size, len(HOLIDAY_COLUMNS)), dtype=np.int64)
+        block[:, 0] = self._lookup_days(days)
+        block[:, 1] = self._lookup_days(days + 1)
+        block[:, 2] = self._lookup_days(days - 1)
+        return block
+
+    def to_prophet_holidays(self, lower_window: int = 0, upper_window: int = 0) -> pd.DataFrame:
+        """Listed holidays as a frame for Prophet's ``holidays=`` argument.
+
+        Weekends are not included: Prophet's weekly seasonality covers them.
+        """
+        return pd.DataFrame(
+            {
+                "holiday": self.holiday_names.astype(str),
+                "ds": self.holiday_days.astype("datetime64[D]").astype("datetime64[ns]"),
+                "lower_window": lower_window,
+                "upper_window": upper_window,
+            }
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime: float, include_weekends: bool) -> HolidayCalendar:
+    return HolidayCalendar.from_csv(path, include_weekends=include_weekends)
+
+
+def load_holiday_calendar(
+    path: Path | str | None = None,
+    include_weekends: bool = True,
+) -> HolidayCalendar:
+    """Load (and memoize) a holiday calendar, defaulting to the bundled one.
+
+    Args:
+        path: CSV with ``date`` and ``holiday`` columns (default: database/holidays.csv)
+        include_weekends: Treat Saturdays and Sundays as holidays
+
+    Returns:
+        HolidayCalendar; falls back to weekends only when the file is missing
+    """
+    path = Path(path) if path is not None else DEFAULT_HOLIDAYS_PATH
+    if not path.exists():
+        logger.warning("Holiday calendar %s not found; using weekends only", path)
+        return HolidayCalendar.weekends_only()
+    return _load_cached(str(path.resolve()), path.stat().st_mtime, include_weekends)
@@ -0,0 +1,185 @@
+"""Columnar on-disk snapshots of the SQLite ``days`` table.
+
+Every script and CV run used to re-open SQLite, run ``read_sql_query`` and
+parse dates from strings. A snapshot materializes the rows the daily loader
+needs, with dates already converted to ``datetime64[ns]``, as one ``.npy``
+file per column. Later loads memory-map those files instead of touching
+SQLite. A snapshot is valid only for the ``metadata.last_updated`` value it
+was built from, so any database ingest invalidates it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from champion_prophet.timing import span
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS = ("date", "target", "has_email_data", "has_sla_data")
+_META_FILE = "meta.json"
+
+
+@dataclass(slots=True)
+class SnapshotMeta:
+    """Provenance of a snapshot directory."""
+
+    db_path: str
+    target_column: str
+    last_updated: str
+    n_rows: int
+
+
+def read_last_updated(conn: sqlite3.Connection) -> str | None:
+    """Return ``metadata.last_updated``, or None when the row is missing."""
+
+    try:
+        row = conn.execute("SELECT last_updated FROM metadata WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def snapshot_path(snapshot_dir: Path | str, db_path: Path | str, target_column: str) -> Path:
+    """Directory holding the snapshot for one (database, target column) pair."""
+
+    digest = hashlib.sha256(str(Path(db_path).resolve()).encode()).hexdigest()[:12]
+    return Path(snapshot_dir) / f"days_{digest}_{target_column}"
+
+
+def read_snapshot_meta(path: Path) -> SnapshotMeta | None:
+    """Load snapshot metadata, or None if the snapshot is absent or unreadable."""
+
+    try:
+        with open(path / _META_FILE) as f:
+            return SnapshotMeta(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+
+
+def query_days(
+    conn: sqlite3.Connection,
+    target_column: str,
+    since_date: str | None = None,
+) -> pd.DataFrame:
+    """Read days with email data (optionally from ``since_date`` on) with parsed dates."""
+
+    query = f"""
+        SELECT
+            date,
+            {target_column} as target,
+            has_email_data,
+            has_sla_data
+        FROM days
+        WHERE has_email_data = 1
+    """
+    params: list[str] = []
+    if since_date:
+        query += " AND date >= ?"
+        params.append(since_date)
+    query += " ORDER BY date"
+
+    with span("data.sqlite_query"):
+        df = pd.read_sql_query(query, conn, params=params)
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def write_snapshot(path: Path, df: pd.DataFrame, meta: SnapshotMeta) -> None:
+    """Atomically replace the snapshot at ``path`` with the columns of ``df``."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+    try:
+        np.save(staging / "date.npy", df["date"].to_numpy(dtype="datetime64[ns]"))
+        target = df["target"].to_numpy()
+        np.save(staging / "target.npy", target.astype(float) if target.dtype == object else target)
+        np.save(staging / "has_email_data.npy", df["has_email_data"].to_numpy(dtype=np.int64))
+        np.save(staging / "has_sla_data.npy", df["has_sla_data"].to_numpy(dtype=np.int64))
+        with open(staging / _META_FILE, "w") as f:
+            json.dump(asdict(meta), f, indent=2)
+
+        backup = None
+        if path.exists():
+            backup = path.with_name(f".{path.name}.old")
+            shutil.rmtree(backup, ignore_errors=True)
+            os.replace(path, backup)
+        os.replace(staging, path)
+        if backup is not None:
+            shutil.rmtree(backup, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logger.info("Wrote days snapshot (%d rows, last_updated=%s) to %s", meta.n_rows, meta.last_updated, path)
+
+
+def read_snapshot(path: Path) -> pd.DataFrame:
+    """Load a snapshot as a DataFrame backed by memory-mapped column arrays.
+
+    The frame is read-only: in-place writes raise ``ValueError: assignment
+    destination is read-only``, so callers that mutate must ``copy()`` it
+    first. A dict built with ``copy=False`` is not consolidated into blocks
+    by pandas, so every column stays a view of its own ``.npy`` map.
+    """
+    columns = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in SNAPSHOT_COLUMNS}
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_days_snapshot(
+    db_path: Path | str,
+    snapshot_dir: Path | str,
+    target_column: str = "total_emails",
+) -> pd.DataFrame:
+    """Return the ``days`` rows for ``target_column``, via a snapshot when current.
+
+    The snapshot is rebuilt from SQLite whenever ``metadata.last_updated``
+    differs from the value recorded alongside it (or no snapshot exists).
+
+    Args:
+        db_path: Path to the SQLite database file
+        snapshot_dir: Directory holding snapshots
+        target_column: Column of ``days`` used as the forecast target
+
+    Returns:
+        DataFrame with columns date, target, has_email_data, has_sla_data sorted
+        by date; read-only when served from the snapshot (see ``read_snapshot``)
+    """
+    path = snapshot_path(snapshot_dir, db_path, target_column)
+
+    with sqlite3.connect(db_path) as conn:
+        last_updated = read_last_updated(conn)
+        meta = read_snapshot_meta(path)
+
+        if last_updated is not None and meta is not None and meta.last_updated == last_updated:
+            logger.info("Using days snapshot %s (last_updated=%s)", path, last_updated)
+            return read_snapshot(path)
+
+        df = query_days(conn, target_column)
+
+    if last_updated is None:
+        logger.warning("Database has no metadata.last_updated; skipping snapshot")
+        return df
+
+    write_snapshot(
+        path,
+        df,
+        SnapshotMeta(
+            db_path=str(Path(db_path).resolve()),
+            target_column=target_column,
+            last_updated=last_updated,
+            n_rows=len(df),
+        ),
+    )
+    return read_snapshot(path)
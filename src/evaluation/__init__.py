@@ -1,6 +1,11 @@
 """Evaluation metrics and utilities for forecast quality assessment."""
 
-from .metrics import calculate_metrics, calculate_baseline_metrics, compare_to_baselines
+from .metrics import (
+    batch_forecast_metrics,
+    calculate_metrics,
+    calculate_baseline_metrics,
+    compare_to_baselines,
+)
 from .plots import (
     plot_forecast_vs_actual,
     plot_residuals,
@@ -11,15 +16,26 @@ from .cross_validation import (
     generate_expanding_window_splits,
     grid_search_prophet,
     aggregate_fold_metrics,
+    aggregate_fold_groups,
+)
+from .checkpoint import FoldCheckpoint
+from .search import (
+    Categorical,
+    LogUniform,
+    successive_halving_prophet,
+    summarize_search,
+    tpe_search_prophet,
 )
 from .calibration import (
     CalibrationParameters,
+    ConformalTable,
     calibrate_forecasts,
     apply_calibration,
 )
 
 __all__ = [
     "calculate_metrics",
+    "batch_forecast_metrics",
     "calculate_baseline_metrics",
     "compare_to_baselines",
     "plot_forecast_vs_actual",
@@ -29,7 +45,15 @@ __all__ = [
     "generate_expanding_window_splits",
     "grid_search_prophet",
     "aggregate_fold_metrics",
+    "aggregate_fold_groups",
+    "FoldCheckpoint",
+    "successive_halving_prophet",
+    "summarize_search",
+    "tpe_search_prophet",
+    "LogUniform",
+    "Categorical",
     "CalibrationParameters",
+    "ConformalTable",
     "calibrate_forecasts",
     "apply_calibration",
 ]
@@ -0,0 +1,218 @@
+"""Vectorized naive-baseline forecasts.
+
+Every baseline is a one-step-ahead prediction built only from earlier
+observations, computed for the whole series at once. Lags are slices,
+trailing and seasonal means come from cumulative sums, and seasonal medians
+from strided window views, so no baseline loops over observations in
+Python. The kernels work on any regular series (daily or hourly); lags and
+windows are expressed in steps of the series.
+
+Baselines are looked up by name in a registry. Parameterized families are
+resolved from the name itself:
+
+- ``seasonal_naive_{lag}``: value ``lag`` steps ago
+- ``moving_average_{window}``: mean of the previous ``window`` steps
+- ``drift``: last value plus the average historical change
+- ``seasonal_mean_{period}``: mean of all earlier values in the same season
+- ``ewma_{alpha}``: exponentially weighted mean of all earlier values
+- ``median_{k}_weeks``: median of the same weekday over the previous k weeks
+
+Custom baselines can be added with ``register_baseline``.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DEFAULT_BASELINES = (
+    "seasonal_naive_7",
+    "seasonal_naive_14",
+    "seasonal_naive_28",
+    "moving_average_7",
+    "moving_average_28",
+    "drift",
+    "seasonal_mean_7",
+    "ewma_0.3",
+    "median_4_weeks",
+)
+
+
+def lagged(y: np.ndarray, lag: int) -> np.ndarray:
+    """Seasonal-naive prediction ``y[i - lag]`` (NaN for the first ``lag`` steps)."""
+
+    if lag <= 0:
+        raise ValueError("lag must be positive")
+
+    pred = np.full(y.shape, np.nan)
+    if lag < len(y):
+        pred[lag:] = y[:-lag]
+    return pred
+
+
+def trailing_mean(y: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the previous ``window`` observations (fewer at the start).
+
+    ``pred[0]`` is ``y[0]``, matching the original moving-average baseline.
+    """
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    n_obs = len(y)
+    csum = np.concatenate(([0.0], np.cumsum(y, dtype=float)))
+    stop = np.arange(n_obs)
+    start = np.maximum(stop - window, 0)
+    counts = stop - start
+
+    pred = np.empty(n_obs)
+    pred[1:] = (csum[stop[1:]] - csum[start[1:]]) / counts[1:]
+    if n_obs:
+        pred[0] = y[0]
+    return pred
+
+
+def baseline_predictions(
+    y: np.ndarray,
+    lags: Sequence[int] = (7,),
+    windows: Sequence[int] = (7,),
+) -> dict[str, tuple[np.ndarray, int]]:
+    """Predictions for every seasonal lag and trailing-mean window in one pass.
+
+    Args:
+        y: Observed series
+        lags: Seasonal-naive lags
+        windows: Trailing moving-average windows
+
+    Returns:
+        Mapping of baseline name to (predictions, first index with a full
+        history). Names are ``seasonal_naive_{lag}`` and ``moving_average_{window}``.
+    """
+    names = [*(f"seasonal_naive_{lag}" for lag in lags), *(f"moving_average_{window}" for window in windows)]
+    return compute_baselines(y, names)
+
+
+def drift(y: np.ndarray) -> np.ndarray:
+    """Random walk with drift: ``y[i-1] + (y[i-1] - y[0]) / (i - 1)``."""
+
+    pred = np.full(y.shape, np.nan)
+    if len(y) > 2:
+        steps = np.arange(1, len(y) - 1)
+        pred[2:] = y[1:-1] + (y[1:-1] - y[0]) / steps
+    return pred
+
+
+def seasonal_mean(y: np.ndarray, period: int) -> np.ndarray:
+    """Mean of every earlier observation in the same season (phase mod ``period``)."""
+
+    if period <= 0:
+        raise ValueError("period must be positive")
+
+    pred = np.full(y.shape, np.nan)
+    for phase in range(min(period, len(y))):
+        values = y[phase::period]
+        if len(values) > 1:
+            csum = np.cumsum(values[:-1], dtype=float)
+            pred[phase + period :: period] = csum / np.arange(1, len(values))
+    return pred
+
+
+def ewma(y: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean of all earlier observations."""
+
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+
+    pred = np.full(y.shape, np.nan)
+    if len(y) > 1:
+        smoothed = pd.Series(y[:-1]).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        pred[1:] = smoothed
+    return pred
+
+
+def seasonal_median(y: np.ndarray, period: int, k: int) -> np.ndarray:
+    """Median of ``y[i - period * j]`` for ``j = 1..k``, via a strided view."""
+
+    if period <= 0 or k <= 0:
+        raise ValueError("period and k must be positive")
+
+    pred = np.full(y.shape, np.nan)
+    span = period * k
+    if len(y) > span:
+        # Window t covers y[t : t + span]; every period-th element of it is one of
+        # the k same-season values preceding index t + span.
+        windows = sliding_window_view(y[:-1], span)[:, ::period]
+        pred[span:] = np.median(windows, axis=1)
+    return pred
+
+
+@dataclass(slots=True, frozen=True)
+class BaselineSpec:
+    """A named baseline and the first index at which it has full history."""
+
+    name: str
+    predict: Callable[[np.ndarray], np.ndarray]
+    min_history: int
+
+
+_REGISTRY: dict[str, BaselineSpec] = {}
+
+_FAMILY = re.compile(
+    r"(?P<family>seasonal_naive|moving_average|seasonal_mean)_(?P<steps>\d+)"
+    r"|ewma_(?P<alpha>\d*\.?\d+)"
+    r"|median_(?P<weeks>\d+)_weeks"
+    r"|drift"
+)
+
+
+def _family_spec(name: str, match: re.Match[str]) -> BaselineSpec:
+    if match.group("family"):
+        steps = int(match.group("steps"))
+        kernel = {"seasonal_naive": lagged, "moving_average": trailing_mean, "seasonal_mean": seasonal_mean}
+        fn = kernel[match.group("family")]
+        return BaselineSpec(name, lambda y: fn(y, steps), steps)
+    if match.group("alpha"):
+        alpha = float(match.group("alpha"))
+        return BaselineSpec(name, lambda y: ewma(y, alpha), 1)
+    if match.group("weeks"):
+        weeks = int(match.group("weeks"))
+        return BaselineSpec(name, lambda y: seasonal_median(y, 7, weeks), 7 * weeks)
+    return BaselineSpec(name, drift, 2)
+
+
+def register_baseline(name: str, predict: Callable[[np.ndarray], np.ndarray], min_history: int) -> None:
+    """Register a custom baseline (``predict`` maps the series to predictions)."""
+
+    _REGISTRY[name] = BaselineSpec(name, predict, min_history)
+
+
+def resolve_baseline(name: str) -> BaselineSpec:
+    """Look up a registered baseline or build one from a family name.
+
+    Raises:
+        KeyError: If the name matches no registered baseline or family
+    """
+    if name in _REGISTRY:
+        return _REGISTRY[name]
+    match = _FAMILY.fullmatch(name)
+    if match:
+        return _family_spec(name, match)
+    raise KeyError(f"Unknown baseline: {name}")
+
+
+def compute_baselines(y: np.ndarray, names: Sequence[str] = DEFAULT_BASELINES) -> dict[str, tuple[np.ndarray, int]]:
+    """Predictions for every named baseline over the whole series.
+
+    Returns:
+        Mapping of name to (predictions, first index with a full history)
+    """
+    y = np.asarray(y, dtype=float)
+    predictions: dict[str, tuple[np.ndarray, int]] = {}
+    for name in names:
+        spec = resolve_baseline(name)
+        predictions[name] = (spec.predict(y), spec.min_history)
+    return predictions
@@ -1,16 +1,65 @@
-"""Calibration utilities for Prophet forecasts."""
+"""Calibration utilities for Prophet forecasts.
+
+Two interval calibrations are available. ``"scale"`` widens or narrows
+Prophet's intervals by one global factor nudged toward the target coverage.
+The conformal methods (``"absolute"`` and ``"cqr"``) build a table of
+residual quantiles from the pooled CV predictions once, optionally per day of
+week. Calibrating any forecast is then a table lookup, and the split-
+conformal guarantee puts coverage at (or just above) the target.
+
+When the CV predictions carry a quantile grid (``yhat_p10``, ``yhat_p50``,
+...), each quantile column also gets an additive offset. The offset is
+chosen so the share of CV actuals at or below the shifted quantile matches
+its level.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Literal
 
 import numpy as np
 import pandas as pd
 
+from champion_prophet.timing import timed
+
 from .metrics import calculate_coverage
 
 
+CalibrationMethod = Literal["scale", "absolute", "cqr"]
+
+# Conformal table key for the pooled (all days) quantile
+POOLED = -1
+
+
+@dataclass(slots=True)
+class ConformalTable:
+    """Conformal score quantiles, pooled and optionally per day-of-week.
+
+    Attributes:
+        method: "absolute" (scores ``|y - yhat|``, intervals ``yhat ± q``) or
+            "cqr" (scores ``max(lower - y, y - upper)``, intervals
+            ``[lower - q, upper + q]``)
+        quantiles: Score quantile by day-of-week (0=Monday), with ``POOLED``
+            used for days missing from the table
+        n_samples: Calibration scores behind each quantile
+    """
+
+    method: str
+    quantiles: Dict[int, float]
+    n_samples: Dict[int, int] = field(default_factory=dict)
+
+    def lookup(self, dows: np.ndarray) -> np.ndarray:
+        """Quantile for each day-of-week code (pooled where no DOW entry exists)."""
+
+        table = np.full(7, self.quantiles[POOLED])
+        for dow, quantile in self.quantiles.items():
+            if dow != POOLED:
+                table[dow] = quantile
+        return table[np.asarray(dows, dtype=np.intp)]
+
+
 @dataclass(slots=True)
 class CalibrationParameters:
     """Holds bias and interval adjustments."""
@@ -19,6 +68,23 @@ class CalibrationParameters:
     interval_scale: float
     target_coverage: float
     observed_coverage: float
+    method: str = "scale"
+    conformal: ConformalTable | None = None
+    quantile_offsets: Dict[str, float] = field(default_factory=dict)
+
+
+_QUANTILE_COLUMN = re.compile(r"yhat_p(\d+(?:\.\d+)?)")
+
+
+def quantile_levels(df: pd.DataFrame) -> dict[str, float]:
+    """Quantile columns (``yhat_p*``) of a forecast frame mapped to their level, lowest first."""
+
+    levels = {}
+    for column in df.columns:
+        match = _QUANTILE_COLUMN.fullmatch(str(column))
+        if match:
+            levels[column] = float(match.group(1)) / 100
+    return dict(sorted(levels.items(), key=lambda item: item[1]))
 
 
 def compute_dow_bias(residuals: pd.Series, dates: pd.Series, shrinkage: float = 1.0) -> dict[int, float]:
@@ -36,7 +102,7 @@ def apply_dow_bias(forecast_df: pd.DataFrame, dow_bias: dict[int, float]) -> pd.
     dows = pd.to_datetime(df["ds"]).dt.dayofweek
     adjustments = dows.map(dow_bias).fillna(0.0)
 
-    for col in ["yhat", "yhat_lower", "yhat_upper"]:
+    for col in ["yhat", "yhat_lower", "yhat_upper", *quantile_levels(df)]:
         df[col] = df[col] + adjustments
 
     df["bias_adjustment"] = adjustments
@@ -85,12 +151,144 @@ def apply_interval_scaling(
     return df
 
 
+def compute_quantile_offsets(cv_predictions: pd.DataFrame) -> dict[str, float]:
+    """Shift per quantile column so its CV hit rate matches its level.
+
+    For a column at level ``tau`` the offset is the ``tau`` quantile of
+    ``y - yhat_p{tau}``, all columns in one vectorized call.
+    """
+    levels = quantile_levels(cv_predictions)
+    if not levels:
+        return {}
+
+    y = cv_predictions["y"].to_numpy(dtype=float)[:, None]
+    gaps = y - cv_predictions[list(levels)].to_numpy(dtype=float)
+    offsets = np.quantile(gaps, list(levels.values()), axis=0).diagonal()
+    return {column: float(offset) for column, offset in zip(levels, offsets)}
+
+
+def apply_quantile_offsets(forecast_df: pd.DataFrame, offsets: dict[str, float]) -> pd.DataFrame:
+    """Shift quantile columns by their offsets, keeping the grid non-crossing."""
+
+    df = forecast_df.copy()
+    columns = [column for column in quantile_levels(df) if column in offsets]
+    if not columns:
+        return df
+
+    shifted = df[columns].to_numpy(dtype=float) + np.array([offsets[column] for column in columns])
+    df[columns] = np.maximum.accumulate(shifted, axis=1)
+    return df
+
+
+def conformal_scores(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_lower: np.ndarray,
+    y_upper: np.ndarray,
+    method: str,
+) -> np.ndarray:
+    """Nonconformity score of each calibration point for ``method``."""
+
+    if method == "absolute":
+        return np.abs(y_true - y_pred)
+    if method == "cqr":
+        return np.maximum(y_lower - y_true, y_true - y_upper)
+    raise ValueError(f"Unknown conformal method: {method}")
+
+
+def _conformal_rank(n_scores: np.ndarray, target_coverage: float) -> np.ndarray:
+    """1-based rank ``ceil((n + 1) * coverage)`` of the conformal quantile."""
+
+    return np.ceil((n_scores + 1) * target_coverage - 1e-9).astype(np.intp)
+
+
+def build_conformal_table(
+    scores: np.ndarray,
+    dows: np.ndarray,
+    target_coverage: float,
+    method: str,
+    per_dow: bool = False,
+) -> ConformalTable:
+    """Split-conformal quantiles of ``scores``, pooled and optionally per DOW.
+
+    Scores are sorted once by (day, score); each day's quantile is then read
+    at its conformal rank. Days with too few scores for that rank (fewer
+    than about ``coverage / (1 - coverage)``) fall back to the pooled value.
+
+    Raises:
+        ValueError: If there are no scores or too few for the pooled quantile
+    """
+    scores = np.asarray(scores, dtype=float)
+    dows = np.asarray(dows, dtype=np.intp)
+    if scores.size == 0:
+        raise ValueError("Conformal calibration needs at least one CV prediction")
+
+    pooled = np.sort(scores)
+    rank = int(_conformal_rank(np.array(len(pooled)), target_coverage))
+    if rank > len(pooled):
+        raise ValueError(
+            f"{len(pooled)} CV predictions are too few for a {target_coverage:.0%} conformal interval"
+        )
+    quantiles = {POOLED: float(pooled[rank - 1])}
+    n_samples = {POOLED: len(pooled)}
+
+    if per_dow:
+        order = np.lexsort((scores, dows))
+        sorted_scores = scores[order]
+        counts = np.bincount(dows, minlength=7)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ranks = _conformal_rank(counts, target_coverage)
+        usable = np.flatnonzero((counts > 0) & (ranks <= counts))
+        for dow, value in zip(usable, sorted_scores[starts[usable] + ranks[usable] - 1]):
+            quantiles[int(dow)] = float(value)
+            n_samples[int(dow)] = int(counts[dow])
+
+    return ConformalTable(method=method, quantiles=quantiles, n_samples=n_samples)
+
+
+def apply_conformal_intervals(forecast_df: pd.DataFrame, table: ConformalTable) -> pd.DataFrame:
+    """Replace prediction intervals with conformal ones looked up from ``table``."""
+
+    df = forecast_df.copy()
+    margin = table.lookup(pd.to_datetime(df["ds"]).dt.dayofweek.to_numpy())
+    if table.method == "absolute":
+        df["yhat_lower"] = df["yhat"] - margin
+        df["yhat_upper"] = df["yhat"] + margin
+    else:
+        df["yhat_lower"] = df["yhat_lower"] - margin
+        df["yhat_upper"] = df["yhat_upper"] + margin
+    df["conformal_margin"] = margin
+    return df
+
+
+@timed("calibration.calibrate_forecasts")
 def calibrate_forecasts(
     cv_predictions: pd.DataFrame,
     target_coverage: float,
     bias_shrinkage: float = 0.5,
+    method: CalibrationMethod = "scale",
+    per_dow: bool = False,
 ) -> CalibrationParameters:
-    """Derive calibration parameters from cross-validation predictions."""
+    """Derive calibration parameters from cross-validation predictions.
+
+    Args:
+        cv_predictions: Pooled CV forecasts with ds, y, yhat, yhat_lower, yhat_upper
+            (plus optional ``yhat_p*`` quantile columns)
+        target_coverage: Desired interval coverage (e.g. 0.80)
+        bias_shrinkage: Fraction of the mean DOW residual applied as bias correction
+        method: "scale" (global interval scale), "absolute" (split conformal on
+            absolute residuals) or "cqr" (conformalized quantile regression on
+            Prophet's intervals)
+        per_dow: Conformal methods only; build one quantile per day-of-week
+
+    Returns:
+        Calibration parameters for ``apply_calibration``
+
+    Raises:
+        ValueError: If ``method`` is unknown
+    """
+    if method not in ("scale", "absolute", "cqr"):
+        raise ValueError(f"Unknown calibration method: {method}")
 
     residuals = cv_predictions["y"] - cv_predictions["yhat"]
     dow_bias = compute_dow_bias(residuals, cv_predictions["ds"], shrinkage=bias_shrinkage)
@@ -102,14 +300,35 @@ def calibrate_forecasts(
         target_coverage=target_coverage,
     )
 
+    # Score the bias-corrected forecasts, as apply_calibration will produce them
+    adjusted = apply_dow_bias(cv_predictions, dow_bias)
+    quantile_offsets = compute_quantile_offsets(adjusted)
+
+    conformal = None
+    if method != "scale":
+        scores = conformal_scores(
+            adjusted["y"].to_numpy(dtype=float),
+            adjusted["yhat"].to_numpy(dtype=float),
+            adjusted["yhat_lower"].to_numpy(dtype=float),
+            adjusted["yhat_upper"].to_numpy(dtype=float),
+            method,
+        )
+        dows = pd.to_datetime(adjusted["ds"]).dt.dayofweek.to_numpy()
+        conformal = build_conformal_table(scores, dows, target_coverage, method, per_dow=per_dow)
+        interval_scale = 1.0
+
     return CalibrationParameters(
         dow_bias=dow_bias,
         interval_scale=interval_scale,
         target_coverage=target_coverage,
         observed_coverage=observed,
+        method=method,
+        conformal=conformal,
+        quantile_offsets=quantile_offsets,
     )
 
 
+@timed("calibration.apply_calibration")
 def apply_calibration(
     forecast_df: pd.DataFrame,
     calibration: CalibrationParameters,
@@ -117,5 +336,9 @@ def apply_calibration(
     """Apply bias and interval calibration to forecasts."""
 
     df = apply_dow_bias(forecast_df, calibration.dow_bias)
+    if calibration.quantile_offsets:
+        df = apply_quantile_offsets(df, calibration.quantile_offsets)
+    if calibration.conformal is not None:
+        return apply_conformal_intervals(df, calibration.conformal)
     df = apply_interval_scaling(df, calibration.interval_scale)
     return df
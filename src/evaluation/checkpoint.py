@@ -0,0 +1,147 @@
+"""Append-only checkpoints of finished cross-validation cells.
+
+A Phase 2 sweep runs hundreds of (config, fold) fits and used to keep every
+result in memory until the final metrics dump, so an interrupted run lost
+all of its work. ``FoldCheckpoint`` appends each finished cell to a JSONL
+file as one line written with a single ``O_APPEND`` write and ``fsync``.
+This is safe across threads and processes. A torn last line from a crash
+is ignored on reload. Cells are keyed by their config and fold window, so a
+resumed run of any search strategy skips exactly the cells already on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .cross_validation import FoldResult, FoldSplit
+
+logger = logging.getLogger(__name__)
+
+
+def cell_key(config: dict[str, Any], split: FoldSplit) -> str:
+    """Stable identifier of one (config, fold window) cell."""
+
+    return json.dumps(
+        {
+            "config": config,
+            "train": [str(split.train_start), str(split.train_end)],
+            "test": [str(split.test_start), str(split.test_end)],
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class FoldCheckpoint:
+    """JSONL checkpoint of completed (config, fold) cells for one run.
+
+    Attributes:
+        path: Checkpoint file (one JSON record per finished cell)
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._completed: dict[str, dict[str, Any]] | None = None
+
+    @classmethod
+    def for_run(cls, checkpoint_dir: Path | str, run_id: str) -> FoldCheckpoint:
+        """Checkpoint file for ``run_id`` under ``checkpoint_dir``."""
+
+        return cls(Path(checkpoint_dir) / f"{run_id}.jsonl")
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Workers only append; they never need the parent's loaded records
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self._lock = threading.Lock()
+        self._completed = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        records: dict[str, dict[str, Any]] = {}
+        if not self.path.exists():
+            return records
+
+        with open(self.path) as fh:
+            for line_no, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring unreadable checkpoint line %d in %s", line_no, self.path)
+                    continue
+                records[record["key"]] = record
+
+        logger.info("Loaded %d completed CV cells from %s", len(records), self.path)
+        return records
+
+    @property
+    def completed(self) -> dict[str, dict[str, Any]]:
+        """Checkpointed records by cell key (loaded on first access)."""
+
+        if self._completed is None:
+            self._completed = self._load()
+        return self._completed
+
+    def get(self, config: dict[str, Any], split: FoldSplit, fold_id: int) -> FoldResult | None:
+        """Rebuild the checkpointed result for a cell, or None if it has not finished."""
+
+        record = self.completed.get(cell_key(config, split))
+        if record is None:
+            return None
+
+        forecast = pd.DataFrame(record["forecast"])
+        if "ds" in forecast.columns:
+            forecast["ds"] = pd.to_datetime(forecast["ds"])
+        return FoldResult(
+            fold_id=fold_id,
+            split=split,
+            metrics=record["metrics"],
+            forecast=forecast,
+            fit_seconds=record["fit_seconds"],
+            interval_width=record.get("interval_width", 0.80),
+        )
+
+    def record(self, config: dict[str, Any], result: FoldResult) -> None:
+        """Append one finished cell with a single atomic write."""
+
+        forecast = result.forecast.copy()
+        if "ds" in forecast.columns:
+            forecast["ds"] = forecast["ds"].dt.strftime("%Y-%m-%d")
+        payload = {
+            "key": cell_key(config, result.split),
+            "fold_id": result.fold_id,
+            "metrics": result.metrics,
+            "fit_seconds": result.fit_seconds,
+            "interval_width": result.interval_width,
+            "forecast": forecast.to_dict(orient="list"),
+        }
+        line = (json.dumps(payload, default=_json_default) + "\n").encode()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if self._completed is not None:
+                self._completed[payload["key"]] = payload
@@ -4,16 +4,34 @@ from __future__ import annotations
 
 import itertools
 import logging
+import math
+import os
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Any, Iterable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 
-from .metrics import calculate_metrics
+from champion_prophet.timing import get_recorder, merge_timings, timed
+
+from .executors import ExecutorKind, derive_task_seed, map_tasks, uses_process_pool
+from .metrics import MetricBatch, calculate_metrics
+from .shared_frame import SharedFrameHandle, can_share, resolve_frame, share_frame
+from models.fit_cache import FitCache
 from models.prophet_daily import ProphetDailyModel
+from models.uncertainty import DEFAULT_QUANTILES, quantile_column
+from models.warm_start import WarmStartState
+
+if TYPE_CHECKING:
+    from .checkpoint import FoldCheckpoint
 
 logger = logging.getLogger(__name__)
 
+# Aggregated metrics a search can minimise (all lower-is-better)
+OBJECTIVES = ("mae", "rmse", "pinball", "crps", "winkler")
+
 
 @dataclass(slots=True)
 class FoldSplit:
@@ -35,6 +53,21 @@ class FoldResult:
     split: FoldSplit
     metrics: dict[str, Any]
     forecast: pd.DataFrame
+    fit_seconds: float = 0.0
+    warm_start_state: WarmStartState | None = None
+    timings: dict[str, dict[str, float]] | None = None
+    interval_width: float = 0.80
+
+
+@dataclass(slots=True)
+class FoldTask:
+    """A single (config, fold) cell scheduled by the CV engine."""
+
+    config_index: int
+    fold_index: int
+    config: dict[str, Any]
+    split: FoldSplit
+    seed: int
 
 
 def generate_expanding_window_splits(
@@ -91,42 +124,299 @@ def generate_expanding_window_splits(
     return splits
 
 
+@timed("cv.run_prophet_fold")
 def run_prophet_fold(
     df: pd.DataFrame,
     split: FoldSplit,
     model_config: dict[str, Any],
     regressor_columns: Sequence[str],
+    seed: int | None = None,
+    warm_start: WarmStartState | None = None,
+    cache: FitCache | None = None,
+    score: bool = True,
 ) -> FoldResult:
-    """Run a single Prophet fold and collect metrics."""
-
-    train_df = df.iloc[split.train_indices].copy()
-    test_df = df.iloc[split.test_indices].copy()
+    """Run a single Prophet fold and collect metrics.
+
+    When ``seed`` is given it drives the interval sampler, so the uncertainty
+    intervals do not depend on which worker ran the fold or what it ran
+    before. ``warm_start`` seeds the optimizer from a previous fold's fit;
+    the fitted state of this fold is returned on the result so callers can
+    chain folds. ``cache`` lets identical (config, regressors, training
+    slice) fits be reused across runs. With ``score=False`` only the fit
+    timings are recorded; the CV engine scores all cells at once with
+    ``score_fold_results``. The fold forecast carries the ``DEFAULT_QUANTILES``
+    grid so calibration can recalibrate every quantile, and a per-day
+    ``crps`` column from the same uncertainty samples.
+    """
+
+    # Positional slices, not copies: fitting and prediction never mutate them
+    train_df = df.iloc[split.train_indices.start : split.train_indices.stop]
+    test_df = df.iloc[split.test_indices.start : split.test_indices.stop]
 
     model = ProphetDailyModel(**model_config)
     if regressor_columns:
         model.add_regressors(list(regressor_columns))
 
-    model.fit(train_df)
-    forecast = model.forecast_holdout(test_df)
+    model.fit(train_df, warm_start=warm_start, cache=cache)
+    forecast = model.forecast_holdout(test_df, seed=seed, quantiles=DEFAULT_QUANTILES, crps=True)
 
-    forecast_df = forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].merge(
+    columns = ["ds", "yhat", "yhat_lower", "yhat_upper", *map(quantile_column, DEFAULT_QUANTILES), "crps"]
+    forecast_df = forecast[columns].merge(
         test_df[["ds", "y"]], on="ds", how="left"
     )
 
-    metrics = calculate_metrics(
-        y_true=forecast_df["y"],
-        y_pred=forecast_df["yhat"],
-        y_lower=forecast_df["yhat_lower"],
-        y_upper=forecast_df["yhat_upper"],
-        dates=forecast_df["ds"],
-    )
+    metrics: dict[str, Any] = {}
+    if score:
+        metrics = calculate_metrics(
+            y_true=forecast_df["y"],
+            y_pred=forecast_df["yhat"],
+            y_lower=forecast_df["yhat_lower"],
+            y_upper=forecast_df["yhat_upper"],
+            dates=forecast_df["ds"],
+            interval_width=model.config["interval_width"],
+            y_quantiles={level: forecast_df[quantile_column(level)] for level in DEFAULT_QUANTILES},
+        )
+        metrics["crps"] = float(forecast_df["crps"].mean())
+    metrics["fit_seconds"] = model.fit_seconds
+    metrics["fit_cache_hit"] = int(model.fit_from_cache)
 
     return FoldResult(
         fold_id=len(forecast_df),  # placeholder, caller can override
         split=split,
         metrics=metrics,
         forecast=forecast_df,
+        fit_seconds=model.fit_seconds or 0.0,
+        warm_start_state=model.warm_start_state(),
+        interval_width=model.config["interval_width"],
+    )
+
+
+def _run_fold_task(
+    task: FoldTask,
+    df: pd.DataFrame | SharedFrameHandle,
+    regressor_columns: Sequence[str],
+    cache: FitCache | None = None,
+    checkpoint: FoldCheckpoint | None = None,
+    parent_pid: int | None = None,
+) -> FoldResult:
+    """Execute one scheduled fold task (module-level so it pickles)."""
+
+    in_worker = parent_pid is not None and os.getpid() != parent_pid
+    if in_worker:
+        get_recorder().reset()
+
+    result = run_prophet_fold(
+        resolve_frame(df), task.split, task.config, regressor_columns, seed=task.seed, cache=cache, score=False
+    )
+    result.fold_id = task.fold_index
+    if checkpoint is not None:
+        checkpoint.record(task.config, result)
+    if in_worker:
+        result.timings = get_recorder().snapshot()
+    return result
+
+
+def _run_fold_chain(
+    chain: list[FoldTask],
+    df: pd.DataFrame | SharedFrameHandle,
+    regressor_columns: Sequence[str],
+    cache: FitCache | None = None,
+    checkpoint: FoldCheckpoint | None = None,
+    parent_pid: int | None = None,
+) -> list[FoldResult]:
+    """Run one config's folds in order, warm-starting each from the previous fit."""
+
+    in_worker = parent_pid is not None and os.getpid() != parent_pid
+    if in_worker:
+        get_recorder().reset()
+
+    df = resolve_frame(df)
+    results: list[FoldResult] = []
+    state: WarmStartState | None = None
+    for task in chain:
+        result = run_prophet_fold(
+            df,
+            task.split,
+            task.config,
+            regressor_columns,
+            seed=task.seed,
+            warm_start=state,
+            cache=cache,
+            score=False,
+        )
+        result.fold_id = task.fold_index
+        if checkpoint is not None:
+            checkpoint.record(task.config, result)
+        state = result.warm_start_state
+        results.append(result)
+    if in_worker and results:
+        # The chain's spans ride back on its last result
+        results[-1].timings = get_recorder().snapshot()
+    return results
+
+
+def run_fold_tasks(
+    df: pd.DataFrame,
+    tasks: Sequence[FoldTask],
+    regressor_columns: Sequence[str],
+    executor: ExecutorKind | Executor = "serial",
+    n_jobs: int | None = None,
+    warm_start: bool = False,
+    cache: FitCache | None = None,
+    checkpoint: FoldCheckpoint | None = None,
+) -> list[FoldResult]:
+    """Run fold tasks on the chosen executor, preserving task order.
+
+    With ``warm_start`` the tasks of each config are grouped into a chain that
+    runs its folds in order on one worker, so each fold's fit is initialised
+    from the previous (smaller) training window. Chains still run in parallel.
+    With a ``checkpoint``, cells already recorded there are restored instead
+    of refitted and every newly finished cell is appended as it completes.
+    A resumed warm-start chain starts cold after its last restored cell.
+    Every result is scored in one batched call (see ``score_fold_results``).
+    """
+
+    if checkpoint is None:
+        results = _run_pending(df, tasks, regressor_columns, executor, n_jobs, warm_start, cache, None)
+        score_fold_results(results)
+        return results
+
+    restored: dict[int, FoldResult] = {}
+    for idx, task in enumerate(tasks):
+        result = checkpoint.get(task.config, task.split, task.fold_index)
+        if result is not None:
+            restored[idx] = result
+    if restored:
+        logger.info("Restored %d of %d CV cells from checkpoint", len(restored), len(tasks))
+
+    pending = [task for idx, task in enumerate(tasks) if idx not in restored]
+    fresh = iter(_run_pending(df, pending, regressor_columns, executor, n_jobs, warm_start, cache, checkpoint))
+    results = [restored[idx] if idx in restored else next(fresh) for idx in range(len(tasks))]
+    score_fold_results(results)
+    return results
+
+
+def _run_pending(
+    df: pd.DataFrame,
+    tasks: Sequence[FoldTask],
+    regressor_columns: Sequence[str],
+    executor: ExecutorKind | Executor,
+    n_jobs: int | None,
+    warm_start: bool,
+    cache: FitCache | None,
+    checkpoint: FoldCheckpoint | None,
+) -> list[FoldResult]:
+    """Fit every task (see ``run_fold_tasks``), recording each to ``checkpoint``.
+
+    For process pools the frame is published once in shared memory and tasks
+    carry only its handle, and the workers' timing spans are merged back into
+    this process's recorder.
+    """
+    n_units = len({task.config_index for task in tasks}) if warm_start else len(tasks)
+    if uses_process_pool(executor, n_jobs, n_units) and can_share(df):
+        with share_frame(df) as handle:
+            results = _dispatch(handle, tasks, regressor_columns, executor, n_jobs, warm_start, cache, checkpoint)
+    else:
+        results = _dispatch(df, tasks, regressor_columns, executor, n_jobs, warm_start, cache, checkpoint)
+
+    for result in results:
+        merge_timings(result.timings)
+        result.timings = None
+    return results
+
+
+def _dispatch(
+    df: pd.DataFrame | SharedFrameHandle,
+    tasks: Sequence[FoldTask],
+    regressor_columns: Sequence[str],
+    executor: ExecutorKind | Executor,
+    n_jobs: int | None,
+    warm_start: bool,
+    cache: FitCache | None,
+    checkpoint: FoldCheckpoint | None,
+) -> list[FoldResult]:
+    regressors = list(regressor_columns)
+    if not warm_start:
+        worker = partial(
+            _run_fold_task,
+            df=df,
+            regressor_columns=regressors,
+            cache=cache,
+            checkpoint=checkpoint,
+            parent_pid=os.getpid(),
+        )
+        return map_tasks(worker, tasks, executor=executor, n_jobs=n_jobs)
+
+    chains: dict[int, list[FoldTask]] = {}
+    for task in tasks:
+        chains.setdefault(task.config_index, []).append(task)
+    for chain in chains.values():
+        chain.sort(key=lambda task: task.fold_index)
+
+    chain_worker = partial(
+        _run_fold_chain,
+        df=df,
+        regressor_columns=regressors,
+        cache=cache,
+        checkpoint=checkpoint,
+        parent_pid=os.getpid(),
     )
+    chain_results = map_tasks(chain_worker, list(chains.values()), executor=executor, n_jobs=n_jobs)
+
+    by_key = {
+        (config_index, result.fold_id): result
+        for config_index, results in zip(chains, chain_results)
+        for result in results
+    }
+    return [by_key[(task.config_index, task.fold_index)] for task in tasks]
+
+
+def _stack_column(fold_results: Sequence[FoldResult], column: str, horizon: int) -> np.ndarray:
+    """One forecast column of every fold as a NaN-padded (folds x horizon) array."""
+
+    stacked = np.full((len(fold_results), horizon), np.nan)
+    for row, fold in enumerate(fold_results):
+        if column in fold.forecast.columns:
+            values = fold.forecast[column].to_numpy(dtype=float)
+            stacked[row, : len(values)] = values
+    return stacked
+
+
+def fold_metric_batch(fold_results: Sequence[FoldResult]) -> MetricBatch:
+    """Score stacked fold forecasts in one vectorized pass.
+
+    Besides the point and interval metrics this covers the pinball loss over
+    the ``DEFAULT_QUANTILES`` columns, the Winkler score at each fold's
+    interval width, and the forecasts' ``crps`` column. Folds missing a
+    column (e.g. restored from an older checkpoint) score NaN on it.
+    """
+    horizon = max((len(fold.forecast) for fold in fold_results), default=0)
+    stack = partial(_stack_column, fold_results, horizon=horizon)
+    quantile_preds = np.stack([stack(quantile_column(level)) for level in DEFAULT_QUANTILES], axis=-1)
+    return MetricBatch.from_arrays(
+        stack("y"),
+        stack("yhat"),
+        stack("yhat_lower"),
+        stack("yhat_upper"),
+        interval_width=[fold.interval_width for fold in fold_results],
+        quantile_preds=quantile_preds,
+        quantile_levels=DEFAULT_QUANTILES,
+        crps=stack("crps"),
+    )
+
+
+def score_fold_results(fold_results: Sequence[FoldResult]) -> MetricBatch:
+    """Compute every fold's point and interval metrics in one batched call.
+
+    The scores are written into each ``fold.metrics`` ahead of its fit
+    timings, replacing any earlier values.
+    """
+    batch = fold_metric_batch(fold_results)
+    per_row = batch.metrics()
+    for row, fold in enumerate(fold_results):
+        scored = {key: values[row].item() for key, values in per_row.items()}
+        fold.metrics = {**scored, **{key: value for key, value in fold.metrics.items() if key not in scored}}
+    return batch
 
 
 def aggregate_fold_metrics(fold_results: Iterable[FoldResult]) -> dict[str, Any]:
@@ -147,57 +437,168 @@ def aggregate_fold_metrics(fold_results: Iterable[FoldResult]) -> dict[str, Any]
     return aggregated
 
 
+def aggregate_fold_groups(
+    fold_results: Sequence[FoldResult],
+    groups: Sequence[int],
+) -> list[dict[str, Any]]:
+    """Aggregate many configs' folds at once.
+
+    ``groups`` gives the config id (0..G-1) of each fold. Every group gets the
+    per-fold averages of ``aggregate_fold_metrics`` plus a ``"pooled"`` entry
+    scoring all of its forecast steps together. All metrics come from a
+    single vectorized pass over the stacked forecasts.
+    """
+    if not fold_results:
+        raise ValueError("No fold metrics to aggregate")
+
+    group_ids = np.asarray(groups, dtype=np.intp)
+    batch = fold_metric_batch(fold_results)
+    means = batch.group_means(group_ids)
+    pooled = batch.pool(group_ids).metrics()
+    counts = np.bincount(group_ids)
+    extras = {
+        key: np.bincount(group_ids, weights=[fold.metrics.get(key) or 0.0 for fold in fold_results]) / counts
+        for key in ("fit_seconds", "fit_cache_hit")
+    }
+
+    aggregated: list[dict[str, Any]] = []
+    for group in range(len(counts)):
+        entry: dict[str, Any] = {key: values[group].item() for key, values in means.items()}
+        entry.update({key: values[group].item() for key, values in extras.items()})
+        entry["n_folds"] = int(counts[group])
+        entry["pooled"] = {key: values[group].item() for key, values in pooled.items()}
+        aggregated.append(entry)
+    return aggregated
+
+
+def validate_objective(objective: str) -> None:
+    """Raise ValueError unless ``objective`` is one of ``OBJECTIVES``."""
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown search objective: {objective} (expected one of {', '.join(OBJECTIVES)})")
+
+
+def with_default_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Fill in model defaults for any params the search space leaves out."""
+
+    config.setdefault("interval_width", 0.80)
+    config.setdefault("weekly_seasonality", True)
+    config.setdefault("yearly_seasonality", False)
+    config.setdefault("daily_seasonality", False)
+    config.setdefault("growth", "linear")
+    return config
+
+
+def expand_param_grid(param_grid: dict[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Cartesian product of ``param_grid`` as model configs, in grid order."""
+
+    grid_keys = list(param_grid.keys())
+    return [
+        with_default_config(dict(zip(grid_keys, combo)))
+        for combo in itertools.product(*(param_grid[key] for key in grid_keys))
+    ]
+
+
 def grid_search_prophet(
     df: pd.DataFrame,
     splits: list[FoldSplit],
     param_grid: dict[str, Sequence[Any]],
     regressor_columns: Sequence[str],
+    executor: ExecutorKind | Executor = "serial",
+    n_jobs: int | None = None,
+    random_seed: int = 42,
+    warm_start: bool = False,
+    fit_cache: FitCache | None = None,
+    checkpoint: FoldCheckpoint | None = None,
+    objective: str = "mae",
 ) -> tuple[dict[str, Any], list[FoldResult], list[dict[str, Any]]]:
-    """Run grid search over Prophet hyperparameters."""
-
-    grid_keys = list(param_grid.keys())
-    all_combinations = list(itertools.product(*(param_grid[key] for key in grid_keys)))
-    logger.info("Evaluating %d hyperparameter combinations", len(all_combinations))
+    """Run grid search over Prophet hyperparameters.
+
+    Every (config, fold) pair is scheduled up front on the chosen executor.
+    Each task is seeded from ``(random_seed, config_index, fold_index)``, so
+    serial, thread, and process runs return identical results in grid order.
+    With ``warm_start`` each config's folds are fitted in sequence and seeded
+    from the previous fold's parameters (see ``run_fold_tasks``). A
+    ``fit_cache`` makes repeated sweeps pay only for unseen grid cells, and a
+    ``checkpoint`` lets an interrupted sweep resume from its finished cells.
+    The best config minimises the fold-averaged ``objective`` (one of
+    ``OBJECTIVES``): MAE by default, or a probabilistic score (pinball loss,
+    CRPS, Winkler) that also judges the forecast distribution. Configs
+    whose objective is NaN (e.g. cells restored from a checkpoint written
+    before the forecast carried the needed columns) are skipped.
+
+    Raises:
+        RuntimeError: If no config has a finite objective
+    """
+
+    validate_objective(objective)
+    configs = expand_param_grid(param_grid)
+    logger.info("Evaluating %d hyperparameter combinations", len(configs))
+
+    tasks = [
+        FoldTask(
+            config_index=config_idx,
+            fold_index=fold_idx,
+            config=config,
+            split=split,
+            seed=derive_task_seed(random_seed, config_idx, fold_idx),
+        )
+        for config_idx, config in enumerate(configs)
+        for fold_idx, split in enumerate(splits)
+    ]
+    all_results = run_fold_tasks(
+        df,
+        tasks,
+        regressor_columns,
+        executor=executor,
+        n_jobs=n_jobs,
+        warm_start=warm_start,
+        cache=fit_cache,
+        checkpoint=checkpoint,
+    )
 
     best_config: dict[str, Any] | None = None
     best_score: float | None = None
     best_fold_results: list[FoldResult] = []
     history: list[dict[str, Any]] = []
 
-    for combo in all_combinations:
-        config = dict(zip(grid_keys, combo))
-        # Add defaults for any unspecified params
-        config.setdefault("interval_width", 0.80)
-        config.setdefault("weekly_seasonality", True)
-        config.setdefault("yearly_seasonality", False)
-        config.setdefault("daily_seasonality", False)
-        config.setdefault("growth", "linear")
-
-        fold_results: list[FoldResult] = []
-        for fold_idx, split in enumerate(splits):
-            result = run_prophet_fold(df, split, config, regressor_columns)
-            result.fold_id = fold_idx
-            fold_results.append(result)
-
-        aggregated = aggregate_fold_metrics(fold_results)
-        score = aggregated["mae"]
-        history.append({"config": config, "metrics": aggregated})
+    n_folds = len(splits)
+    aggregates = aggregate_fold_groups(all_results, [task.config_index for task in tasks])
+    for config_idx, config in enumerate(configs):
+        fold_results = all_results[config_idx * n_folds : (config_idx + 1) * n_folds]
+
+        aggregated = aggregates[config_idx]
+        score = aggregated[objective]
+        history.append(
+            {
+                "config": config,
+                "metrics": aggregated,
+                "fit_seconds": [fold.fit_seconds for fold in fold_results],
+            }
+        )
 
         logger.info(
-            "Grid combo %s → MAE %.3f, Bias %.3f, Coverage %.1f%%",
+            "Grid combo %s → MAE %.3f, Bias %.3f, Coverage %.1f%%, %s %.3f",
             config,
             aggregated["mae"],
             aggregated.get("bias"),
             aggregated.get("coverage_percent"),
+            objective,
+            score,
         )
 
+        if math.isnan(score):
+            logger.warning(
+                "Grid combo %s has no %s score (restored cells may lack its columns); skipping", config, objective
+            )
+            continue
         if best_score is None or score < best_score:
             best_score = score
             best_config = config
             best_fold_results = fold_results
 
     if best_config is None:
-        raise RuntimeError("Grid search failed to evaluate any configuration")
+        raise RuntimeError(f"Grid search failed to score any configuration on {objective}")
 
-    logger.info("Best config: %s (MAE %.3f)", best_config, best_score)
+    logger.info("Best config: %s (%s %.3f)", best_config, objective, best_score)
     return best_config, best_fold_results, history
@@ -1,30 +1,71 @@
 """Forecast evaluation metrics for Prophet models.
 
 This module provides functions to calculate standard forecasting metrics
-including MAE, RMSE, sMAPE, bias, coverage, and R², plus comparison
+including MAE, RMSE, sMAPE, bias, coverage, and R², probabilistic scores
+(pinball loss, CRPS and the Winkler interval score), plus comparison
 against naive baselines.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from champion_prophet.timing import timed
+
+from .baselines import baseline_predictions, compute_baselines
+from models.uncertainty import crps_from_samples
 
 logger = logging.getLogger(__name__)
 
 
+def _as_pair(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert actuals and predictions to float arrays once, validating their shape."""
+
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"y_true and y_pred have different shapes: {y_true.shape} vs {y_pred.shape}")
+    if y_true.size == 0:
+        raise ValueError("Cannot compute metrics on empty arrays")
+    return y_true, y_pred
+
+
+def _smape_from(y_true: np.ndarray, y_pred: np.ndarray, abs_residuals: np.ndarray) -> float:
+    denominator = (np.abs(y_true) + np.abs(y_pred)) / 2.0
+    # Avoid division by zero
+    denominator = np.where(denominator == 0, 1e-10, denominator)
+    return float(100 * np.mean(abs_residuals / denominator))
+
+
+def _r2_from(y_true: np.ndarray, ss_res: float) -> float:
+    """R² with ``sklearn.metrics.r2_score`` semantics (constant target gives 1.0 or 0.0)."""
+
+    if len(y_true) < 2:
+        logger.warning("R² is not well-defined with fewer than two samples")
+        return float("nan")
+    centered = y_true - np.mean(y_true)
+    ss_tot = float(np.sum(centered * centered))
+    if ss_tot == 0:
+        return 1.0 if ss_res == 0 else 0.0
+    return 1.0 - ss_res / ss_tot
+
+
 def calculate_mae(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> float:
     """Calculate Mean Absolute Error."""
-    return float(mean_absolute_error(y_true, y_pred))
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    return float(np.mean(np.abs(y_pred - y_true)))
 
 
 def calculate_rmse(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> float:
     """Calculate Root Mean Squared Error."""
-    return float(np.sqrt(mean_squared_error(y_true, y_pred)))
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    residuals = y_pred - y_true
+    return float(np.sqrt(np.mean(residuals * residuals)))
 
 
 def calculate_smape(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> float:
@@ -32,17 +73,8 @@ def calculate_smape(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarr
 
     sMAPE = 100 * mean(2 * |y_true - y_pred| / (|y_true| + |y_pred|))
     """
-    y_true = np.asarray(y_true)
-    y_pred = np.asarray(y_pred)
-
-    numerator = np.abs(y_true - y_pred)
-    denominator = (np.abs(y_true) + np.abs(y_pred)) / 2.0
-
-    # Avoid division by zero
-    denominator = np.where(denominator == 0, 1e-10, denominator)
-
-    smape = 100 * np.mean(numerator / denominator)
-    return float(smape)
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    return _smape_from(y_true, y_pred, np.abs(y_true - y_pred))
 
 
 def calculate_bias(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> float:
@@ -51,9 +83,21 @@ def calculate_bias(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarra
     Positive bias = over-forecasting
     Negative bias = under-forecasting
     """
+    y_true, y_pred = _as_pair(y_true, y_pred)
     return float(np.mean(y_pred - y_true))
 
 
+def _point_error_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]:
+    """MAE, RMSE and bias from a single residual array."""
+
+    residuals = y_pred - y_true
+    return {
+        "mae": float(np.mean(np.abs(residuals))),
+        "rmse": float(np.sqrt(np.mean(residuals * residuals))),
+        "bias": float(np.mean(residuals)),
+    }
+
+
 def calculate_coverage(
     y_true: pd.Series | np.ndarray,
     y_lower: pd.Series | np.ndarray,
@@ -84,15 +128,360 @@ def calculate_coverage(
 
 def calculate_r2(y_true: pd.Series | np.ndarray, y_pred: pd.Series | np.ndarray) -> float:
     """Calculate R-squared (coefficient of determination)."""
-    return float(r2_score(y_true, y_pred))
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    residuals = y_true - y_pred
+    return _r2_from(y_true, float(np.sum(residuals * residuals)))
+
+
+def pinball_losses(
+    y_true: pd.Series | np.ndarray,
+    quantile_preds: np.ndarray,
+    levels: Sequence[float],
+) -> np.ndarray:
+    """Pinball (quantile) loss of every quantile prediction.
+
+    Args:
+        y_true: Actual values, any shape
+        quantile_preds: Quantile predictions with the shape of ``y_true`` plus
+            a trailing axis holding one column per level
+        levels: Quantile level of each column, in (0, 1)
+
+    Returns:
+        Losses with the shape of ``quantile_preds``
+    """
+    diff = np.asarray(y_true, dtype=float)[..., None] - np.asarray(quantile_preds, dtype=float)
+    tau = np.asarray(levels, dtype=float)
+    return np.maximum(tau * diff, (tau - 1.0) * diff)
 
 
+def calculate_pinball(
+    y_true: pd.Series | np.ndarray,
+    quantile_preds: np.ndarray,
+    levels: Sequence[float],
+) -> float:
+    """Mean pinball loss over every step and quantile level."""
+    return float(np.mean(pinball_losses(y_true, quantile_preds, levels)))
+
+
+def winkler_scores(
+    y_true: pd.Series | np.ndarray,
+    y_lower: pd.Series | np.ndarray,
+    y_upper: pd.Series | np.ndarray,
+    interval_width: float | np.ndarray,
+) -> np.ndarray:
+    """Winkler interval score of every step.
+
+    The interval width plus ``2 / alpha`` times the distance by which the
+    actual falls outside it, where ``alpha = 1 - interval_width``. Lower is
+    better; it rewards narrow intervals without rewarding misses.
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_lower = np.asarray(y_lower, dtype=float)
+    y_upper = np.asarray(y_upper, dtype=float)
+    alpha = 1.0 - np.asarray(interval_width, dtype=float)
+    miss = np.maximum(y_lower - y_true, 0.0) + np.maximum(y_true - y_upper, 0.0)
+    return (y_upper - y_lower) + (2.0 / alpha) * miss
+
+
+def calculate_winkler(
+    y_true: pd.Series | np.ndarray,
+    y_lower: pd.Series | np.ndarray,
+    y_upper: pd.Series | np.ndarray,
+    interval_width: float = 0.80,
+) -> float:
+    """Mean Winkler interval score."""
+    return float(np.mean(winkler_scores(y_true, y_lower, y_upper, interval_width)))
+
+
+def calculate_crps(y_true: pd.Series | np.ndarray, samples: np.ndarray) -> float:
+    """Mean sample-based CRPS; ``samples`` is (steps x draws)."""
+    return float(np.mean(crps_from_samples(samples, np.asarray(y_true, dtype=float))))
+
+
+def forecast_metrics(
+    y_true: pd.Series | np.ndarray,
+    y_pred: pd.Series | np.ndarray,
+    y_lower: pd.Series | np.ndarray | None = None,
+    y_upper: pd.Series | np.ndarray | None = None,
+) -> dict[str, float]:
+    """Fused point (and interval) metrics from shared intermediates.
+
+    Inputs are converted once; residuals, absolute residuals and squared
+    residuals are computed once and reused for every metric. Values are
+    identical to the individual ``calculate_*`` helpers.
+
+    Args:
+        y_true: Actual values
+        y_pred: Predicted values
+        y_lower: Lower bound of prediction interval (optional)
+        y_upper: Upper bound of prediction interval (optional)
+
+    Returns:
+        Dictionary with mae, rmse, smape, bias and r2 (plus coverage when
+        both bounds are given)
+
+    Raises:
+        ValueError: If the inputs are empty or differ in shape
+    """
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    residuals = y_pred - y_true
+    abs_residuals = np.abs(residuals)
+    squared = residuals * residuals
+
+    metrics = {
+        "mae": float(np.mean(abs_residuals)),
+        "rmse": float(np.sqrt(np.mean(squared))),
+        "smape": _smape_from(y_true, y_pred, abs_residuals),
+        "bias": float(np.mean(residuals)),
+        "r2": _r2_from(y_true, float(np.sum(squared))),
+    }
+    if y_lower is not None and y_upper is not None:
+        metrics["coverage"] = calculate_coverage(y_true, y_lower, y_upper)
+    return metrics
+
+
+def _as_rows(values: pd.Series | np.ndarray) -> np.ndarray:
+    return np.atleast_2d(np.asarray(values, dtype=float))
+
+
+@dataclass(slots=True)
+class MetricBatch:
+    """Sufficient statistics of a batched (candidates x horizon) evaluation.
+
+    One row per candidate (a config's forecast for one fold). Rows may be
+    NaN-padded to a common horizon; padded steps are ignored. Statistics are
+    sums, so rows can be pooled exactly into groups (e.g. all folds of a
+    config) with ``pool``.
+
+    Attributes:
+        n_samples: Scored steps per row
+        abs_error: Sum of absolute residuals
+        sq_error: Sum of squared residuals
+        error: Sum of residuals (prediction minus actual)
+        smape: Sum of per-step sMAPE terms (before the factor of 100)
+        y_mean: Mean actual per row
+        ss_tot: Sum of squared deviations of the actuals from ``y_mean``
+        covered: Steps inside the interval per row (None without intervals)
+        winkler: Sum of Winkler interval scores (None without intervals)
+        pinball: Sum over steps of the pinball loss averaged over the
+            quantile levels (None without quantile predictions)
+        crps: Sum of per-step CRPS values (None without them)
+    """
+
+    n_samples: np.ndarray
+    abs_error: np.ndarray
+    sq_error: np.ndarray
+    error: np.ndarray
+    smape: np.ndarray
+    y_mean: np.ndarray
+    ss_tot: np.ndarray
+    covered: np.ndarray | None = None
+    winkler: np.ndarray | None = None
+    pinball: np.ndarray | None = None
+    crps: np.ndarray | None = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        y_true: pd.Series | np.ndarray,
+        y_pred: pd.Series | np.ndarray,
+        y_lower: pd.Series | np.ndarray | None = None,
+        y_upper: pd.Series | np.ndarray | None = None,
+        interval_width: float | Sequence[float] | np.ndarray = 0.80,
+        quantile_preds: np.ndarray | None = None,
+        quantile_levels: Sequence[float] = (),
+        crps: np.ndarray | None = None,
+    ) -> MetricBatch:
+        """Statistics of every row of stacked actuals, predictions and intervals.
+
+        ``interval_width`` is the nominal coverage of the intervals (a scalar
+        or one value per row) used by the Winkler score. ``quantile_preds``
+        has the shape of ``y_true`` plus a trailing axis over
+        ``quantile_levels``; ``crps`` holds per-step CRPS values computed
+        from the forecast samples (see ``crps_from_samples``).
+
+        Raises:
+            ValueError: If the arrays differ in shape
+        """
+        y_true, y_pred = _as_rows(y_true), _as_rows(y_pred)
+        if y_true.shape != y_pred.shape:
+            raise ValueError(f"y_true and y_pred have different shapes: {y_true.shape} vs {y_pred.shape}")
+
+        valid = np.isfinite(y_true) & np.isfinite(y_pred)
+        n_samples = valid.sum(axis=1)
+        residuals = np.where(valid, y_pred - y_true, 0.0)
+        abs_residuals = np.abs(residuals)
+        denominator = (np.abs(y_true) + np.abs(y_pred)) / 2.0
+        denominator = np.where(denominator == 0, 1e-10, denominator)
+        smape_terms = np.where(valid, abs_residuals / np.where(valid, denominator, 1.0), 0.0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            y_mean = np.where(valid, y_true, 0.0).sum(axis=1) / n_samples
+        centered = np.where(valid, y_true - y_mean[:, None], 0.0)
+
+        covered = winkler = None
+        if y_lower is not None and y_upper is not None:
+            lower, upper = _as_rows(y_lower), _as_rows(y_upper)
+            covered = (valid & (y_true >= lower) & (y_true <= upper)).sum(axis=1)
+            width = np.asarray(interval_width, dtype=float)
+            if width.ndim:
+                width = width[:, None]
+            winkler = np.where(valid, winkler_scores(y_true, lower, upper, width), 0.0).sum(axis=1)
+
+        pinball = None
+        if quantile_preds is not None:
+            quantile_preds = np.asarray(quantile_preds, dtype=float)
+            quantile_preds = quantile_preds.reshape(y_true.shape + quantile_preds.shape[-1:])
+            losses = pinball_losses(y_true, quantile_preds, quantile_levels).mean(axis=-1)
+            pinball = np.where(valid, losses, 0.0).sum(axis=1)
+
+        crps_sum = None
+        if crps is not None:
+            crps_sum = np.where(valid, _as_rows(crps), 0.0).sum(axis=1)
+
+        return cls(
+            n_samples=n_samples,
+            abs_error=abs_residuals.sum(axis=1),
+            sq_error=(residuals * residuals).sum(axis=1),
+            error=residuals.sum(axis=1),
+            smape=smape_terms.sum(axis=1),
+            y_mean=y_mean,
+            ss_tot=(centered * centered).sum(axis=1),
+            covered=covered,
+            winkler=winkler,
+            pinball=pinball,
+            crps=crps_sum,
+        )
+
+    def metrics(self) -> dict[str, np.ndarray]:
+        """Every metric of ``calculate_metrics`` per row, as arrays."""
+
+        n_samples = self.n_samples
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r2 = np.where(self.ss_tot > 0, 1.0 - self.sq_error / self.ss_tot, np.where(self.sq_error == 0, 1.0, 0.0))
+            metrics = {
+                "mae": self.abs_error / n_samples,
+                "rmse": np.sqrt(self.sq_error / n_samples),
+                "smape": 100 * self.smape / n_samples,
+                "bias": self.error / n_samples,
+                "r2": np.where(n_samples < 2, np.nan, r2),
+                "n_samples": n_samples,
+            }
+            if self.covered is not None:
+                metrics["coverage"] = self.covered / n_samples
+                metrics["coverage_percent"] = metrics["coverage"] * 100
+            for key in ("winkler", "pinball", "crps"):
+                total = getattr(self, key)
+                if total is not None:
+                    metrics[key] = total / n_samples
+        return metrics
+
+    def pool(self, groups: Sequence[int] | np.ndarray) -> MetricBatch:
+        """Merge rows with the same group id into one row per group.
+
+        Group ids must be 0..G-1. Pooled R² uses the variance of all the
+        group's actuals (parallel-variance combination of the row statistics).
+        """
+        groups = np.asarray(groups, dtype=np.intp)
+        size = int(groups.max()) + 1 if groups.size else 0
+
+        def total(values: np.ndarray) -> np.ndarray:
+            return np.bincount(groups, weights=values, minlength=size)
+
+        def optional_total(values: np.ndarray | None) -> np.ndarray | None:
+            return None if values is None else total(values)
+
+        n_samples = total(self.n_samples).astype(int)
+        row_mean = np.where(self.n_samples > 0, self.y_mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            y_mean = total(self.n_samples * row_mean) / n_samples
+        spread = self.n_samples * (row_mean - y_mean[groups]) ** 2
+
+        return MetricBatch(
+            n_samples=n_samples,
+            abs_error=total(self.abs_error),
+            sq_error=total(self.sq_error),
+            error=total(self.error),
+            smape=total(self.smape),
+            y_mean=y_mean,
+            ss_tot=total(self.ss_tot) + total(spread),
+            covered=None if self.covered is None else total(self.covered).astype(int),
+            winkler=optional_total(self.winkler),
+            pinball=optional_total(self.pinball),
+            crps=optional_total(self.crps),
+        )
+
+    def group_means(self, groups: Sequence[int] | np.ndarray) -> dict[str, np.ndarray]:
+        """Unweighted mean of each row metric per group (the per-fold average)."""
+
+        groups = np.asarray(groups, dtype=np.intp)
+        size = int(groups.max()) + 1 if groups.size else 0
+        counts = np.bincount(groups, minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                key: np.bincount(groups, weights=values, minlength=size) / counts
+                for key, values in self.metrics().items()
+            }
+
+
+def batch_forecast_metrics(
+    y_true: pd.Series | np.ndarray,
+    y_pred: pd.Series | np.ndarray,
+    y_lower: pd.Series | np.ndarray | None = None,
+    y_upper: pd.Series | np.ndarray | None = None,
+    groups: Sequence[int] | np.ndarray | None = None,
+    interval_width: float | Sequence[float] | np.ndarray = 0.80,
+    quantile_preds: np.ndarray | None = None,
+    quantile_levels: Sequence[float] = (),
+    crps: np.ndarray | None = None,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Metrics for many candidates in one vectorized call.
+
+    Args:
+        y_true: Actuals, shape (candidates, horizon), NaN-padded if ragged
+        y_pred: Predictions with the same shape
+        y_lower: Lower interval bounds (optional)
+        y_upper: Upper interval bounds (optional)
+        groups: Group id (0..G-1) per row, e.g. the config of each fold
+        interval_width: Nominal interval coverage for the Winkler score
+        quantile_preds: Quantile predictions (candidates, horizon, levels)
+            for the pinball loss
+        quantile_levels: Level of each quantile column
+        crps: Per-step CRPS values (candidates, horizon)
+
+    Returns:
+        ``{"per_row": ...}`` with each metric as an array over rows; with
+        ``groups`` also ``"per_fold"`` (mean of the rows' metrics per group)
+        and ``"pooled"`` (metrics over all of a group's steps together).
+    """
+    batch = MetricBatch.from_arrays(
+        y_true,
+        y_pred,
+        y_lower,
+        y_upper,
+        interval_width=interval_width,
+        quantile_preds=quantile_preds,
+        quantile_levels=quantile_levels,
+        crps=crps,
+    )
+    result = {"per_row": batch.metrics()}
+    if groups is not None:
+        result["per_fold"] = batch.group_means(groups)
+        result["pooled"] = batch.pool(groups).metrics()
+    return result
+
+
+@timed("metrics.calculate_metrics")
 def calculate_metrics(
     y_true: pd.Series | np.ndarray,
     y_pred: pd.Series | np.ndarray,
     y_lower: pd.Series | np.ndarray | None = None,
     y_upper: pd.Series | np.ndarray | None = None,
     dates: pd.Series | None = None,
+    breakdowns: Sequence[str] = ("dow",),
+    interval_width: float = 0.80,
+    y_quantiles: Mapping[float, pd.Series | np.ndarray] | None = None,
+    samples: np.ndarray | None = None,
 ) -> dict[str, Any]:
     """Calculate all standard forecast metrics.
 
@@ -101,28 +490,43 @@ def calculate_metrics(
         y_pred: Predicted values
         y_lower: Lower bound of prediction interval (optional)
         y_upper: Upper bound of prediction interval (optional)
-        dates: Date column for day-of-week breakdown (optional)
+        dates: Date column for calendar breakdowns (optional)
+        breakdowns: Breakdowns to add when ``dates`` is given, each stored
+            as ``{name}_breakdown`` (see ``BREAKDOWNS``)
+        interval_width: Nominal coverage of the interval, for the Winkler score
+        y_quantiles: Quantile predictions keyed by level (optional); adds the
+            mean ``pinball`` loss and ``pinball_by_quantile``
+        samples: Forecast sample paths, shape (steps, draws) (optional); adds
+            the mean ``crps``
 
     Returns:
         Dictionary containing all metrics
     """
-    metrics = {
-        "mae": calculate_mae(y_true, y_pred),
-        "rmse": calculate_rmse(y_true, y_pred),
-        "smape": calculate_smape(y_true, y_pred),
-        "bias": calculate_bias(y_true, y_pred),
-        "r2": calculate_r2(y_true, y_pred),
-        "n_samples": len(y_true),
-    }
+    fused = forecast_metrics(y_true, y_pred, y_lower, y_upper)
+    coverage = fused.pop("coverage", None)
+    metrics: dict[str, Any] = {**fused, "n_samples": len(y_true)}
 
     # Add coverage if intervals provided
-    if y_lower is not None and y_upper is not None:
-        metrics["coverage"] = calculate_coverage(y_true, y_lower, y_upper)
-        metrics["coverage_percent"] = metrics["coverage"] * 100
-
-    # Add day-of-week breakdown if dates provided
+    if coverage is not None:
+        metrics["coverage"] = coverage
+        metrics["coverage_percent"] = coverage * 100
+        metrics["winkler"] = calculate_winkler(y_true, y_lower, y_upper, interval_width)
+
+    if y_quantiles:
+        levels = sorted(y_quantiles)
+        quantile_preds = np.column_stack([np.asarray(y_quantiles[level], dtype=float) for level in levels])
+        losses = pinball_losses(y_true, quantile_preds, levels)
+        metrics["pinball"] = float(np.mean(losses))
+        by_level = losses.mean(axis=0)
+        metrics["pinball_by_quantile"] = {f"{level:g}": float(loss) for level, loss in zip(levels, by_level)}
+
+    if samples is not None:
+        metrics["crps"] = calculate_crps(y_true, samples)
+
+    # Add day-of-week (and any other calendar) breakdown if dates provided
     if dates is not None:
-        metrics["dow_breakdown"] = _calculate_dow_metrics(y_true, y_pred, dates)
+        for by in breakdowns:
+            metrics[f"{by}_breakdown"] = breakdown_metrics(y_true, y_pred, dates, by=by)
 
     logger.info(
         "Calculated metrics: MAE=%.2f, RMSE=%.2f, sMAPE=%.2f%%, Bias=%.2f, R²=%.4f",
@@ -139,122 +543,132 @@ def calculate_metrics(
     return metrics
 
 
-def _calculate_dow_metrics(
+DOW_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Breakdown name -> (group code per timestamp, label per code)
+BREAKDOWNS: dict[str, tuple[Callable[[pd.DatetimeIndex], np.ndarray], list[str]]] = {
+    "dow": (lambda index: index.dayofweek, DOW_NAMES),
+    "hour": (lambda index: index.hour, [f"{hour:02d}:00" for hour in range(24)]),
+    "week_of_month": (lambda index: (index.day - 1) // 7, [f"Week {week}" for week in range(1, 6)]),
+}
+
+
+def breakdown_metrics(
     y_true: pd.Series | np.ndarray,
     y_pred: pd.Series | np.ndarray,
-    dates: pd.Series,
+    dates: pd.Series | np.ndarray,
+    by: str = "dow",
 ) -> dict[str, dict[str, float]]:
-    """Calculate metrics broken down by day of week.
+    """Calculate MAE, bias and sample count per calendar group.
+
+    All groups are reduced at once with ``np.bincount`` over the group codes
+    of ``dates``; groups without observations are omitted.
 
     Args:
         y_true: Actual values
         y_pred: Predicted values
-        dates: Date column (will extract day of week)
+        dates: Timestamps aligned with the values
+        by: Grouping in ``BREAKDOWNS`` ("dow", "hour" or "week_of_month")
 
     Returns:
-        Dictionary mapping day names to metrics dict
-    """
-    dow_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-    df = pd.DataFrame(
-        {
-            "y_true": y_true,
-            "y_pred": y_pred,
-            "dow": pd.to_datetime(dates).dt.dayofweek,
-        }
-    )
-
-    dow_metrics = {}
-    for dow in range(7):
-        dow_data = df[df["dow"] == dow]
-        if len(dow_data) == 0:
-            continue
+        Dictionary mapping group labels (e.g. day names) to metrics dict
 
-        dow_metrics[dow_names[dow]] = {
-            "mae": calculate_mae(dow_data["y_true"], dow_data["y_pred"]),
-            "bias": calculate_bias(dow_data["y_true"], dow_data["y_pred"]),
-            "n_samples": len(dow_data),
-        }
-
-    return dow_metrics
+    Raises:
+        KeyError: If ``by`` is not a known breakdown
+    """
+    if by not in BREAKDOWNS:
+        raise KeyError(f"Unknown breakdown: {by}")
+    code_fn, labels = BREAKDOWNS[by]
+
+    y_true, y_pred = _as_pair(y_true, y_pred)
+    codes = np.asarray(code_fn(pd.DatetimeIndex(pd.to_datetime(dates))), dtype=np.intp)
+    residuals = y_pred - y_true
+
+    counts = np.bincount(codes, minlength=len(labels))
+    abs_sums = np.bincount(codes, weights=np.abs(residuals), minlength=len(labels))
+    sums = np.bincount(codes, weights=residuals, minlength=len(labels))
+
+    present = np.flatnonzero(counts)
+    mae = abs_sums[present] / counts[present]
+    bias = sums[present] / counts[present]
+    return {
+        labels[code]: {"mae": float(m), "bias": float(b), "n_samples": int(n)}
+        for code, m, b, n in zip(present, mae, bias, counts[present])
+    }
 
 
+@timed("metrics.calculate_baseline_metrics")
 def calculate_baseline_metrics(
     y_true: pd.Series | np.ndarray,
     dates: pd.Series | None,
     evaluation_start_index: int | None = None,
     seasonal_period: int = 7,
+    seasonal_lags: Sequence[int] = (),
+    windows: Sequence[int] | None = None,
+    baselines: Sequence[str] = (),
 ) -> dict[str, dict[str, float]]:
     """Calculate naive baseline metrics for comparison.
 
     Baselines:
-    - Seasonal naive: Use value from 7 days ago
-    - Moving average: 7-day trailing average
+    - Seasonal naive: Use value from ``seasonal_period`` steps ago
+      (plus ``seasonal_naive_{lag}`` for each extra lag in ``seasonal_lags``)
+    - Moving average: trailing average over each window in ``windows``
+      (default: ``seasonal_period``), reported as ``moving_average_{window}``
+    - Any registered baseline named in ``baselines`` (e.g. ``DEFAULT_BASELINES``:
+      drift, seasonal mean, EWMA, median of k weeks)
+
+    All predictions are computed vectorized in one pass over the series and
+    scored with a shared residual kernel (see ``evaluation.baselines``).
 
     Args:
         y_true: Actual values
         dates: Date column (ignored, kept for API parity)
         evaluation_start_index: Index in y_true where evaluation should begin (e.g., start of test set)
         seasonal_period: Seasonal lag to use for naive baseline (default: 7 days)
+        seasonal_lags: Additional seasonal-naive lags to evaluate
+        windows: Moving-average windows (default: ``(seasonal_period,)``)
+        baselines: Additional baseline names resolved from the registry
 
     Returns:
         Dictionary with baseline metrics
     """
-    y_true = np.asarray(y_true)
+    y_true = np.asarray(y_true, dtype=float)
     n_obs = len(y_true)
 
-    baselines: dict[str, dict[str, float]] = {}
+    results: dict[str, dict[str, float]] = {}
 
     if n_obs == 0:
         logger.warning("No observations provided to baseline metrics")
-        return baselines
+        return results
 
     eval_start = evaluation_start_index or 0
     if eval_start < 0:
         raise ValueError("evaluation_start_index must be non-negative")
     if eval_start >= n_obs:
         logger.warning("evaluation_start_index (%d) exceeds series length (%d)", eval_start, n_obs)
-        return baselines
-
-    eval_indices = np.arange(eval_start, n_obs, dtype=int)
-
-    # Seasonal naive (7-day lag)
-    if n_obs > seasonal_period:
-        seasonal_naive_pred = np.roll(y_true, seasonal_period)
+        return results
 
-        # Only evaluate indices that have a full seasonal history
-        valid_indices = np.arange(seasonal_period, n_obs, dtype=int)
-        valid_eval_indices = np.intersect1d(valid_indices, eval_indices, assume_unique=True)
-
-        if valid_eval_indices.size > 0:
-            baselines["seasonal_naive"] = {
-                "mae": calculate_mae(y_true[valid_eval_indices], seasonal_naive_pred[valid_eval_indices]),
-                "rmse": calculate_rmse(y_true[valid_eval_indices], seasonal_naive_pred[valid_eval_indices]),
-                "bias": calculate_bias(y_true[valid_eval_indices], seasonal_naive_pred[valid_eval_indices]),
-            }
-
-    # Moving average (7-day)
-    if n_obs > seasonal_period:
-        ma_pred = np.array(
-            [
-                np.mean(y_true[max(0, i - seasonal_period) : i]) if i > 0 else y_true[0]
-                for i in range(n_obs)
-            ]
-        )
+    lags = [seasonal_period, *(lag for lag in seasonal_lags if lag != seasonal_period)]
+    predictions = baseline_predictions(
+        y_true,
+        lags=lags,
+        windows=windows if windows is not None else (seasonal_period,),
+    )
+    extra = [name for name in dict.fromkeys(baselines) if name not in predictions]
+    predictions.update(compute_baselines(y_true, extra))
 
-        valid_indices = np.arange(seasonal_period, n_obs, dtype=int)
-        valid_eval_indices = np.intersect1d(valid_indices, eval_indices, assume_unique=True)
+    for name, (pred, first_valid) in predictions.items():
+        # Only evaluate indices that have a full history
+        start = max(first_valid, eval_start)
+        if n_obs <= first_valid or start >= n_obs:
+            continue
 
-        if valid_eval_indices.size > 0:
-            baselines["moving_average_7"] = {
-                "mae": calculate_mae(y_true[valid_eval_indices], ma_pred[valid_eval_indices]),
-                "rmse": calculate_rmse(y_true[valid_eval_indices], ma_pred[valid_eval_indices]),
-                "bias": calculate_bias(y_true[valid_eval_indices], ma_pred[valid_eval_indices]),
-            }
+        key = "seasonal_naive" if name == f"seasonal_naive_{seasonal_period}" else name
+        results[key] = _point_error_metrics(y_true[start:], pred[start:])
 
-    logger.info("Calculated baseline metrics for %d baselines", len(baselines))
+    logger.info("Calculated baseline metrics for %d baselines", len(results))
 
-    return baselines
+    return results
 
 
 def compare_to_baselines(
@@ -270,7 +684,8 @@ def compare_to_baselines(
         champion_mae: MAE from current champion (default: AutoARIMA 33.66)
 
     Returns:
-        Dictionary with comparison results and improvement percentages
+        Dictionary with comparison results and improvement percentages. With
+        any baselines, ``best_baseline`` names the one with the lowest MAE.
     """
     model_mae = model_metrics["mae"]
 
@@ -280,6 +695,8 @@ def compare_to_baselines(
         "baselines": {},
         "improvements": {},
     }
+    if baseline_metrics:
+        comparison["best_baseline"] = min(baseline_metrics, key=lambda name: baseline_metrics[name]["mae"])
 
     # Compare to champion
     if champion_mae > 0:
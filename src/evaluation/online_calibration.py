@@ -0,0 +1,356 @@
+"""Streaming calibration that updates as each day's actual arrives.
+
+``calibrate_forecasts`` re-derives the DOW bias and interval width from the
+full CV prediction frame on every run. ``OnlineCalibrator`` keeps the same
+information as running statistics instead. Per day of week it holds an
+exponentially weighted mean residual and a P² quantile sketch of the
+absolute bias-corrected residual (the split-conformal score), plus a pooled
+sketch for days with little history. Each new (date, actual, forecast)
+updates one day's state in O(1). The state remembers the last date it
+absorbed and ignores anything not newer, so overlapping windows and reruns
+never count an actual twice. The state is a small JSON file, so the daily
+job loads it, calibrates, folds in the new actuals and saves it again.
+``to_parameters`` returns ordinary ``CalibrationParameters`` so the result
+goes through ``apply_calibration`` like any other calibration.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .calibration import POOLED, CalibrationParameters, ConformalTable
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 3
+
+
+@dataclass(slots=True)
+class P2Quantile:
+    """P² streaming estimate of one quantile (Jain & Chlamtac, 1985).
+
+    Five markers track the minimum, the p/2, p and (1+p)/2 quantiles, and the
+    maximum. Each observation moves the markers with a piecewise-parabolic
+    step, so memory and update cost are constant.
+
+    The first ``warmup`` observations are kept exactly and the estimate is
+    their conservative empirical quantile. The markers are then placed at
+    the empirical quantiles of that buffer rather than at the five smallest
+    order statistics, so the estimate does not collapse to the median while
+    the markers would still be converging.
+
+    Attributes:
+        p: Quantile level in (0, 1)
+        heights: Marker heights (the observations, sorted, during warm-up)
+        positions: Actual marker positions (set when warm-up ends)
+        desired: Desired marker positions (set when warm-up ends)
+        count: Observations seen
+        warmup: Observations buffered before switching to the markers (>= 5)
+    """
+
+    p: float
+    heights: list[float] = field(default_factory=list)
+    positions: list[float] = field(default_factory=list)
+    desired: list[float] = field(default_factory=list)
+    count: int = 0
+    warmup: int = 20
+
+    def __post_init__(self) -> None:
+        if not 0 < self.p < 1:
+            raise ValueError("p must be in (0, 1)")
+        if self.warmup < 5:
+            raise ValueError("warmup must be at least 5")
+
+    def _place_markers(self) -> None:
+        """Seed the five markers from the sorted warm-up buffer."""
+
+        last = self.count - 1
+        p = self.p
+        self.desired = [last * step for step in (0.0, p / 2, p, (1 + p) / 2, 1.0)]
+        ranks = [round(position) for position in self.desired]
+        # Marker positions must be strictly increasing
+        for i in (1, 2, 3):
+            ranks[i] = max(ranks[i], ranks[i - 1] + 1)
+        for i in (3, 2, 1):
+            ranks[i] = min(ranks[i], ranks[i + 1] - 1)
+        self.heights = [self.heights[rank] for rank in ranks]
+        self.positions = [float(rank) for rank in ranks]
+
+    def update(self, value: float) -> None:
+        """Add one observation."""
+
+        self.count += 1
+        q = self.heights
+        if self.count <= self.warmup:
+            bisect.insort(q, float(value))
+            if self.count == self.warmup:
+                self._place_markers()
+            return
+
+        if value < q[0]:
+            q[0] = float(value)
+            cell = 0
+        elif value >= q[4]:
+            q[4] = float(value)
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if q[i] <= value < q[i + 1])
+
+        n = self.positions
+        for i in range(cell + 1, 5):
+            n[i] += 1
+        p = self.p
+        for i, step in enumerate((0.0, p / 2, p, (1 + p) / 2, 1.0)):
+            self.desired[i] += step
+
+        for i in (1, 2, 3):
+            offset = self.desired[i] - n[i]
+            if (offset >= 1 and n[i + 1] - n[i] > 1) or (offset <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if offset > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def value(self) -> float:
+        """Current quantile estimate (NaN before the first observation)."""
+
+        if self.count == 0:
+            return math.nan
+        if self.count < self.warmup:
+            # Conservative (upper) empirical quantile of the values seen so far
+            rank = min(math.ceil((self.count + 1) * self.p), self.count)
+            return self.heights[rank - 1]
+        return self.heights[2]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "p": self.p,
+            "heights": self.heights,
+            "positions": self.positions,
+            "desired": self.desired,
+            "count": self.count,
+            "warmup": self.warmup,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str, Any]) -> P2Quantile:
+        return cls(
+            p=float(state["p"]),
+            heights=[float(v) for v in state["heights"]],
+            positions=[float(v) for v in state["positions"]],
+            desired=[float(v) for v in state["desired"]],
+            count=int(state["count"]),
+            warmup=int(state["warmup"]),
+        )
+
+
+@dataclass(slots=True)
+class _DayState:
+    """Running residual statistics of one day of week."""
+
+    bias: float
+    count: int
+    sketch: P2Quantile
+
+
+class OnlineCalibrator:
+    """Per-DOW EWMA bias and streaming conformal margins.
+
+    Args:
+        target_coverage: Desired interval coverage (e.g. 0.80)
+        alpha: EWMA weight of the newest residual in the DOW bias
+        bias_shrinkage: Fraction of the running bias applied as correction
+        min_samples: Observations a day needs before its own margin replaces
+            the pooled one
+    """
+
+    def __init__(
+        self,
+        target_coverage: float = 0.80,
+        alpha: float = 0.1,
+        bias_shrinkage: float = 0.5,
+        min_samples: int = 8,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.target_coverage = target_coverage
+        self.alpha = alpha
+        self.bias_shrinkage = bias_shrinkage
+        self.min_samples = min_samples
+        self.days = [_DayState(0.0, 0, P2Quantile(target_coverage)) for _ in range(7)]
+        self.pooled = P2Quantile(target_coverage)
+        self.n_updates = 0
+        self.n_covered = 0
+        self.last_ds: pd.Timestamp | None = None
+
+    def bias(self, dow: int) -> float:
+        """Bias correction currently applied on day ``dow``."""
+
+        return self.bias_shrinkage * self.days[dow].bias
+
+    def margin(self, dow: int) -> float:
+        """Half-width of the calibrated interval on day ``dow``."""
+
+        day = self.days[dow]
+        if day.count >= self.min_samples:
+            return day.sketch.value()
+        return self.pooled.value()
+
+    def update(self, ds: pd.Timestamp | str, y: float, yhat: float) -> bool:
+        """Fold in one actual and the forecast that was issued for it.
+
+        Returns:
+            False (and leaves the state unchanged) if ``ds`` is not newer than
+            the last date already absorbed
+        """
+        ds = pd.Timestamp(ds)
+        if self.last_ds is not None and ds <= self.last_ds:
+            return False
+
+        dow = ds.dayofweek
+        day = self.days[dow]
+        score = abs(y - (yhat + self.bias(dow)))
+
+        margin = self.margin(dow)
+        if not math.isnan(margin):
+            self.n_updates += 1
+            self.n_covered += int(score <= margin)
+
+        residual = y - yhat
+        day.bias = residual if day.count == 0 else day.bias + self.alpha * (residual - day.bias)
+        day.count += 1
+        day.sketch.update(score)
+        self.pooled.update(score)
+        self.last_ds = ds
+        return True
+
+    def update_frame(self, df: pd.DataFrame) -> int:
+        """Fold in every new row of a frame with ds, y and yhat (in date order).
+
+        Rows dated on or before ``last_ds`` were absorbed by an earlier call
+        and are skipped.
+
+        Returns:
+            Number of rows absorbed
+        """
+        rows = df[["ds", "y", "yhat"]].dropna()
+        rows = rows.assign(ds=pd.to_datetime(rows["ds"])).sort_values("ds")
+        if self.last_ds is not None:
+            rows = rows[rows["ds"] > self.last_ds]
+
+        absorbed = sum(self.update(ds, float(y), float(yhat)) for ds, y, yhat in rows.itertuples(index=False))
+        skipped = len(df) - absorbed
+        if skipped:
+            logger.info("Online calibrator skipped %d rows already absorbed or missing values", skipped)
+        return absorbed
+
+    @classmethod
+    def from_history(cls, cv_predictions: pd.DataFrame, **kwargs: Any) -> OnlineCalibrator:
+        """Seed a calibrator by streaming CV predictions through it once."""
+
+        calibrator = cls(**kwargs)
+        calibrator.update_frame(cv_predictions)
+        return calibrator
+
+    @property
+    def observed_coverage(self) -> float:
+        """Share of actuals that fell inside the interval issued before them."""
+
+        return self.n_covered / self.n_updates if self.n_updates else math.nan
+
+    def to_parameters(self) -> CalibrationParameters:
+        """Current state as parameters for ``apply_calibration``.
+
+        Raises:
+            ValueError: If no actual has been observed yet
+        """
+        if self.pooled.count == 0:
+            raise ValueError("OnlineCalibrator has not seen any observations")
+
+        quantiles = {POOLED: self.pooled.value()}
+        n_samples = {POOLED: self.pooled.count}
+        for dow, day in enumerate(self.days):
+            if day.count >= self.min_samples:
+                quantiles[dow] = day.sketch.value()
+                n_samples[dow] = day.count
+
+        return CalibrationParameters(
+            dow_bias={dow: self.bias(dow) for dow, day in enumerate(self.days) if day.count},
+            interval_scale=1.0,
+            target_coverage=self.target_coverage,
+            observed_coverage=self.observed_coverage,
+            method="online",
+            conformal=ConformalTable(method="absolute", quantiles=quantiles, n_samples=n_samples),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "target_coverage": self.target_coverage,
+            "alpha": self.alpha,
+            "bias_shrinkage": self.bias_shrinkage,
+            "min_samples": self.min_samples,
+            "n_updates": self.n_updates,
+            "n_covered": self.n_covered,
+            "last_ds": None if self.last_ds is None else self.last_ds.isoformat(),
+            "pooled": self.pooled.to_dict(),
+            "days": [{"bias": d.bias, "count": d.count, "sketch": d.sketch.to_dict()} for d in self.days],
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str, Any]) -> OnlineCalibrator:
+        """Rebuild a calibrator from ``to_dict`` output.
+
+        Raises:
+            ValueError: If the state was written by an unsupported version
+        """
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported calibrator state version: {state.get('version')}")
+
+        calibrator = cls(
+            target_coverage=state["target_coverage"],
+            alpha=state["alpha"],
+            bias_shrinkage=state["bias_shrinkage"],
+            min_samples=state["min_samples"],
+        )
+        calibrator.n_updates = int(state["n_updates"])
+        calibrator.n_covered = int(state["n_covered"])
+        calibrator.last_ds = None if state["last_ds"] is None else pd.Timestamp(state["last_ds"])
+        calibrator.pooled = P2Quantile.from_dict(state["pooled"])
+        calibrator.days = [
+            _DayState(float(day["bias"]), int(day["count"]), P2Quantile.from_dict(day["sketch"]))
+            for day in state["days"]
+        ]
+        return calibrator
+
+    def save(self, path: Path | str) -> Path:
+        """Write the state as JSON (atomically, via a temporary file)."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2))
+        os.replace(tmp_path, path)
+        logger.info("Saved online calibrator state (%d observations) to %s", self.pooled.count, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path | str) -> OnlineCalibrator:
+        """Read a state file written by ``save``."""
+
+        return cls.from_dict(json.loads(Path(path).read_text()))
@@ -13,9 +13,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from champion_prophet.timing import timed
+
 logger = logging.getLogger(__name__)
 
 
+@timed("plots.plot_forecast_vs_actual")
 def plot_forecast_vs_actual(
     dates: pd.Series,
     y_true: pd.Series | np.ndarray,
@@ -73,6 +76,7 @@ def plot_forecast_vs_actual(
         plt.show()
 
 
+@timed("plots.plot_residuals")
 def plot_residuals(
     dates: pd.Series,
     y_true: pd.Series | np.ndarray,
@@ -138,6 +142,7 @@ def plot_residuals(
         plt.show()
 
 
+@timed("plots.plot_components")
 def plot_components(
     components_df: pd.DataFrame,
     title: str = "Prophet Forecast Components",
@@ -211,6 +216,7 @@ def plot_components(
         plt.show()
 
 
+@timed("plots.plot_dow_performance")
 def plot_dow_performance(
     dow_metrics: dict[str, dict[str, float]],
     title: str = "Day-of-Week Performance",
@@ -219,7 +225,7 @@ def plot_dow_performance(
     """Plot day-of-week performance metrics.
 
     Args:
-        dow_metrics: Dictionary from calculate_dow_metrics
+        dow_metrics: Dictionary from breakdown_metrics
         title: Plot title
         save_path: Path to save figure (if None, displays instead)
     """
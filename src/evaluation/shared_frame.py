@@ -0,0 +1,125 @@
+"""Zero-copy sharing of the CV training frame with process-pool workers.
+
+Sending a DataFrame to a process pool pickles the whole frame for every
+task. ``share_frame`` instead copies the frame's columns once into a single
+``multiprocessing.shared_memory`` block. Tasks carry only a small
+``SharedFrameHandle``. Each worker attaches once and rebuilds the frame as
+NumPy views over the block, and folds then slice those views by index
+range. Per-task IPC therefore stays constant however long the history is.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_ALIGNMENT = 8
+
+# Blocks attached by this worker process, kept open until a newer frame arrives
+_ATTACHED: dict[str, tuple[shared_memory.SharedMemory, pd.DataFrame]] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class SharedFrameHandle:
+    """Picklable description of a frame published in shared memory.
+
+    Attributes:
+        name: Shared memory block name
+        n_rows: Number of rows
+        columns: (column name, NumPy dtype string, byte offset) per column
+    """
+
+    name: str
+    n_rows: int
+    columns: tuple[tuple[str, str, int], ...]
+
+
+def can_share(df: pd.DataFrame) -> bool:
+    """Whether every column of ``df`` has a fixed-width NumPy dtype."""
+
+    fixed_width = all(isinstance(dtype, np.dtype) and dtype.kind in "biufmM" for dtype in df.dtypes)
+    return fixed_width and df.columns.is_unique
+
+
+@contextmanager
+def share_frame(df: pd.DataFrame) -> Iterator[SharedFrameHandle]:
+    """Publish ``df`` in shared memory for the duration of the context.
+
+    The frame is reattached with a fresh RangeIndex, so callers must address
+    rows positionally (as the CV splits do).
+
+    Raises:
+        ValueError: If a column is not a fixed-width NumPy dtype
+    """
+    if not can_share(df):
+        raise ValueError("Only frames with unique, fixed-width numeric/datetime columns can be shared")
+
+    layout: list[tuple[str, str, int]] = []
+    offset = 0
+    arrays: list[np.ndarray] = []
+    for name in df.columns:
+        values = np.ascontiguousarray(df[name].to_numpy())
+        layout.append((str(name), values.dtype.str, offset))
+        arrays.append(values)
+        offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for (_, dtype, start), values in zip(layout, arrays):
+            view = np.ndarray(values.shape, dtype=dtype, buffer=block.buf, offset=start)
+            view[...] = values
+            del view
+
+        handle = SharedFrameHandle(name=block.name, n_rows=len(df), columns=tuple(layout))
+        logger.info("Published %d rows x %d columns (%d bytes) in shared memory", len(df), len(layout), offset)
+        yield handle
+    finally:
+        block.close()
+        block.unlink()
+
+
+def attach_frame(handle: SharedFrameHandle) -> pd.DataFrame:
+    """Rebuild the published frame as zero-copy views (cached per process).
+
+    The views are read-only, so one worker cannot change the frame under
+    the others; callers that mutate must ``copy()`` first. The columns are
+    passed as a dict with ``copy=False``, which pandas does not consolidate,
+    so no column is copied out of the block.
+    """
+
+    cached = _ATTACHED.get(handle.name)
+    if cached is not None:
+        return cached[1]
+
+    # A long-lived pool may outlive earlier sweeps; release their blocks
+    for name in list(_ATTACHED):
+        stale_block, _ = _ATTACHED.pop(name)
+        try:
+            stale_block.close()
+        except BufferError:
+            pass
+
+    block = shared_memory.SharedMemory(name=handle.name)
+    columns = {
+        name: np.ndarray((handle.n_rows,), dtype=dtype, buffer=block.buf, offset=offset)
+        for name, dtype, offset in handle.columns
+    }
+    for values in columns.values():
+        values.flags.writeable = False
+    frame = pd.DataFrame(columns, copy=False)
+    _ATTACHED[handle.name] = (block, frame)
+    return frame
+
+
+def resolve_frame(df: pd.DataFrame | SharedFrameHandle) -> pd.DataFrame:
+    """Return ``df`` itself, or the attached frame for a shared handle."""
+
+    return attach_frame(df) if isinstance(df, SharedFrameHandle) else df
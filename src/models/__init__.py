@@ -1,5 +1,6 @@
 """Prophet model wrappers and utilities."""
 
+from .fit_cache import FitCache
 from .prophet_daily import ProphetDailyModel
 
-__all__ = ["ProphetDailyModel"]
+__all__ = ["FitCache", "ProphetDailyModel"]
@@ -0,0 +1,309 @@
+"""Vectorized inference for fitted Prophet models.
+
+``Prophet.predict`` rebuilds its feature frames with pandas on every call.
+For the MAP fits used throughout this project the forecast is a fixed
+function of a handful of arrays, so this module extracts those arrays once
+and evaluates trend, seasonal/regressor components, and ``yhat`` for any
+batch of dates with plain matrix products. Point forecasts and components
+match ``Prophet.predict`` to floating-point tolerance; intervals come from
+the seeded, vectorized sampler in ``models.uncertainty``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+from .uncertainty import (
+    ForecastSamples,
+    crps_from_samples,
+    quantile_column,
+    simulate_forecast_samples,
+    validate_quantiles,
+)
+
+logger = logging.getLogger(__name__)
+
+_NANOSECONDS_PER_SECOND = 1000**3
+_SUPPORTED_GROWTH = ("linear", "flat")
+
+
+@dataclass(slots=True)
+class FastProphetPredictor:
+    """Fitted Prophet parameters laid out as NumPy arrays.
+
+    Attributes:
+        growth: Trend type ("linear" or "flat")
+        start_ns: Training start as nanoseconds since epoch
+        t_scale_ns: Training window length in nanoseconds
+        y_scale: Target scaling factor
+        k: Base trend slope
+        m: Trend offset
+        delta: Slope changes at each changepoint
+        changepoints_t: Changepoint locations in scaled time
+        sigma_obs: Observation noise (scaled units)
+        beta: Feature coefficients, aligned with ``feature_names``
+        feature_names: Seasonal/holiday/regressor feature columns in fit order
+        component_matrix: Feature-to-component indicator matrix (features x components)
+        component_names: Component column names in Prophet's output order
+        additive_mask: Whether each component is additive (scaled by ``y_scale``)
+        seasonalities: name -> (period, fourier_order, condition_name)
+        regressors: name -> (mu, std)
+        uncertainty_samples: Default sample count (0 disables interval columns)
+        interval_width: Width of the ``yhat_lower``/``yhat_upper`` interval
+        model: The source Prophet model, used for holiday features
+    """
+
+    growth: str
+    start_ns: int
+    t_scale_ns: float
+    y_scale: float
+    k: float
+    m: float
+    delta: np.ndarray
+    changepoints_t: np.ndarray
+    sigma_obs: float
+    beta: np.ndarray
+    feature_names: list[str]
+    component_matrix: np.ndarray
+    component_names: list[str]
+    additive_mask: np.ndarray
+    seasonalities: dict[str, tuple[float, int, str | None]]
+    regressors: dict[str, tuple[float, float]]
+    uncertainty_samples: int
+    interval_width: float
+    model: Prophet = field(repr=False)
+
+    @staticmethod
+    def supports(model: Prophet) -> bool:
+        """Whether ``model`` can be served by the vectorized path."""
+
+        return (
+            model.history is not None
+            and model.growth in _SUPPORTED_GROWTH
+            and model.mcmc_samples == 0
+            and model.train_component_cols is not None
+        )
+
+    @classmethod
+    def from_prophet(cls, model: Prophet) -> FastProphetPredictor:
+        """Extract the fitted parameters of ``model`` once.
+
+        Raises:
+            ValueError: If the model is unfitted or uses an unsupported setup
+                (logistic growth or MCMC sampling)
+        """
+        if not cls.supports(model):
+            raise ValueError("Fast prediction requires a MAP-fitted Prophet model with linear or flat growth")
+
+        component_cols = model.train_component_cols
+        component_names = list(component_cols.columns)
+        additive = set(model.component_modes["additive"])
+        beta = np.nanmean(model.params["beta"], axis=0)
+        # ``train_component_cols`` is indexed by position; the feature names
+        # come from the design matrix Prophet built for the training history
+        features, _, _, _ = model.make_all_seasonality_features(model.history)
+        feature_names = list(features.columns)
+        if len(feature_names) != len(beta) or len(feature_names) != len(component_cols):
+            raise ValueError(
+                f"Feature columns ({len(feature_names)}) do not line up with the fitted coefficients ({len(beta)})"
+            )
+
+        return cls(
+            growth=model.growth,
+            start_ns=pd.Timestamp(model.start).value,
+            t_scale_ns=float(model.t_scale.value),
+            y_scale=float(model.y_scale),
+            k=float(np.nanmean(model.params["k"])),
+            m=float(np.nanmean(model.params["m"])),
+            delta=np.nanmean(model.params["delta"], axis=0),
+            changepoints_t=np.asarray(model.changepoints_t, dtype=float),
+            sigma_obs=float(np.nanmean(model.params["sigma_obs"])),
+            beta=beta,
+            feature_names=feature_names,
+            component_matrix=component_cols.to_numpy(dtype=float),
+            component_names=component_names,
+            additive_mask=np.array([name in additive for name in component_names]),
+            seasonalities={
+                name: (float(props["period"]), int(props["fourier_order"]), props["condition_name"])
+                for name, props in model.seasonalities.items()
+            },
+            regressors={
+                name: (float(props["mu"]), float(props["std"]))
+                for name, props in model.extra_regressors.items()
+            },
+            uncertainty_samples=int(model.uncertainty_samples or 0),
+            interval_width=float(model.interval_width),
+            model=model,
+        )
+
+    def scaled_time(self, ds: np.ndarray) -> np.ndarray:
+        """Map datetime64[ns] values onto Prophet's scaled time axis."""
+
+        return (ds.astype(np.int64) - self.start_ns) / self.t_scale_ns
+
+    def trend(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the fitted trend (in target units) at scaled times ``t``."""
+
+        if self.growth == "flat":
+            return np.full(t.shape, self.m) * self.y_scale
+
+        deltas_t = (self.changepoints_t[None, :] <= t[:, None]) * self.delta
+        k_t = deltas_t.sum(axis=1) + self.k
+        m_t = (deltas_t * -self.changepoints_t).sum(axis=1) + self.m
+        return (k_t * t + m_t) * self.y_scale
+
+    def feature_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """Build the seasonal/holiday/regressor design matrix for ``df``.
+
+        ``df`` must be sorted by ``ds`` and carry every regressor (and
+        seasonality condition) column the model was fitted with.
+        """
+        ds = df["ds"].to_numpy(dtype="datetime64[ns]")
+        days = ds.astype(np.int64) // _NANOSECONDS_PER_SECOND / (3600 * 24.0)
+        columns: dict[str, np.ndarray] = {}
+
+        for name, (period, order, condition_name) in self.seasonalities.items():
+            condition = df[condition_name].to_numpy(dtype=float) if condition_name else None
+            for i in range(order):
+                angle = days * np.pi * 2 * (i + 1) / period
+                sin_col, cos_col = np.sin(angle), np.cos(angle)
+                if condition is not None:
+                    sin_col, cos_col = sin_col * condition, cos_col * condition
+                columns[f"{name}_delim_{2 * i + 1}"] = sin_col
+                columns[f"{name}_delim_{2 * i + 2}"] = cos_col
+
+        for name, (mu, std) in self.regressors.items():
+            if name not in df.columns:
+                raise ValueError(f"Regressor '{name}' missing from dataframe")
+            values = df[name].to_numpy(dtype=float)
+            if np.isnan(values).any():
+                raise ValueError(f"Found NaN in column '{name}'")
+            columns[name] = (values - mu) / std
+
+        missing = [name for name in self.feature_names if name not in columns and name != "zeros"]
+        if missing and self.model.train_holiday_names is not None:
+            # Holiday indicator columns: reuse Prophet's own holiday expansion,
+            # which emits every training holiday column even when it never fires
+            holidays = self.model.construct_holiday_dataframe(df["ds"])
+            holiday_features, _, _ = self.model.make_holiday_features(df["ds"], holidays)
+            for name in missing:
+                if name in holiday_features:
+                    columns[name] = holiday_features[name].to_numpy(dtype=float)
+        unresolved = [name for name in missing if name not in columns]
+        if unresolved:
+            raise ValueError(f"Cannot build feature columns {unresolved} for fast prediction")
+
+        X = np.empty((len(df), len(self.feature_names)))
+        for j, name in enumerate(self.feature_names):
+            X[:, j] = columns[name] if name != "zeros" else 0.0
+        return X
+
+    def components(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate every component column (rows x components) from features ``X``."""
+
+        comps = X @ (self.beta[:, None] * self.component_matrix)
+        comps[:, self.additive_mask] *= self.y_scale
+        return comps
+
+    def sample(
+        self,
+        t: np.ndarray,
+        trend: np.ndarray,
+        comps: np.ndarray,
+        n_samples: int,
+        rng: np.random.Generator,
+    ) -> ForecastSamples:
+        """Draw trend and observation sample paths for sorted scaled times ``t``."""
+
+        return simulate_forecast_samples(
+            t=t,
+            trend=trend,
+            additive_terms=comps[:, self.component_names.index("additive_terms")],
+            multiplicative_terms=comps[:, self.component_names.index("multiplicative_terms")],
+            delta=self.delta,
+            n_changepoints=len(self.changepoints_t),
+            sigma_obs=self.sigma_obs,
+            y_scale=self.y_scale,
+            n_samples=n_samples,
+            rng=rng,
+            simulate_trend=self.growth != "flat",
+        )
+
+    def predict(
+        self,
+        df: pd.DataFrame,
+        include_intervals: bool = True,
+        n_samples: int | None = None,
+        rng: np.random.Generator | None = None,
+        quantiles: Sequence[float] = (),
+        crps: bool = False,
+    ) -> pd.DataFrame:
+        """Produce a frame with the same columns as ``Prophet.predict``.
+
+        Args:
+            df: Future frame with ``ds`` and any regressor columns
+            include_intervals: Attach ``yhat_lower``/``yhat_upper`` and trend bounds
+            n_samples: Number of uncertainty sample paths (defaults to the
+                model's ``uncertainty_samples``)
+            rng: Generator for the sample paths (defaults to an unseeded one)
+            quantiles: Extra quantile levels, appended as ``yhat_p*`` columns.
+                They come from the same sample batch as the interval bounds.
+            crps: Add a per-row ``crps`` column scoring that sample batch
+                against ``df["y"]``
+
+        Returns:
+            Forecast DataFrame sorted by ``ds`` with a fresh RangeIndex
+
+        Raises:
+            ValueError: If quantiles or CRPS are requested without uncertainty
+                samples, or CRPS without a ``y`` column
+        """
+        levels = validate_quantiles(quantiles)
+        if crps and "y" not in df.columns:
+            raise ValueError("CRPS needs the actuals in a 'y' column")
+        df = df.sort_values("ds").reset_index(drop=True)
+        ds = df["ds"].to_numpy(dtype="datetime64[ns]")
+        t = self.scaled_time(ds)
+
+        trend = self.trend(t)
+        X = self.feature_matrix(df)
+        comps = self.components(X)
+
+        out: dict[str, np.ndarray] = {"ds": ds, "trend": trend}
+
+        with_bounds = self.uncertainty_samples > 0
+        n_samples = self.uncertainty_samples if n_samples is None else n_samples
+        sampled = with_bounds and include_intervals and n_samples > 0
+        if (levels or crps) and not sampled:
+            raise ValueError("Quantile and CRPS forecasts need uncertainty samples and include_intervals=True")
+        quantile_values: dict[str, np.ndarray] = {}
+        if sampled:
+            samples = self.sample(t, trend, comps, n_samples, rng or np.random.default_rng())
+            bounds = ((1.0 - self.interval_width) / 2, (1.0 + self.interval_width) / 2)
+            # Interval bounds and the quantile grid share one pass over the yhat samples
+            yhat_q = np.quantile(samples.yhat, [*bounds, *levels], axis=1)
+            out["yhat_lower"], out["yhat_upper"] = yhat_q[0], yhat_q[1]
+            out["trend_lower"], out["trend_upper"] = np.quantile(samples.trend, bounds, axis=1)
+            quantile_values = {quantile_column(level): yhat_q[i + 2] for i, level in enumerate(levels)}
+            if crps:
+                quantile_values["crps"] = crps_from_samples(samples.yhat, df["y"].to_numpy(dtype=float))
+
+        for j, name in enumerate(self.component_names):
+            out[name] = comps[:, j]
+            if with_bounds:
+                # MAP fits have a single parameter draw, so component bounds collapse onto the mean
+                out[f"{name}_lower"] = comps[:, j]
+                out[f"{name}_upper"] = comps[:, j]
+
+        additive_terms = out["additive_terms"]
+        multiplicative_terms = out["multiplicative_terms"]
+        out["yhat"] = trend * (1 + multiplicative_terms) + additive_terms
+        out.update(quantile_values)
+
+        return pd.DataFrame(out)
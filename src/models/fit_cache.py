@@ -0,0 +1,153 @@
+"""Content-addressed on-disk cache of fitted Prophet models.
+
+Tuning sweeps refit the same (config, regressors, training slice)
+combinations on every run. Fits are stored under a SHA-256 of exactly those
+inputs, so a repeated sweep only pays Stan for grid cells it has not seen
+before. The cache is bounded by entry count and total size and evicts the
+least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Sequence
+
+import pandas as pd
+import prophet
+from prophet import Prophet
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".pkl"
+
+
+def fit_cache_key(
+    config: dict[str, Any],
+    regressor_names: Sequence[str],
+    train_df: pd.DataFrame,
+    holidays: pd.DataFrame | None = None,
+) -> str:
+    """Hash the inputs that fully determine a Prophet fit.
+
+    A warm-start init is deliberately not part of the key. It only changes
+    where the optimizer starts, so a cached fit stands in for both warm and
+    cold fits of the same inputs.
+
+    Args:
+        config: Prophet constructor arguments
+        regressor_names: Regressors added to the model, in order
+        train_df: Training frame (only ds, y and the regressor columns are hashed)
+        holidays: Holiday frame passed to Prophet, if any
+
+    Returns:
+        Hex digest identifying the fit
+    """
+    columns = ["ds", "y", *regressor_names]
+    frame = train_df[columns]
+
+    digest = hashlib.sha256()
+    digest.update(prophet.__version__.encode())
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+    digest.update(json.dumps(list(regressor_names)).encode())
+    digest.update(json.dumps([str(dtype) for dtype in frame.dtypes]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    if holidays is not None:
+        digest.update(pd.util.hash_pandas_object(holidays, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FitCache:
+    """LRU, size-bounded directory of pickled Prophet fits.
+
+    Attributes:
+        cache_dir: Directory holding one pickle per fit
+        max_entries: Maximum number of cached fits
+        max_bytes: Maximum total size of cached fits in bytes
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        max_entries: int = 512,
+        max_bytes: int = 1024**3,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Prophet | None:
+        """Return the cached fit for ``key`` (marking it recently used), or None."""
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            logger.warning("Discarding unreadable fit cache entry %s: %s", path.name, exc)
+            path.unlink(missing_ok=True)
+            return None
+
+        logger.debug("Fit cache hit: %s", key)
+        return model
+
+    def put(self, key: str, model: Prophet) -> None:
+        """Store a fitted model atomically, then enforce the size bounds."""
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(model, f)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.debug("Fit cache store: %s", key)
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop least recently used entries until both bounds hold.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(key=lambda entry: entry[0])
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+
+        if removed:
+            logger.info("Evicted %d fits from cache %s", removed, self.cache_dir)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached fit."""
+
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
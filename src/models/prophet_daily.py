@@ -9,15 +9,33 @@ from __future__ import annotations
 import json
 import logging
 import pickle
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, Sequence
 
+import numpy as np
 import pandas as pd
 from prophet import Prophet
 
+from champion_prophet.config import set_global_seed
+from champion_prophet.timing import span, timed
+from data.future import FutureFrameBuilder, default_future_builder
+
+from .fast_predict import FastProphetPredictor
+from .fit_cache import FitCache, fit_cache_key
+from .uncertainty import crps_from_samples, sample_quantiles, validate_quantiles
+from .warm_start import WarmStartState
+
 logger = logging.getLogger(__name__)
 
+PredictEngine = Literal["auto", "fast", "prophet"]
+
+# Prophet's own sampler draws from NumPy's global RNG, so seeding and
+# predicting through it must not interleave between threads.
+_PROPHET_RNG_LOCK = threading.Lock()
+
 
 class ProphetDailyModel:
     """Wrapper for Prophet daily forecasting with email volume data.
@@ -30,6 +48,11 @@ class ProphetDailyModel:
         config: Configuration dictionary for the model
         is_fitted: Whether the model has been fitted to data
         regressor_names: List of custom regressor names added to the model
+        fit_seconds: Wall-clock duration of the last fit (None until fitted)
+        fit_from_cache: Whether the last fit was served from a FitCache
+        holidays: Holiday frame passed to Prophet's ``holidays=`` argument
+        future_builder: Builder for calendar regressors of ``predict(periods=...)``
+            frames (None uses the shared default builder)
     """
 
     def __init__(
@@ -42,6 +65,9 @@ class ProphetDailyModel:
         seasonality_prior_scale: float = 10.0,
         seasonality_mode: str = "additive",
         growth: str = "linear",
+        uncertainty_samples: int = 1000,
+        holidays: pd.DataFrame | None = None,
+        future_builder: FutureFrameBuilder | None = None,
     ):
         """Initialize Prophet model with configuration.
 
@@ -54,6 +80,12 @@ class ProphetDailyModel:
             seasonality_prior_scale: Strength of seasonality (default: 10.0)
             seasonality_mode: "additive" or "multiplicative" (default: "additive")
             growth: "linear" or "logistic" (default: "linear")
+            uncertainty_samples: Sample paths drawn for intervals (default: 1000,
+                0 disables interval columns)
+            holidays: Optional Prophet holidays frame (ds, holiday, and
+                optional windows), e.g. ``HolidayCalendar.to_prophet_holidays()``
+            future_builder: Calendar regressor builder for ``predict(periods=...)``
+                (default: shared builder over the bundled holiday calendar)
         """
         self.config = {
             "interval_width": interval_width,
@@ -64,11 +96,17 @@ class ProphetDailyModel:
             "seasonality_prior_scale": seasonality_prior_scale,
             "seasonality_mode": seasonality_mode,
             "growth": growth,
+            "uncertainty_samples": uncertainty_samples,
         }
 
-        self.model = Prophet(**self.config)
+        self.holidays = holidays
+        self.future_builder = future_builder
+        self.model = Prophet(**self.config, holidays=holidays)
         self.is_fitted = False
         self.regressor_names: list[str] = []
+        self.fit_seconds: float | None = None
+        self.fit_from_cache = False
+        self._fast_predictor: FastProphetPredictor | None = None
 
         logger.info("Initialized ProphetDailyModel with config: %s", self.config)
 
@@ -90,11 +128,24 @@ class ProphetDailyModel:
 
         logger.info("Added %d regressors to model", len(regressor_names))
 
-    def fit(self, train_df: pd.DataFrame) -> ProphetDailyModel:
+    @timed("model.fit")
+    def fit(
+        self,
+        train_df: pd.DataFrame,
+        warm_start: WarmStartState | None = None,
+        cache: FitCache | None = None,
+    ) -> ProphetDailyModel:
         """Fit the Prophet model to training data.
 
         Args:
             train_df: DataFrame with columns 'ds', 'y', and any regressors
+            warm_start: Optional parameters from a previous fit (e.g. the
+                preceding expanding-window fold) used to initialise the optimizer
+            cache: Optional fit cache; an identical earlier fit (same config,
+                regressors and training frame) is reused instead of refitting.
+                A cache hit bypasses ``warm_start``: the warm init only moves
+                the optimizer's starting point, not the MAP it converges to,
+                so warm and cold fits share cache entries.
 
         Returns:
             Self for method chaining
@@ -115,21 +166,144 @@ class ProphetDailyModel:
         logger.info("Fitting Prophet model on %d training samples", len(train_df))
         logger.debug("Training date range: %s to %s", train_df["ds"].min(), train_df["ds"].max())
 
-        self.model.fit(train_df)
+        started = time.perf_counter()
+        cache_key = fit_cache_key(self.config, self.regressor_names, train_df, self.holidays) if cache else None
+        cached_model = cache.get(cache_key) if cache and cache_key else None
+
+        self._fast_predictor = None
+        if cached_model is not None:
+            self.model = cached_model
+            self.fit_seconds = time.perf_counter() - started
+            self.fit_from_cache = True
+            self.is_fitted = True
+            logger.info("Loaded fitted model from cache in %.3fs", self.fit_seconds)
+            return self
+
+        fit_kwargs: dict[str, Any] = {}
+        if warm_start is not None:
+            fit_kwargs["init"] = warm_start.to_stan_init(self.model, train_df)
+            logger.debug("Warm-starting optimizer from previous fit (start %s)", warm_start.start)
+
+        with span("model.fit.stan"):
+            self.model.fit(train_df, **fit_kwargs)
+        self.fit_seconds = time.perf_counter() - started
+        self.fit_from_cache = False
         self.is_fitted = True
 
-        logger.info("Model training completed successfully")
+        if cache and cache_key:
+            cache.put(cache_key, self.model)
+
+        logger.info("Model training completed successfully in %.2fs", self.fit_seconds)
         return self
 
-    def predict(self, periods: int | None = None, future_df: pd.DataFrame | None = None) -> pd.DataFrame:
+    def warm_start_state(self) -> WarmStartState:
+        """Capture fitted parameters for warm-starting a subsequent fit.
+
+        Raises:
+            RuntimeError: If model hasn't been fitted
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model must be fitted before capturing warm-start state")
+
+        return WarmStartState.from_prophet(self.model)
+
+    def _run_predict(
+        self,
+        future_df: pd.DataFrame,
+        engine: PredictEngine,
+        seed: int | None,
+        quantiles: Sequence[float] = (),
+        crps: bool = False,
+    ) -> pd.DataFrame:
+        """Dispatch prediction to the vectorized engine or to ``Prophet.predict``.
+
+        "auto" uses the vectorized engine whenever the fitted model supports it
+        (MAP fit with linear or flat growth) and falls back to Prophet otherwise.
+        Without an explicit seed, the interval sampler is seeded from NumPy's
+        global RNG so runs seeded via ``set_global_seed`` stay reproducible.
+        The vectorized engine reads ``quantiles`` (and the per-row ``crps``)
+        off the same sample batch as the interval; the Prophet engine draws
+        one ``predictive_samples`` batch for them.
+        """
+        if engine not in ("auto", "fast", "prophet"):
+            raise ValueError(f"Unknown predict engine: {engine}")
+        levels = validate_quantiles(quantiles)
+
+        if engine == "prophet" or (engine == "auto" and not FastProphetPredictor.supports(self.model)):
+            with span("model.predict.prophet_engine"), _PROPHET_RNG_LOCK:
+                if seed is not None:
+                    set_global_seed(seed)
+                forecast = self.model.predict(future_df)
+                if levels or crps:
+                    samples = self.model.predictive_samples(future_df)["yhat"]
+                    for column, values in sample_quantiles(samples, levels).items():
+                        forecast[column] = values
+                    if crps:
+                        actuals = future_df.sort_values("ds")["y"].to_numpy(dtype=float)
+                        forecast["crps"] = crps_from_samples(samples, actuals)
+                return forecast
+
+        if self._fast_predictor is None:
+            self._fast_predictor = FastProphetPredictor.from_prophet(self.model)
+        if seed is None:
+            seed = int(np.random.randint(0, 2**31 - 1))
+        with span("model.predict.fast_engine"):
+            return self._fast_predictor.predict(
+                future_df, rng=np.random.default_rng(seed), quantiles=levels, crps=crps
+            )
+
+    def make_future_frame(self, periods: int, include_history: bool = True) -> pd.DataFrame:
+        """Build ``ds`` plus calendar regressors for the next ``periods`` days.
+
+        Mirrors ``Prophet.make_future_dataframe`` (daily frequency) but also
+        fills the holiday and day-of-week regressors the model was fitted with.
+        The horizon part is memoized by the future builder per (start, periods).
+
+        Args:
+            periods: Number of days after the end of the training data
+            include_history: Prepend the training dates (as Prophet does)
+
+        Returns:
+            DataFrame with ``ds`` and the calendar regressor columns
+
+        Raises:
+            RuntimeError: If model hasn't been fitted
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model must be fitted before building a future frame")
+
+        builder = self.future_builder or default_future_builder()
+        history_dates = self.model.history_dates
+        start = history_dates.max() + pd.Timedelta(days=1)
+        future = builder.horizon_frame(start, periods, self.regressor_names)
+        if not include_history:
+            return future
+
+        history = builder.regressor_frame(history_dates, self.regressor_names)
+        return pd.concat([history, future], ignore_index=True)
+
+    @timed("model.predict")
+    def predict(
+        self,
+        periods: int | None = None,
+        future_df: pd.DataFrame | None = None,
+        engine: PredictEngine = "auto",
+        seed: int | None = None,
+        quantiles: Sequence[float] = (),
+    ) -> pd.DataFrame:
         """Generate forecasts.
 
         Args:
             periods: Number of periods to forecast (if future_df not provided)
             future_df: Pre-built future DataFrame (if provided, periods is ignored)
+            engine: "auto" (vectorized when supported), "fast", or "prophet"
+            seed: Seed for the uncertainty sample paths
+            quantiles: Quantile levels to add as ``yhat_p*`` columns
+                (e.g. ``DEFAULT_QUANTILES`` gives yhat_p10/p50/p90/p95)
 
         Returns:
-            DataFrame with columns ds, yhat, yhat_lower, yhat_upper, and components
+            DataFrame with columns ds, yhat, yhat_lower, yhat_upper, any
+            quantile columns, and components
 
         Raises:
             RuntimeError: If model hasn't been fitted
@@ -143,9 +317,9 @@ class ProphetDailyModel:
                 raise ValueError("Must provide either periods or future_df")
 
             logger.info("Making future dataframe for %d periods", periods)
-            future_df = self.model.make_future_dataframe(periods=periods)
+            future_df = self.make_future_frame(periods)
 
-            # Add regressors with zeros (placeholder - caller should set properly)
+            # Calendar regressors are derived from the dates; anything else is unknown
             for reg in self.regressor_names:
                 if reg not in future_df.columns:
                     future_df[reg] = 0
@@ -156,11 +330,19 @@ class ProphetDailyModel:
                     )
 
         logger.info("Generating forecast for %d periods", len(future_df))
-        forecast = self.model.predict(future_df)
+        forecast = self._run_predict(future_df, engine, seed, quantiles)
 
         return forecast
 
-    def forecast_holdout(self, test_df: pd.DataFrame) -> pd.DataFrame:
+    @timed("model.forecast_holdout")
+    def forecast_holdout(
+        self,
+        test_df: pd.DataFrame,
+        engine: PredictEngine = "auto",
+        seed: int | None = None,
+        quantiles: Sequence[float] = (),
+        crps: bool = False,
+    ) -> pd.DataFrame:
         """Generate forecasts for a held-out test set.
 
         This is useful for backtesting where you have actual future data
@@ -168,6 +350,11 @@ class ProphetDailyModel:
 
         Args:
             test_df: DataFrame with 'ds' and regressor columns
+            engine: "auto" (vectorized when supported), "fast", or "prophet"
+            seed: Seed for the uncertainty sample paths
+            quantiles: Quantile levels to add as ``yhat_p*`` columns
+            crps: Add a per-row ``crps`` column scoring the uncertainty
+                samples against ``test_df["y"]``
 
         Returns:
             Forecast DataFrame aligned with test_df dates
@@ -181,7 +368,10 @@ class ProphetDailyModel:
                 raise ValueError(f"Regressor '{reg}' not found in test data")
 
         logger.info("Forecasting holdout period: %d days", len(test_df))
-        forecast = self.model.predict(test_df)
+        if crps and "y" not in test_df.columns:
+            raise ValueError("CRPS needs the actuals in test_df['y']")
+
+        forecast = self._run_predict(test_df, engine, seed, quantiles, crps)
 
         return forecast
 
@@ -250,6 +440,11 @@ class ProphetDailyModel:
         instance.config = save_obj["config"]
         instance.regressor_names = save_obj["regressors"]
         instance.is_fitted = save_obj["is_fitted"]
+        instance.holidays = instance.model.holidays
+        instance.future_builder = None
+        instance.fit_seconds = None
+        instance.fit_from_cache = False
+        instance._fast_predictor = None
 
         logger.info(
             "Model loaded from %s (saved at %s)",
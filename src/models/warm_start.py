@@ -0,0 +1,153 @@
+"""Warm-start support for refitting Prophet on nested training windows.
+
+Prophet's Stan parameters live in a scaled space: time is mapped onto
+[0, 1] over the training window and the target is divided by its absolute
+maximum. When an expanding-window fold grows, both scales move and the
+changepoint grid is re-placed, so the previous fold's parameters cannot be
+reused verbatim. This module converts a fitted model into a unit-free
+description of its trend and re-expresses it on the next fold's grid.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+logger = logging.getLogger(__name__)
+
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(slots=True)
+class WarmStartState:
+    """Fitted Prophet parameters together with the scales they were fitted in.
+
+    Attributes:
+        start: First training date of the fitted model
+        t_scale_days: Length of the training window in days
+        y_scale: Target scale used during fitting
+        k: Base trend slope (scaled units)
+        m: Trend offset (scaled units)
+        delta: Slope changes at each changepoint (scaled units)
+        changepoints: Changepoint dates matching ``delta``
+        beta: Seasonality and regressor coefficients
+        sigma_obs: Observation noise (scaled units)
+        seasonality_mode: "additive" or "multiplicative"
+    """
+
+    start: pd.Timestamp
+    t_scale_days: float
+    y_scale: float
+    k: float
+    m: float
+    delta: np.ndarray
+    changepoints: np.ndarray
+    beta: np.ndarray
+    sigma_obs: float
+    seasonality_mode: str
+
+    @classmethod
+    def from_prophet(cls, model: Prophet) -> WarmStartState:
+        """Capture the MAP parameters of a fitted Prophet model."""
+
+        if model.history is None:
+            raise RuntimeError("Prophet model must be fitted before capturing warm-start state")
+
+        params = model.params
+        changepoints = (
+            np.asarray(model.changepoints, dtype="datetime64[ns]")
+            if model.changepoints is not None and len(model.changepoints) > 0
+            else np.array([], dtype="datetime64[ns]")
+        )
+        delta = np.nanmean(np.atleast_2d(params["delta"]), axis=0)
+        if changepoints.size == 0:
+            # Prophet keeps a single dummy changepoint at t=0 when none are placed
+            changepoints = np.array([model.start], dtype="datetime64[ns]")
+            delta = delta[:1]
+
+        return cls(
+            start=pd.Timestamp(model.start),
+            t_scale_days=model.t_scale.total_seconds() / _SECONDS_PER_DAY,
+            y_scale=float(model.y_scale),
+            k=float(np.nanmean(params["k"])),
+            m=float(np.nanmean(params["m"])),
+            delta=np.asarray(delta, dtype=float),
+            changepoints=changepoints,
+            beta=np.nanmean(np.atleast_2d(params["beta"]), axis=0).astype(float),
+            sigma_obs=float(np.nanmean(params["sigma_obs"])),
+            seasonality_mode=model.seasonality_mode,
+        )
+
+    def _days_since_start(self, dates: np.ndarray) -> np.ndarray:
+        offsets = (dates - np.datetime64(self.start, "ns")).astype("timedelta64[ns]")
+        return offsets.astype(np.int64) / 1e9 / _SECONDS_PER_DAY
+
+    def slope_per_day(self, dates: np.ndarray) -> np.ndarray:
+        """Trend slope (target units per day) in effect at each date."""
+
+        idx = np.searchsorted(self.changepoints, dates, side="right")
+        cumulative = np.concatenate(([0.0], np.cumsum(self.delta)))
+        slope_scaled = self.k + cumulative[idx]
+        return slope_scaled * self.y_scale / self.t_scale_days
+
+    def trend_level(self, dates: np.ndarray) -> np.ndarray:
+        """Trend value (target units) at each date."""
+
+        t = self._days_since_start(dates) / self.t_scale_days
+        cp_t = self._days_since_start(self.changepoints) / self.t_scale_days
+        active = cp_t[None, :] <= t[:, None]
+        k_t = self.k + (active * self.delta).sum(axis=1)
+        m_t = self.m + (active * (-self.delta * cp_t)).sum(axis=1)
+        return (k_t * t + m_t) * self.y_scale
+
+    def to_stan_init(self, model: Prophet, train_df: pd.DataFrame) -> dict[str, Any]:
+        """Re-express this state as a Stan init for ``model`` on ``train_df``.
+
+        The changepoint grid, time scale, and target scale are derived the same
+        way ``Prophet.fit`` derives them, so the returned ``delta`` has exactly
+        one entry per new changepoint and the implied trend matches the
+        previous fit over the shared part of the window.
+        """
+
+        history = train_df[train_df["y"].notnull()].sort_values("ds")
+        ds = history["ds"].to_numpy(dtype="datetime64[ns]")
+        new_start = ds[0]
+        new_t_scale_days = (ds[-1] - new_start).astype("timedelta64[ns]").astype(np.int64) / 1e9 / _SECONDS_PER_DAY
+        new_y_scale = float(np.abs(history["y"].to_numpy(dtype=float)).max()) or 1.0
+
+        new_changepoints = _placed_changepoints(ds, model.n_changepoints, model.changepoint_range)
+        # Same dummy changepoint convention as Prophet when none can be placed
+        rate_dates = new_changepoints if new_changepoints.size else np.array([new_start])
+
+        rate_scale = new_t_scale_days / new_y_scale
+        k_new = float(self.slope_per_day(np.array([new_start]))[0] * rate_scale)
+        rates = self.slope_per_day(rate_dates) * rate_scale
+        delta_new = np.diff(np.concatenate(([k_new], rates))) if new_changepoints.size else np.zeros(1)
+        m_new = float(self.trend_level(np.array([new_start]))[0] / new_y_scale)
+
+        value_ratio = self.y_scale / new_y_scale
+        beta = self.beta * value_ratio if self.seasonality_mode == "additive" else self.beta.copy()
+
+        return {
+            "k": k_new,
+            "m": m_new,
+            "delta": delta_new,
+            "beta": beta,
+            "sigma_obs": max(self.sigma_obs * value_ratio, 1e-6),
+        }
+
+
+def _placed_changepoints(ds: np.ndarray, n_changepoints: int, changepoint_range: float) -> np.ndarray:
+    """Replicate Prophet's default changepoint placement for sorted dates."""
+
+    hist_size = int(np.floor(len(ds) * changepoint_range))
+    n_changepoints = min(n_changepoints, hist_size - 1)
+    if n_changepoints <= 0:
+        return np.array([], dtype="datetime64[ns]")
+    cp_indexes = np.linspace(0, hist_size - 1, n_changepoints + 1).round().astype(int)
+    return ds[cp_indexes[1:]]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from evaluation.calibration import apply_calibration, build_conformal_table, calibrate_forecasts
+from evaluation.metrics import calculate_coverage
+from evaluation.online_calibration import OnlineCalibrator, P2Quantile
+
+
+def _cv_predictions(n_days: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range("2024-01-01", periods=n_days, freq="D")
+    # Weekends are much noisier than weekdays
+    noise = np.where(ds.dayofweek >= 5, 60.0, 10.0)
+    yhat = np.full(n_days, 300.0)
+    return pd.DataFrame(
+        {
+            "ds": ds,
+            "y": yhat + rng.normal(0, noise),
+            "yhat": yhat,
+            "yhat_lower": yhat - 5,
+            "yhat_upper": yhat + 5,
+        }
+    )
+
+
+def test_conformal_rank_and_per_dow_fallback() -> None:
+    scores = np.arange(1.0, 11.0)
+    dows = np.array([0] * 9 + [1])
+    table = build_conformal_table(scores, dows, target_coverage=0.8, method="absolute", per_dow=True)
+
+    assert table.quantiles[-1] == 9.0  # ceil(11 * 0.8) = 9th smallest
+    assert table.quantiles[0] == 8.0  # ceil(10 * 0.8) = 8th of Monday's nine
+    assert 1 not in table.quantiles  # a single Tuesday score is too few
+    assert table.lookup(np.array([0, 1]))[1] == 9.0
+
+
+def test_conformal_calibration_reaches_target_coverage() -> None:
+    calibration_set = _cv_predictions(700, seed=0)
+    holdout = _cv_predictions(700, seed=1)
+
+    for method in ("absolute", "cqr"):
+        params = calibrate_forecasts(calibration_set, 0.8, bias_shrinkage=0.0, method=method, per_dow=True)
+        calibrated = apply_calibration(holdout[["ds", "yhat", "yhat_lower", "yhat_upper"]], params)
+        coverage = calculate_coverage(holdout["y"], calibrated["yhat_lower"], calibrated["yhat_upper"])
+        assert 0.75 <= coverage <= 0.85
+
+        weekend = calibrated["ds"].dt.dayofweek >= 5
+        assert calibrated.loc[weekend, "conformal_margin"].min() > calibrated.loc[~weekend, "conformal_margin"].max()
+
+
+def test_p2_sketch_tracks_the_empirical_quantile() -> None:
+    values = np.random.default_rng(5).exponential(10.0, 5000)
+    sketch = P2Quantile(0.8)
+    for value in values:
+        sketch.update(value)
+
+    assert abs(sketch.value() - np.quantile(values, 0.8)) < 0.05 * np.quantile(values, 0.8)
+
+
+def test_p2_sketch_does_not_drop_to_the_median_after_warmup() -> None:
+    values = ((np.arange(40) * 17) % 40).astype(float)
+    sketch = P2Quantile(0.8, warmup=10)
+    for count, value in enumerate(values, start=1):
+        sketch.update(value)
+        seen = np.sort(values[:count])
+        # Stays above the median of what has been seen, through and after warm-up
+        if count >= 5:
+            assert sketch.value() > np.median(seen)
+        if count == 10:
+            assert sketch.value() == seen[round(9 * 0.8)]
+
+    restored = P2Quantile.from_dict(sketch.to_dict())
+    assert restored == sketch
+
+
+def test_online_calibrator_round_trips_and_keeps_learning(tmp_path) -> None:
+    history = _cv_predictions(400, seed=0)
+    calibrator = OnlineCalibrator.from_history(history, target_coverage=0.8, bias_shrinkage=0.0)
+    path = calibrator.save(tmp_path / "calibrator.json")
+    restored = OnlineCalibrator.load(path)
+    assert restored.to_dict() == calibrator.to_dict()
+
+    new_days = _cv_predictions(400, seed=1)
+    new_days["ds"] = new_days["ds"] + pd.Timedelta(days=400)
+    calibrated = apply_calibration(new_days[["ds", "yhat", "yhat_lower", "yhat_upper"]], restored.to_parameters())
+    coverage = calculate_coverage(new_days["y"], calibrated["yhat_lower"], calibrated["yhat_upper"])
+    assert 0.75 <= coverage <= 0.85
+    assert restored.margin(5) > restored.margin(0)
+
+    restored.update_frame(new_days)
+    assert restored.pooled.count == 800
+    assert 0.75 <= restored.observed_coverage <= 0.85
+
+
+def test_online_calibrator_ignores_actuals_it_has_already_seen() -> None:
+    window = _cv_predictions(14, seed=2)
+    calibrator = OnlineCalibrator(target_coverage=0.8)
+    assert calibrator.update_frame(window) == 14
+    state = calibrator.to_dict()
+
+    # A rerun over the same holdout, and a single stale row, change nothing
+    assert calibrator.update_frame(window) == 0
+    assert not calibrator.update(window["ds"].iloc[3], 1e6, 0.0)
+    assert calibrator.to_dict() == state
+    assert OnlineCalibrator.from_dict(state).last_ds == window["ds"].max()
+
+    # An overlapping window only adds its new days
+    overlap = _cv_predictions(21, seed=3)
+    assert calibrator.update_frame(overlap) == 7
+    assert calibrator.pooled.count == 21
+
+
+def test_quantile_offsets_recalibrate_every_level() -> None:
+    cv = _cv_predictions(700, seed=0)
+    # Quantiles that are far too narrow around the point forecast
+    for column, level in (("yhat_p10", 0.1), ("yhat_p50", 0.5), ("yhat_p90", 0.9)):
+        cv[column] = cv["yhat"] + (level - 0.5) * 10
+    holdout = _cv_predictions(700, seed=1)
+    for column in ("yhat_p10", "yhat_p50", "yhat_p90"):
+        holdout[column] = cv[column].to_numpy()
+
+    params = calibrate_forecasts(cv, 0.8, bias_shrinkage=0.0)
+    assert set(params.quantile_offsets) == {"yhat_p10", "yhat_p50", "yhat_p90"}
+
+    calibrated = apply_calibration(holdout.drop(columns="y"), params)
+    for column, level in (("yhat_p10", 0.1), ("yhat_p50", 0.5), ("yhat_p90", 0.9)):
+        assert abs((holdout["y"] <= calibrated[column]).mean() - level) < 0.05
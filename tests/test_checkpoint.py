@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from evaluation.checkpoint import FoldCheckpoint
+from evaluation.cross_validation import FoldResult, FoldSplit
+
+
+def _split() -> FoldSplit:
+    return FoldSplit(
+        train_start=pd.Timestamp("2025-01-01"),
+        train_end=pd.Timestamp("2025-02-25"),
+        test_start=pd.Timestamp("2025-02-26"),
+        test_end=pd.Timestamp("2025-02-27"),
+        train_indices=range(0, 56),
+        test_indices=range(56, 58),
+    )
+
+
+def test_checkpoint_round_trips_cells_and_skips_torn_lines(tmp_path) -> None:
+    config = {"changepoint_prior_scale": 0.05, "seasonality_mode": "additive"}
+    forecast = pd.DataFrame(
+        {
+            "ds": pd.date_range("2025-02-26", periods=2, freq="D"),
+            "yhat": [10.0, 11.0],
+            "yhat_lower": [8.0, 9.0],
+            "yhat_upper": [12.0, 13.0],
+            "y": [10.5, 12.0],
+        }
+    )
+    result = FoldResult(fold_id=3, split=_split(), metrics={"mae": 0.75}, forecast=forecast, fit_seconds=1.5)
+
+    checkpoint = FoldCheckpoint.for_run(tmp_path, "run1")
+    checkpoint.record(config, result)
+    with open(checkpoint.path, "a") as fh:
+        fh.write('{"key": "torn')  # simulated crash mid-write
+
+    resumed = FoldCheckpoint.for_run(tmp_path, "run1")
+    restored = resumed.get(dict(config), _split(), fold_id=3)
+
+    assert restored is not None
+    assert restored.metrics == {"mae": 0.75}
+    assert restored.fit_seconds == 1.5
+    pd.testing.assert_frame_equal(restored.forecast, forecast)
+    assert resumed.get({**config, "seasonality_mode": "multiplicative"}, _split(), fold_id=3) is None
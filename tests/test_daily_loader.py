@@ -1,8 +1,33 @@
 from __future__ import annotations
 
+import os
+import sqlite3
+
 import pandas as pd
+import pytest
+
+from data import daily_loader, future, holidays
+from data.daily_loader import clear_incremental_loaders, load_daily_data, prepare_prophet_frame
+from data.future import FutureFrameBuilder
+from data.holidays import HolidayCalendar
+from data.incremental import IncrementalDailyLoader
+from data.snapshot import read_snapshot, snapshot_path
+
 
-from data.daily_loader import prepare_prophet_frame
+def _make_db(path, last_updated: str, totals: list[int | None]) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS days (date TEXT PRIMARY KEY, has_email_data INTEGER, "
+            "has_sla_data INTEGER, total_emails INTEGER)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS metadata (id INTEGER PRIMARY KEY, last_updated TEXT)")
+        conn.execute("DELETE FROM days")
+        dates = pd.date_range("2025-01-01", periods=len(totals), freq="D").strftime("%Y-%m-%d")
+        conn.executemany(
+            "INSERT INTO days VALUES (?, 1, 0, ?)",
+            list(zip(dates, totals)),
+        )
+        conn.execute("INSERT OR REPLACE INTO metadata VALUES (1, ?)", (last_updated,))
 
 
 def test_prepare_prophet_frame_dow_regressors() -> None:
@@ -18,3 +43,141 @@ def test_prepare_prophet_frame_dow_regressors() -> None:
     assert row_sums.isin({0, 1}).all()
     sundays = result["ds"].dt.dayofweek == 6
     assert (row_sums[sundays] == 0).all()
+
+
+def test_load_daily_data_snapshot_matches_sql_and_invalidates(tmp_path) -> None:
+    db_path = tmp_path / "days.db"
+    snapshot_dir = tmp_path / "snapshots"
+    _make_db(db_path, "2025-01-10T00:00:00", [10, 11, None, 13, 14])
+
+    direct = load_daily_data(db_path, start_date="2025-01-02")
+    via_snapshot = load_daily_data(db_path, start_date="2025-01-02", snapshot_dir=snapshot_dir)
+    cached = load_daily_data(db_path, start_date="2025-01-02", snapshot_dir=snapshot_dir)
+
+    for frame in (via_snapshot, cached):
+        assert frame["date"].tolist() == direct["date"].tolist()
+        assert frame["target"].tolist() == direct["target"].tolist()
+
+    _make_db(db_path, "2025-01-11T00:00:00", [10, 11, 12, 13, 14, 15])
+    refreshed = load_daily_data(db_path, snapshot_dir=snapshot_dir)
+    assert refreshed["target"].tolist() == [10, 11, 12, 13, 14, 15]
+
+    # The snapshot itself is a read-only map of every column; loads hand out a writable copy
+    mapped = read_snapshot(snapshot_path(snapshot_dir, db_path, "total_emails"))
+    assert not any(mapped[name].to_numpy().flags.writeable for name in mapped.columns)
+    with pytest.raises(ValueError):
+        mapped["target"].to_numpy()[0] = 0
+    refreshed.loc[0, "target"] = 0
+
+
+def test_incremental_loader_fetches_only_recent_rows(tmp_path) -> None:
+    db_path = tmp_path / "days.db"
+    _make_db(db_path, "v1", list(range(30)))
+
+    loader = IncrementalDailyLoader(db_path, snapshot_dir=tmp_path / "snapshots", revision_days=2)
+    assert len(loader.refresh()) == 30
+    assert loader.last_stats.mode == "full"
+
+    loader.refresh()
+    assert loader.last_stats.mode == "unchanged"
+
+    _make_db(db_path, "v2", list(range(29)) + [100, 30])
+    frame = loader.refresh()
+    assert loader.last_stats.mode == "incremental"
+    assert loader.last_stats.rows_fetched == 4  # revision window (2 days) + last loaded day + new day
+    assert frame["target"].tolist()[-2:] == [100, 30]
+
+    restored = IncrementalDailyLoader(db_path, snapshot_dir=tmp_path / "snapshots", revision_days=2)
+    restored.refresh()
+    assert restored.last_stats.mode == "unchanged"
+    assert restored.frame["target"].tolist() == frame["target"].tolist()
+
+
+def test_incremental_load_returns_a_private_copy(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(daily_loader, "MAX_INCREMENTAL_LOADERS", 2)
+    clear_incremental_loaders()
+    db_path = tmp_path / "days.db"
+    _make_db(db_path, "v1", list(range(10)))
+
+    first = load_daily_data(db_path, incremental=True)
+    first.loc[:, "target"] = -1
+    assert load_daily_data(db_path, incremental=True)["target"].tolist() == list(range(10))
+
+    for n in range(3):
+        other = tmp_path / f"other_{n}.db"
+        _make_db(other, "v1", [1, 2])
+        load_daily_data(other, incremental=True)
+    assert len(daily_loader._INCREMENTAL_LOADERS) == 2
+    assert str(db_path.resolve()) not in {key[0] for key in daily_loader._INCREMENTAL_LOADERS}
+
+    clear_incremental_loaders()
+    assert not daily_loader._INCREMENTAL_LOADERS
+
+
+def test_prepare_prophet_frame_holiday_flags_follow_calendar_dates() -> None:
+    dates = pd.date_range("2025-01-03", periods=5, freq="D")  # Fri, Sat, Sun, Mon, Tue
+    df = pd.DataFrame({"date": dates, "target": range(len(dates))}, index=range(10, 15))
+
+    result = prepare_prophet_frame(
+        df, include_regressors=True, regressor_type="both", calendar=HolidayCalendar.weekends_only()
+    )
+
+    assert list(result.index) == list(df.index)
+    assert result["is_holiday"].tolist() == [0, 1, 1, 0, 0]
+    assert result["pre_holiday"].tolist() == [1, 1, 0, 0, 0]
+    assert result["post_holiday"].tolist() == [0, 0, 1, 1, 0]
+    assert result["is_holiday"].dtype == "int64"
+    assert result["dow_0"].dtype == bool
+    assert "dow_2" not in result.columns  # no Wednesday present, as with pd.get_dummies
+
+
+def test_holiday_calendar_flags_listed_holidays_across_gaps() -> None:
+    calendar = HolidayCalendar.from_dates(pd.to_datetime(["2025-01-20"]), ["mlk_day"])
+    # Fri, then Mon (MLK day) and Tue with the weekend rows missing
+    dates = pd.to_datetime(["2025-01-17", "2025-01-20", "2025-01-21"]).to_numpy()
+
+    assert calendar.is_holiday(dates).tolist() == [False, True, False]
+    assert calendar.pre_holiday(dates).tolist() == [True, False, False]  # Saturday follows Friday
+    assert calendar.post_holiday(dates).tolist() == [False, True, True]  # Sunday precedes Monday
+
+    holidays = calendar.to_prophet_holidays(upper_window=1)
+    assert holidays["holiday"].tolist() == ["mlk_day"]
+    assert holidays["ds"].tolist() == [pd.Timestamp("2025-01-20")]
+    assert holidays["upper_window"].tolist() == [1]
+
+
+def test_future_frame_matches_prepare_prophet_frame_and_is_memoized() -> None:
+    calendar = HolidayCalendar.from_dates(pd.to_datetime(["2025-01-20"]))
+    builder = FutureFrameBuilder(calendar)
+    names = ["is_holiday", "pre_holiday", "post_holiday", "dow_0", "dow_4"]
+
+    future = builder.horizon_frame("2025-01-15", 14, names)
+    history = pd.DataFrame({"date": pd.date_range("2025-01-15", periods=14, freq="D"), "target": 0.0})
+    expected = prepare_prophet_frame(history, regressor_type="both", calendar=calendar)
+
+    assert list(future.columns) == ["ds", *names]
+    pd.testing.assert_frame_equal(future, expected[["ds", *names]])
+
+    future["is_holiday"] = -1  # callers get a copy, not the memoized frame
+    again = builder.horizon_frame(pd.Timestamp("2025-01-15"), 14, names)
+    assert (again["is_holiday"] >= 0).all()
+    assert (builder.hits, builder.misses) == (1, 1)
+
+
+def test_default_future_builder_follows_holiday_csv_edits(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "holidays.csv"
+    csv_path.write_text("date,holiday\n2025-01-20,mlk_day\n")
+    monkeypatch.setattr(future, "DEFAULT_HOLIDAYS_PATH", csv_path)
+    monkeypatch.setattr(holidays, "DEFAULT_HOLIDAYS_PATH", csv_path)
+
+    builder = future.default_future_builder()
+    assert builder is future.default_future_builder()
+    frame = builder.horizon_frame("2025-01-20", 2, ["is_holiday"])
+    assert frame["is_holiday"].tolist() == [1, 0]
+
+    csv_path.write_text("date,holiday\n2025-01-21,company_day\n")
+    os.utime(csv_path, (csv_path.stat().st_atime, csv_path.stat().st_mtime + 10))
+    edited = future.default_future_builder()
+    assert edited is not builder
+    assert edited.calendar is holidays.load_holiday_calendar()
+    assert edited.horizon_frame("2025-01-20", 2, ["is_holiday"])["is_holiday"].tolist() == [0, 1]
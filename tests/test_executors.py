@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluation import cross_validation
+from evaluation.cross_validation import FoldResult, FoldTask, generate_expanding_window_splits, run_fold_tasks
+from evaluation.executors import derive_task_seed, map_tasks, resolve_n_jobs
+
+
+def _square_with_seed(task: int) -> tuple[int, int]:
+    return task * task, derive_task_seed(42, task)
+
+
+def _fake_fold(df, split, model_config, regressor_columns, seed=None, **kwargs):
+    """Stand-in for ``run_prophet_fold`` whose forecast depends only on the task seed."""
+
+    test = df.iloc[split.test_indices.start : split.test_indices.stop]
+    rng = np.random.default_rng(seed)
+    yhat = test["y"].to_numpy() + rng.normal(0, 5, len(test))
+    forecast = pd.DataFrame(
+        {"ds": test["ds"].to_numpy(), "yhat": yhat, "yhat_lower": yhat - 10, "yhat_upper": yhat + 10}
+    )
+    forecast["y"] = test["y"].to_numpy()
+    return FoldResult(
+        fold_id=0,
+        split=split,
+        metrics={"seed": seed, "scale": model_config["scale"], "mae": float(np.abs(forecast["y"] - yhat).mean())},
+        forecast=forecast,
+    )
+
+
+def test_resolve_n_jobs_edge_cases(monkeypatch) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(0) == 1
+    assert resolve_n_jobs(1) == 1
+    assert resolve_n_jobs(-1) == 4
+    assert resolve_n_jobs(-2) == 3
+    assert resolve_n_jobs(-10) == 1  # never fewer than one worker
+    assert resolve_n_jobs(16) == 16  # explicit counts above the CPU count are honoured
+
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert resolve_n_jobs(-1) == 1
+
+
+def test_map_tasks_preserves_order_and_seeds_on_every_executor() -> None:
+    tasks = list(range(12))
+    expected = [_square_with_seed(task) for task in tasks]
+
+    assert map_tasks(_square_with_seed, tasks, "serial") == expected
+    assert map_tasks(_square_with_seed, tasks, "thread", n_jobs=4) == expected
+    assert map_tasks(_square_with_seed, tasks, "process", n_jobs=3) == expected
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert map_tasks(_square_with_seed, tasks, pool) == expected
+    assert map_tasks(_square_with_seed, [], "process", n_jobs=3) == []
+
+    with pytest.raises(ValueError):
+        map_tasks(_square_with_seed, tasks, "gpu")  # type: ignore[arg-type]
+
+
+def test_run_fold_tasks_is_identical_across_executors(monkeypatch) -> None:
+    monkeypatch.setattr(cross_validation, "run_prophet_fold", _fake_fold)
+    df = pd.DataFrame(
+        {"ds": pd.date_range("2024-01-01", periods=100, freq="D"), "y": np.linspace(100.0, 200.0, 100)}
+    )
+    splits = generate_expanding_window_splits(df, horizon=10, initial_train_size=60, max_folds=4)
+    tasks = [
+        FoldTask(config_idx, fold_idx, {"scale": config_idx}, split, derive_task_seed(42, config_idx, fold_idx))
+        for config_idx in range(3)
+        for fold_idx, split in enumerate(splits)
+    ]
+
+    serial = run_fold_tasks(df, tasks, [], executor="serial")
+    threaded = run_fold_tasks(df, tasks, [], executor="thread", n_jobs=4)
+    # Forked workers inherit the stubbed fold function
+    with ProcessPoolExecutor(max_workers=3, mp_context=get_context("fork")) as pool:
+        processed = run_fold_tasks(df, tasks, [], executor=pool)
+
+    for results in (threaded, processed):
+        assert len(results) == len(tasks)
+        for task, reference, result in zip(tasks, serial, results):
+            assert result.fold_id == task.fold_index
+            assert result.metrics["seed"] == task.seed == reference.metrics["seed"]
+            assert result.metrics["scale"] == task.config["scale"]
+            assert result.metrics["mae"] == reference.metrics["mae"]
+            pd.testing.assert_frame_equal(result.forecast, reference.forecast)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from data.daily_loader import prepare_prophet_frame
+from models.prophet_daily import ProphetDailyModel
+from models.uncertainty import DEFAULT_QUANTILES
+
+
+def _synthetic_frame(n_days: int = 70) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2025-01-06", periods=n_days, freq="D")
+    weekly = np.where(dates.dayofweek >= 5, -40.0, 25.0)
+    target = 200 + 0.5 * np.arange(n_days) + weekly + rng.normal(0, 5, n_days)
+    return prepare_prophet_frame(pd.DataFrame({"date": dates, "target": target}), regressor_type="both")
+
+
+def test_fast_engine_matches_prophet_predict() -> None:
+    prophet_df = _synthetic_frame()
+    train_df, test_df = prophet_df.iloc[:-14], prophet_df.iloc[-14:]
+
+    for mode in ("additive", "multiplicative"):
+        model = ProphetDailyModel(seasonality_mode=mode)
+        model.add_regressors([col for col in prophet_df.columns if col not in ("ds", "y")])
+        model.fit(train_df)
+
+        expected = model.forecast_holdout(test_df, engine="prophet")
+        actual = model.forecast_holdout(test_df, engine="fast")
+
+        point_cols = [col for col in expected.columns if col not in ("yhat_lower", "yhat_upper", "trend_lower", "trend_upper")]
+        assert list(actual.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(actual[point_cols], expected[point_cols], check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_fast_intervals_are_seeded_and_bracket_yhat() -> None:
+    prophet_df = _synthetic_frame()
+    train_df, test_df = prophet_df.iloc[:-14], prophet_df.iloc[-14:]
+
+    model = ProphetDailyModel(uncertainty_samples=400)
+    model.add_regressors([col for col in prophet_df.columns if col not in ("ds", "y")])
+    model.fit(train_df)
+
+    first = model.forecast_holdout(test_df, engine="fast", seed=7)
+    second = model.forecast_holdout(test_df, engine="fast", seed=7)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert (first["yhat_lower"] < first["yhat"]).all()
+    assert (first["yhat"] < first["yhat_upper"]).all()
+    assert (first["trend_lower"] <= first["trend_upper"]).all()
+
+    # The sampled band sits around the full forecast, like Prophet's own intervals
+    np.random.seed(0)
+    reference = model.forecast_holdout(test_df, engine="prophet")
+    reference_width = reference["yhat_upper"] - reference["yhat_lower"]
+    midpoint = (first["yhat_lower"] + first["yhat_upper"]) / 2
+    assert (np.abs(midpoint - reference["yhat"]) < 0.15 * reference_width).all()
+    width_ratio = (first["yhat_upper"] - first["yhat_lower"]) / reference_width
+    assert width_ratio.between(0.75, 1.33).all()
+
+
+def test_quantile_grid_shares_the_interval_sample_batch() -> None:
+    prophet_df = _synthetic_frame()
+    train_df, test_df = prophet_df.iloc[:-14], prophet_df.iloc[-14:]
+
+    model = ProphetDailyModel(uncertainty_samples=400)
+    model.add_regressors([col for col in prophet_df.columns if col not in ("ds", "y")])
+    model.fit(train_df)
+
+    plain = model.forecast_holdout(test_df, engine="fast", seed=7)
+    graded = model.forecast_holdout(test_df, engine="fast", seed=7, quantiles=DEFAULT_QUANTILES)
+
+    quantile_cols = ["yhat_p10", "yhat_p50", "yhat_p90", "yhat_p95"]
+    assert list(graded.columns) == list(plain.columns) + quantile_cols
+    pd.testing.assert_frame_equal(graded[plain.columns], plain)
+    # With the default 80% interval, P10/P90 are the interval bounds themselves
+    np.testing.assert_allclose(graded["yhat_p10"], graded["yhat_lower"])
+    np.testing.assert_allclose(graded["yhat_p90"], graded["yhat_upper"])
+    assert (np.diff(graded[quantile_cols].to_numpy(), axis=1) >= 0).all()
+
+
+def test_fast_engine_matches_prophet_with_holidays() -> None:
+    prophet_df = _synthetic_frame()
+    train_df, test_df = prophet_df.iloc[:-14], prophet_df.iloc[-14:]
+    # One holiday only inside the training window, one repeating in the holdout
+    holidays = pd.DataFrame(
+        {
+            "holiday": ["launch", "promo", "promo"],
+            "ds": pd.to_datetime(["2025-01-20", "2025-02-10", "2025-03-12"]),
+            "lower_window": [0, -1, -1],
+            "upper_window": [1, 0, 0],
+        }
+    )
+
+    model = ProphetDailyModel(holidays=holidays)
+    model.fit(train_df[["ds", "y"]])
+
+    expected = model.forecast_holdout(test_df[["ds", "y"]], engine="prophet")
+    actual = model.forecast_holdout(test_df[["ds", "y"]], engine="fast")
+
+    assert model._fast_predictor.feature_names[-4:] == ["launch_delim_+0", "launch_delim_+1", "promo_delim_+0", "promo_delim_-1"]
+    point_cols = [col for col in expected.columns if col not in ("yhat_lower", "yhat_upper", "trend_lower", "trend_upper")]
+    pd.testing.assert_frame_equal(actual[point_cols], expected[point_cols], check_exact=False, rtol=1e-9, atol=1e-9)
+    assert (actual["promo"] != 0).any()
+
+
+def test_fast_quantiles_agree_with_prophet_engine() -> None:
+    prophet_df = _synthetic_frame()
+    train_df, test_df = prophet_df.iloc[:-14], prophet_df.iloc[-14:]
+
+    model = ProphetDailyModel(uncertainty_samples=400)
+    model.add_regressors([col for col in prophet_df.columns if col not in ("ds", "y")])
+    model.fit(train_df)
+
+    fast = model.forecast_holdout(test_df, engine="fast", seed=7, quantiles=DEFAULT_QUANTILES)
+    reference = model.forecast_holdout(test_df, engine="prophet", seed=7, quantiles=DEFAULT_QUANTILES)
+
+    # Both engines sample the same predictive distribution; allow Monte Carlo noise
+    spread = (reference["yhat_p90"] - reference["yhat_p10"]).to_numpy()
+    for column in ("yhat_p10", "yhat_p50", "yhat_p90", "yhat_p95"):
+        assert (np.abs(fast[column] - reference[column]) < 0.25 * spread).all(), column
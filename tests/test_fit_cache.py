@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+
+from models.fit_cache import FitCache, fit_cache_key
+
+
+def _frame(values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ds": pd.date_range("2025-01-06", periods=len(values), freq="D"),
+            "y": values,
+            "is_holiday": [0] * len(values),
+        }
+    )
+
+
+def test_fit_cache_key_tracks_config_regressors_and_data() -> None:
+    config = {"changepoint_prior_scale": 0.05}
+    base = fit_cache_key(config, ["is_holiday"], _frame([1.0, 2.0, 3.0]))
+
+    assert base == fit_cache_key(dict(config), ["is_holiday"], _frame([1.0, 2.0, 3.0]))
+    assert base != fit_cache_key({"changepoint_prior_scale": 0.1}, ["is_holiday"], _frame([1.0, 2.0, 3.0]))
+    assert base != fit_cache_key(config, [], _frame([1.0, 2.0, 3.0]))
+    assert base != fit_cache_key(config, ["is_holiday"], _frame([1.0, 2.0, 4.0]))
+
+
+def test_fit_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = FitCache(tmp_path, max_entries=2)
+
+    cache.put("a", {"fit": "a"})
+    cache.put("b", {"fit": "b"})
+    os.utime(tmp_path / "a.pkl", (1, 1))
+    os.utime(tmp_path / "b.pkl", (2, 2))
+
+    assert cache.get("a") == {"fit": "a"}  # refreshes "a"
+    cache.put("c", {"fit": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"fit": "a"}
+    assert cache.get("c") == {"fit": "c"}
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
 
-from evaluation.metrics import calculate_baseline_metrics
+from evaluation.baselines import DEFAULT_BASELINES, compute_baselines, trailing_mean
+from evaluation.metrics import (
+    batch_forecast_metrics,
+    breakdown_metrics,
+    calculate_baseline_metrics,
+    calculate_metrics,
+    calculate_r2,
+    compare_to_baselines,
+    pinball_losses,
+    winkler_scores,
+)
+from models.uncertainty import crps_from_samples
 
 
 def test_baseline_metrics_respect_evaluation_window() -> None:
@@ -23,3 +35,176 @@ def test_baseline_metrics_respect_evaluation_window() -> None:
 
     moving_avg = baselines["moving_average_7"]
     assert moving_avg["mae"] >= 0
+
+
+def test_vectorized_baselines_match_loop_reference() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.poisson(300, 400).astype(float)
+
+    expected_ma = np.array(
+        [np.mean(y_true[max(0, i - 7) : i]) if i > 0 else y_true[0] for i in range(len(y_true))]
+    )
+    assert np.allclose(trailing_mean(y_true, 7), expected_ma)
+
+    baselines = calculate_baseline_metrics(
+        y_true, dates=None, evaluation_start_index=300, seasonal_lags=(14, 28), windows=(7, 28)
+    )
+    assert list(baselines) == [
+        "seasonal_naive",
+        "seasonal_naive_14",
+        "seasonal_naive_28",
+        "moving_average_7",
+        "moving_average_28",
+    ]
+    expected_mae = np.mean(np.abs(y_true[300:] - y_true[286:-14]))
+    assert np.isclose(baselines["seasonal_naive_14"]["mae"], expected_mae)
+    assert np.isclose(baselines["moving_average_7"]["mae"], np.mean(np.abs(y_true[300:] - expected_ma[300:])))
+
+
+def test_baseline_zoo_matches_loop_reference() -> None:
+    rng = np.random.default_rng(1)
+    y = rng.poisson(300, 120).astype(float)
+    predictions = compute_baselines(y, ["drift", "seasonal_mean_7", "median_4_weeks", "ewma_0.5"])
+
+    i = 100
+    assert np.isclose(predictions["drift"][0][i], y[i - 1] + (y[i - 1] - y[0]) / (i - 1))
+    assert np.isclose(predictions["seasonal_mean_7"][0][i], np.mean(y[i % 7 : i : 7]))
+    assert np.isclose(predictions["median_4_weeks"][0][i], np.median(y[[i - 7, i - 14, i - 21, i - 28]]))
+    ewma = y[0]
+    for value in y[1:i]:
+        ewma = 0.5 * value + 0.5 * ewma
+    assert np.isclose(predictions["ewma_0.5"][0][i], ewma)
+    assert np.isnan(predictions["median_4_weeks"][0][27])
+
+    baselines = calculate_baseline_metrics(y, dates=None, evaluation_start_index=90, baselines=DEFAULT_BASELINES)
+    assert {"seasonal_naive", "moving_average_7", "drift", "median_4_weeks"} <= set(baselines)
+    assert "seasonal_naive_7" not in baselines
+
+    comparison = compare_to_baselines({"mae": 1.0}, baselines)
+    assert comparison["best_baseline"] == min(baselines, key=lambda name: baselines[name]["mae"])
+    assert set(comparison["baselines"]) == set(baselines)
+
+
+def test_fused_metrics_match_reference_formulas() -> None:
+    rng = np.random.default_rng(2)
+    y_true = rng.poisson(300, 60).astype(float)
+    y_pred = y_true + rng.normal(0, 15, 60)
+
+    metrics = calculate_metrics(y_true, y_pred, y_pred - 20, y_pred + 20)
+
+    residuals = y_pred - y_true
+    assert metrics["mae"] == np.mean(np.abs(residuals))
+    assert np.isclose(metrics["rmse"], np.sqrt(np.mean(residuals**2)))
+    assert np.isclose(metrics["smape"], 100 * np.mean(2 * np.abs(residuals) / (np.abs(y_true) + np.abs(y_pred))))
+    expected_r2 = 1 - np.sum(residuals**2) / np.sum((y_true - y_true.mean()) ** 2)
+    assert np.isclose(metrics["r2"], expected_r2)
+    assert metrics["coverage"] == np.mean(np.abs(residuals) <= 20)
+
+    # Constant target follows sklearn's r2_score convention
+    assert calculate_r2([5.0, 5.0, 5.0], [5.0, 5.0, 5.0]) == 1.0
+    assert calculate_r2([5.0, 5.0, 5.0], [4.0, 5.0, 6.0]) == 0.0
+
+
+def test_batched_metrics_match_per_fold_and_pooled_calls() -> None:
+    rng = np.random.default_rng(3)
+    y_true = rng.poisson(300, (4, 14)).astype(float)
+    y_pred = y_true + rng.normal(0, 15, (4, 14))
+    y_true[3, 10:] = np.nan  # ragged last fold
+    y_pred[3, 10:] = np.nan
+    groups = [0, 0, 1, 1]
+
+    result = batch_forecast_metrics(y_true, y_pred, y_pred - 20, y_pred + 20, groups=groups)
+
+    per_fold = []
+    for row in range(4):
+        valid = ~np.isnan(y_true[row])
+        actual, forecast = y_true[row, valid], y_pred[row, valid]
+        per_fold.append(calculate_metrics(actual, forecast, forecast - 20, forecast + 20))
+        for key in ("mae", "rmse", "smape", "bias", "r2", "coverage"):
+            assert np.isclose(result["per_row"][key][row], per_fold[row][key])
+
+    assert np.isclose(result["per_fold"]["mae"][1], (per_fold[2]["mae"] + per_fold[3]["mae"]) / 2)
+
+    actual = np.concatenate([y_true[2], y_true[3, :10]])
+    forecast = np.concatenate([y_pred[2], y_pred[3, :10]])
+    pooled = calculate_metrics(actual, forecast, forecast - 20, forecast + 20)
+    for key in ("mae", "rmse", "smape", "bias", "r2", "coverage"):
+        assert np.isclose(result["pooled"][key][1], pooled[key])
+    assert result["pooled"]["n_samples"][1] == 24
+
+
+def test_breakdowns_match_groupby_reference() -> None:
+    rng = np.random.default_rng(4)
+    dates = pd.Series(pd.date_range("2024-01-01", periods=45, freq="D"))
+    y_true = rng.poisson(300, 45).astype(float)
+    y_pred = y_true + rng.normal(0, 15, 45)
+
+    metrics = calculate_metrics(y_true, y_pred, dates=dates, breakdowns=("dow", "week_of_month"))
+
+    frame = pd.DataFrame({"error": y_pred - y_true, "dow": dates.dt.day_name()})
+    expected = frame.groupby("dow")["error"]
+    dow = metrics["dow_breakdown"]
+    assert list(dow) == ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    for day, stats in dow.items():
+        assert np.isclose(stats["mae"], expected.apply(lambda e: e.abs().mean())[day])
+        assert np.isclose(stats["bias"], expected.mean()[day])
+        assert stats["n_samples"] == expected.size()[day]
+
+    assert sum(stats["n_samples"] for stats in metrics["week_of_month_breakdown"].values()) == 45
+
+    hourly = pd.date_range("2024-01-01", periods=6, freq="h")
+    by_hour = breakdown_metrics(np.zeros(6), np.arange(6.0), hourly, by="hour")
+    assert by_hour["05:00"] == {"mae": 5.0, "bias": 5.0, "n_samples": 1}
+
+
+def test_probabilistic_scores_match_reference_formulas() -> None:
+    rng = np.random.default_rng(5)
+    samples = rng.normal(100, 10, (6, 40))
+    y_true = rng.normal(100, 10, 6)
+
+    # CRPS: E|X - y| - E|X - X'| / 2 over all sample pairs
+    pairwise = np.abs(samples[:, :, None] - samples[:, None, :]).mean(axis=(1, 2))
+    expected_crps = np.abs(samples - y_true[:, None]).mean(axis=1) - pairwise / 2
+    assert np.allclose(crps_from_samples(samples, y_true), expected_crps)
+
+    levels = (0.1, 0.5, 0.9)
+    quantiles = np.quantile(samples, levels, axis=1).T
+    losses = pinball_losses(y_true, quantiles, levels)
+    for col, tau in enumerate(levels):
+        diff = y_true - quantiles[:, col]
+        assert np.allclose(losses[:, col], np.where(diff >= 0, tau * diff, (tau - 1) * diff))
+
+    lower, upper = quantiles[:, 0], quantiles[:, 2]
+    scores = winkler_scores(np.array([5.0, 0.0, 12.0]), np.zeros(3) + 2, np.zeros(3) + 10, 0.80)
+    assert np.allclose(scores, [8.0, 8.0 + 10 * 2, 8.0 + 10 * 2])
+
+    metrics = calculate_metrics(
+        y_true,
+        quantiles[:, 1],
+        lower,
+        upper,
+        interval_width=0.80,
+        y_quantiles=dict(zip(levels, quantiles.T)),
+        samples=samples,
+    )
+    assert np.isclose(metrics["crps"], expected_crps.mean())
+    assert np.isclose(metrics["pinball"], losses.mean())
+    assert np.isclose(metrics["pinball_by_quantile"]["0.9"], losses[:, 2].mean())
+    assert np.isclose(metrics["winkler"], winkler_scores(y_true, lower, upper, 0.80).mean())
+
+    # Batched: NaN-padded rows score like the unpadded ones
+    padded = np.vstack([y_true, np.r_[y_true[:4], np.nan, np.nan]])
+    batch = batch_forecast_metrics(
+        padded,
+        np.vstack([quantiles[:, 1]] * 2),
+        np.vstack([lower] * 2),
+        np.vstack([upper] * 2),
+        groups=[0, 0],
+        interval_width=[0.80, 0.80],
+        quantile_preds=np.stack([quantiles] * 2),
+        quantile_levels=levels,
+        crps=np.vstack([expected_crps] * 2),
+    )
+    assert np.isclose(batch["per_row"]["crps"][0], expected_crps.mean())
+    assert np.isclose(batch["per_row"]["pinball"][1], losses[:4].mean())
+    assert np.isclose(batch["pooled"]["crps"][0], np.r_[expected_crps, expected_crps[:4]].mean())
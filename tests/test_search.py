@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluation import cross_validation
+from evaluation.cross_validation import FoldResult, generate_expanding_window_splits, grid_search_prophet
+from evaluation.metrics import calculate_metrics
+from evaluation.search import (
+    Categorical,
+    LogUniform,
+    _sample_prior,
+    _suggest_tpe,
+    halving_rungs,
+    successive_halving_prophet,
+    summarize_search,
+)
+from models.prophet_daily import ProphetDailyModel
+from models.uncertainty import DEFAULT_QUANTILES, quantile_column
+
+
+def test_halving_rungs_end_on_all_folds() -> None:
+    assert halving_rungs(4, eta=2) == [1, 2, 4]
+    assert halving_rungs(4, eta=3) == [1, 3, 4]
+    assert halving_rungs(1) == [1]
+    with pytest.raises(ValueError):
+        halving_rungs(4, eta=1)
+
+
+def test_summarize_search_counts_fits_saved() -> None:
+    history = [
+        {"fit_seconds": [1.0, 1.0, 1.0, 1.0]},
+        {"fit_seconds": [1.0, 1.0]},
+        {"fit_seconds": [1.0]},
+    ]
+
+    summary = summarize_search(history, n_folds=4, strategy="halving")
+
+    assert (summary.fits_run, summary.fits_full_grid, summary.fits_saved) == (7, 12, 5)
+    assert summary.as_dict()["fits_saved"] == 5
+
+
+def test_tpe_suggestions_concentrate_near_good_trials() -> None:
+    space = {
+        "changepoint_prior_scale": LogUniform(0.001, 1.0),
+        "seasonality_mode": Categorical(("additive", "multiplicative")),
+        "interval_width": 0.8,
+    }
+    rng = np.random.default_rng(0)
+    observed = [_sample_prior(space, rng) for _ in range(30)]
+    # Loss is minimized at changepoint_prior_scale = 0.05 with multiplicative mode
+    losses = [
+        abs(np.log(config["changepoint_prior_scale"] / 0.05)) + (config["seasonality_mode"] == "additive")
+        for config in observed
+    ]
+
+    suggestions = [_suggest_tpe(space, observed, losses, rng, gamma=0.25, n_candidates=24) for _ in range(20)]
+
+    median_scale = np.median([config["changepoint_prior_scale"] for config in suggestions])
+    assert 0.005 < median_scale < 0.5
+    assert sum(config["seasonality_mode"] == "multiplicative" for config in suggestions) >= 14
+    assert all(config["interval_width"] == 0.8 for config in suggestions)
+    with pytest.raises(ValueError):
+        LogUniform(1.0, 0.5)
+
+
+def _fold_without_crps_for_legacy(df, split, model_config, regressor_columns, seed=None, **kwargs):
+    """Fold stub: the "legacy" config forecasts like a cell restored from an old checkpoint."""
+
+    test = df.iloc[split.test_indices.start : split.test_indices.stop]
+    yhat = test["y"].to_numpy() + model_config["offset"]
+    forecast = pd.DataFrame(
+        {"ds": test["ds"].to_numpy(), "yhat": yhat, "yhat_lower": yhat - 5, "yhat_upper": yhat + 5}
+    )
+    if not model_config["legacy"]:
+        forecast["crps"] = abs(model_config["offset"])
+    forecast["y"] = test["y"].to_numpy()
+    return FoldResult(fold_id=0, split=split, metrics={}, forecast=forecast)
+
+
+def test_searches_skip_configs_without_a_finite_objective(monkeypatch) -> None:
+    monkeypatch.setattr(cross_validation, "run_prophet_fold", _fold_without_crps_for_legacy)
+    df = pd.DataFrame({"ds": pd.date_range("2024-01-01", periods=60, freq="D"), "y": np.linspace(10.0, 20.0, 60)})
+    splits = generate_expanding_window_splits(df, horizon=7, initial_train_size=32, max_folds=4)
+    grid = {"offset": [1.0, 3.0], "legacy": [True, False]}
+
+    best, _, history = grid_search_prophet(df, splits, grid, [], objective="crps")
+    assert np.isnan(history[0]["metrics"]["crps"])  # the first config has no crps and must not win by default
+    assert (best["offset"], best["legacy"]) == (1.0, False)
+
+    best, _, _ = successive_halving_prophet(df, splits, grid, [], objective="crps")
+    assert (best["offset"], best["legacy"]) == (1.0, False)
+
+    with pytest.raises(RuntimeError):
+        grid_search_prophet(df, splits, {"offset": [1.0], "legacy": [True]}, [], objective="crps")
+    with pytest.raises(ValueError):
+        grid_search_prophet(df, splits, grid, [], objective="mape")
+
+
+def _prophet_engine_objectives(df, splits, config) -> dict[str, float]:
+    """Fold-averaged pinball loss and CRPS from ``Prophet.predict``/``predictive_samples``."""
+
+    scores = {"pinball": [], "crps": []}
+    for fold_idx, split in enumerate(splits):
+        train = df.iloc[split.train_indices.start : split.train_indices.stop]
+        test = df.iloc[split.test_indices.start : split.test_indices.stop]
+        model = ProphetDailyModel(**config)
+        model.fit(train)
+        forecast = model.forecast_holdout(test, engine="prophet", seed=fold_idx, quantiles=DEFAULT_QUANTILES, crps=True)
+        metrics = calculate_metrics(
+            test["y"].to_numpy(),
+            forecast["yhat"].to_numpy(),
+            y_quantiles={level: forecast[quantile_column(level)].to_numpy() for level in DEFAULT_QUANTILES},
+        )
+        scores["pinball"].append(metrics["pinball"])
+        scores["crps"].append(forecast["crps"].mean())
+    return {key: float(np.mean(values)) for key, values in scores.items()}
+
+
+def test_probabilistic_objectives_agree_with_prophet_engine_scores() -> None:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2025-01-06", periods=84, freq="D")
+    y = 200 + 0.5 * np.arange(84) + np.where(dates.dayofweek >= 5, -40.0, 25.0) + rng.normal(0, 5, 84)
+    df = pd.DataFrame({"ds": dates, "y": y})
+    splits = generate_expanding_window_splits(df, horizon=14, initial_train_size=56, max_folds=2)
+    grid = {"weekly_seasonality": [False, True], "uncertainty_samples": [400]}
+
+    for objective in ("pinball", "crps"):
+        best, _, history = grid_search_prophet(df, splits, grid, [], objective=objective)
+        reference = [_prophet_engine_objectives(df, splits, entry["config"]) for entry in history]
+
+        # The search ranks configs the way Prophet's own samples would score them
+        assert best["weekly_seasonality"] is True
+        assert min(reference, key=lambda scores: scores[objective]) is reference[1]
+        for entry, scores in zip(history, reference):
+            assert entry["metrics"][objective] == pytest.approx(scores[objective], rel=0.05)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluation.shared_frame import attach_frame, can_share, share_frame
+
+
+def test_shared_frame_round_trips_as_views() -> None:
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2025-01-01", periods=5, freq="D"),
+            "y": np.arange(5, dtype=float),
+            "is_holiday": np.array([0, 0, 1, 1, 0], dtype=np.int64),
+            "dow_0": np.array([False, False, False, False, True]),
+        }
+    )
+
+    with share_frame(df) as handle:
+        assert len(pickle.dumps(handle)) < 1024
+        attached = attach_frame(pickle.loads(pickle.dumps(handle)))
+        pd.testing.assert_frame_equal(attached, df)
+        assert not attached["y"].to_numpy().flags.owndata
+        # A consolidated (copied) column would come back writable
+        assert not any(attached[name].to_numpy().flags.writeable for name in df.columns)
+        with pytest.raises(ValueError):
+            attached["y"].to_numpy()[0] = 1.0
+
+
+def test_object_columns_are_not_shared() -> None:
+    df = pd.DataFrame({"ds": pd.date_range("2025-01-01", periods=2), "label": ["a", "b"]})
+
+    assert not can_share(df)
+    with pytest.raises(ValueError):
+        with share_frame(df):
+            pass
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from champion_prophet.timing import get_recorder, merge_timings, reset_timings, span, timed, timing_breakdown
+
+
+def test_spans_and_decorator_accumulate_and_merge() -> None:
+    reset_timings()
+
+    @timed("unit.work")
+    def work(x: int) -> int:
+        return x * 2
+
+    assert work(2) == 4
+    assert work(3) == 6
+    with span("unit.block"):
+        pass
+
+    breakdown = timing_breakdown()
+    assert breakdown["unit.work"]["count"] == 2
+    assert breakdown["unit.block"]["count"] == 1
+
+    merge_timings({"unit.work": {"count": 3, "total_seconds": 1.0, "max_seconds": 0.5}})
+    merged = get_recorder().snapshot()["unit.work"]
+    assert merged["count"] == 5
+    assert merged["max_seconds"] == 0.5
+    assert next(iter(get_recorder().snapshot())) == "unit.work"  # slowest span first
+    reset_timings()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from evaluation.cross_validation import FoldTask, generate_expanding_window_splits, run_fold_tasks
+from models.prophet_daily import ProphetDailyModel
+from models.warm_start import WarmStartState
+
+
+def _series(n_days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    ds = pd.date_range("2024-01-01", periods=n_days, freq="D")
+    t = np.arange(n_days)
+    # Trend with a kink a third of the way in, plus a weekly cycle
+    trend = 200 + 0.5 * t + 1.5 * np.maximum(t - n_days // 3, 0)
+    weekly = np.where(ds.dayofweek >= 5, -40.0, 10.0)
+    return pd.DataFrame({"ds": ds, "y": trend + weekly + rng.normal(0, 5, n_days)})
+
+
+def test_stan_init_matches_the_new_fold_and_continues_the_trend() -> None:
+    df = _series(210)
+    old_train, new_train = df.iloc[:150], df.iloc[:210]
+
+    old = ProphetDailyModel().fit(old_train).warm_start_state()
+    # Cold fit of the larger window gives the grid and feature count Prophet expects
+    cold = ProphetDailyModel().fit(new_train)
+    init = old.to_stan_init(cold.model, new_train)
+
+    n_changepoints = len(cold.model.changepoints)
+    assert init["delta"].shape == (n_changepoints,) == cold.model.params["delta"].shape[1:]
+    assert init["beta"].shape == cold.model.params["beta"].shape[1:]
+
+    # The init, read on the new fold's scales and grid, reproduces the old trend
+    new = WarmStartState.from_prophet(cold.model)
+    new.k, new.m, new.delta = init["k"], init["m"], init["delta"]
+    start = np.array([new.start], dtype="datetime64[ns]")
+    assert np.allclose(new.trend_level(start), old.trend_level(start))
+    assert np.allclose(new.slope_per_day(new.changepoints), old.slope_per_day(new.changepoints))
+
+    shared = old_train["ds"].to_numpy(dtype="datetime64[ns]")
+    gap = np.abs(new.trend_level(shared) - old.trend_level(shared))
+    assert gap.max() < 0.02 * np.abs(old.trend_level(shared)).max()
+
+
+def test_warm_started_fold_chain_matches_cold_folds() -> None:
+    df = _series(210)
+    splits = generate_expanding_window_splits(df, horizon=14, initial_train_size=154, max_folds=4)
+    tasks = [FoldTask(0, idx, {}, split, seed=idx) for idx, split in enumerate(splits)]
+
+    cold = run_fold_tasks(df, tasks, [], warm_start=False)
+    warm = run_fold_tasks(df, tasks, [], warm_start=True)
+
+    assert [fold.fold_id for fold in warm] == list(range(len(splits)))
+    for cold_fold, warm_fold in zip(cold, warm):
+        assert np.allclose(warm_fold.forecast["yhat"], cold_fold.forecast["yhat"], rtol=1e-2)